@@ -1,8 +1,9 @@
 # importing libraries
-from turboClass import turboBlade
-from turboCoeff import similarity
+from turboClass import designSpace
 from turboCoeff import coeff
 from geometry import bladeGenerator
+from geometry import bladeMesh
+import numpy as np
 import contextlib
 
 # data
@@ -24,11 +25,6 @@ rMean = 0.32
 # rotor inlet tangential velocity
 Vt0Umean = 0
 
-# Vt0 = (1 - rD - lam/4) * Umean -> lam = 4 * (1 - rD - Vt0/Umean) 
-# psi = lam / 2 
-lam = (1 - rD - Vt0Umean) * 4 
-psiTarget = lam / 2
-
 # declaring blades
 # rotor description
 nRotorBlades  = 45
@@ -43,91 +39,13 @@ file_path = 'compressor_' + str(rD) + '_' + str(rMean) + '_' + str(nRotorBlades)
 with open(file_path, "w") as file:
     with contextlib.redirect_stdout(file):
         # generation of mean line properties to be used for the blade assembly 
-        adimVec, bladeVec, rotationVec, V0vec, V1vec, V2vec, W0vec, W1vec, W2vec, thermo0, thermo1, _, work = similarity.stageProperties(rD, psiTarget, rMean, mFlux, Tt0, Pt0, betaP, T1real=True, printout=True, save=True, )
-
-        # values allocation 
-        Leu                = work[0]
-        Lis                = work[1]
-        eta                = adimVec[2]
-        # rotation 
-        omega              = rotationVec[1] * 1.05 # !!! the rotor angular velocity is changed slightly in order to have better rotor outlet velocity distribution
+        mean = designSpace.meanLine(rD, rMean, Vt0Umean, mFlux=mFlux, betaP=betaP, Pt0=Pt0, Tt0=Tt0, omegaFactor=1.05, etaRotor=0.82, printout=True, save=True)
         # blade dimension
-        b0                 = bladeVec[0]
-        hubRadius          = rMean - b0/2
-        # velocity vectors
-        rotorVaMeanInlet   = V0vec[0]
-        rotorVtMeanInlet   = V0vec[1] 
-        rotorVaMeanOutlet  = V1vec[0]
-        rotorVtMeanOutlet = Lis/0.82 / (rMean * omega) + rotorVtMeanInlet # !!! after a previous check the eta computed by similarity.stageProperties doesn't fit the actual efficiency of the stage
-        statorVtMeanOutlet = rotorVtMeanOutlet 
-        statorVtMeanInlet  = V1vec[1]
-        statorVaMeanOutlet = V2vec[0]
-        statorVtMeanOutlet = V2vec[1]
-
-        # computing mixed vortex design parameter
-        WtTarget = 0
-        bVal = (WtTarget + omega * hubRadius - rotorVtMeanOutlet * rMean/hubRadius)/(hubRadius - rMean**2/hubRadius)
-
-        # rotor study 
-        # rotor object generation 
-        print('\n\n-- ROTOR STUDY -- # blades {0:d}'.format(nRotorBlades))
-        rotorBlade = turboBlade.blade(ID=1, turboType='rotor', nSection=nSection, inletBladeHeight=b0, outletBladeHeight=b0, inletHubRadius=hubRadius, outletHubRadius=hubRadius, omega=omega, nBlade=nRotorBlades)
-        # allocate blade shape 
-        rotorBlade.allocateShape(bladeHeight=b0, AR=ARrotor, nBlade=nRotorBlades)
-        # blade dimensions allocation -> kinetics inlet
-        rotorBlade.allocateKinetics(rMean=rMean, VtMean=rotorVtMeanInlet, VaMean=rotorVaMeanInlet, omega=omega, section='inlet', kind='FV')
-        # blade dimensions allocation -> kinetics outlet
-        rotorBlade.allocateKinetics(rMean2=rMean, Vt2=rotorVtMeanOutlet, VaMean=rotorVaMeanOutlet, omega=omega, section='outlet', kind='MVD', b=bVal)
-        # blade dimensions allocation -> thermodynamics inlet/outlet
-        rotorBlade.allocateThermodynamics(Tt0=Tt0, Pt0=Pt0, eta=eta)
-        # rotor blade geometry allocation
-        rotorBlade.generateGeometry(pos='data/airfoils/naca65.txt', STLname='rotor', plot=False, printout=False)
-        # computing the best shape 
-        lossVec = rotorBlade.bladeGenerator(mFlux, clearance=1e-3, NISRE=True, STLname='rotor', plot=False, nMaxShape=1)
-        # plotting meridional flow 
-        rotorBlade.printMeridional(save=True, position0='latex/figures/rotorEntropyFlow.pdf', position1='latex/figures/rotorBetaThermo.pdf')
-        # plotting velocity triangles
-        rotorBlade.velocityTriangles(sectionNumber=[0, int(nSection/2-1), nSection-1], save=True, position='latex/figures/rotorVelocityTriangle.pdf')
-        # computing efficiency
-        rotorBlade.computeBladeEfficiency(Va=rotorVaMeanOutlet, lossVec=lossVec)
-
-        # stator study 
-        # stator object generation
-        print('\n\n-- STATOR STUDY -- # blades {0:d}'.format(nStatorBlades))
-        statorBlade = turboBlade.blade(ID=2, turboType='stator', nSection=nSection, inletBladeHeight=b0, outletBladeHeight=b0, inletHubRadius=hubRadius, outletHubRadius=hubRadius, omega=0, nBlade=nStatorBlades)
-        # allocate blade shape 
-        statorBlade.allocateShape(bladeHeight=b0, AR=ARstator, nBlade=nStatorBlades)
-        # blade dimensions allocation 
-        # copying data from rotor blade outlet into stator blade inlet
-        statorBlade.copySection(blade=rotorBlade, fromSection='outlet', toSection='inlet')
-        statorBlade.copySection(blade=rotorBlade, fromSection='outlet', toSection='outlet')
+        b0        = mean['b0']
+        hubRadius = mean['hubRadius']
 
-        # setting up velocity distribution at the stato outlet
-        VtTarget = 30 # set to this value in order to have convergence of the stator and reduce the stator delta alpha
-        def func(r):
-            '''
-            This is the velocity distribution function.
-                VtTarget sets the hub constraint                | -> a second order function is defined 
-                statorVtMean = 0 sets the mean line constraint  | -> 
-
-            '''
-            a = 4 * VtTarget / b0**2
-            Vtnew = a * (r - rMean)**2
-
-            return Vtnew
-
-        # setting up stator outlet kinematics 
-        statorBlade.allocateKinetics(rMean=rMean, VtMean=statorVtMeanOutlet, VaMean=statorVaMeanOutlet, omega=0, section='outlet', kind='eqn', func=func)
-        # stator blade geometry allocation
-        statorBlade.generateGeometry(pos='data/airfoils/naca65.txt', STLname='stator', plot=False, printout=False)
-        # computing the best shape 
-        lossVec = statorBlade.bladeGenerator(mFlux, clearance=0, NISRE=True, STLname='stator', plot=False, nMaxShape=1, nMaxFlux=100, nMaxS=1)
-        # plotting meridional quantities
-        statorBlade.printMeridional(save=True, position0='latex/figures/statorEntropyFlow.pdf', position1='latex/figures/statorBetaThermo.pdf')
-        # plotting velocity triangle
-        statorBlade.velocityTriangles(sectionNumber=[0, int(nSection/2-1), nSection-1], save=True, position='latex/figures/statorVelocityTriangle.pdf')
-        # computing efficiency
-        statorBlade.computeBladeEfficiency(Va=statorVaMeanOutlet, lossVec=lossVec)
+        # rotor and stator study -> rotor.stl/stator.stl and meridional/velocity triangles figures generation
+        rotorBlade, statorBlade, _, _, _, _ = designSpace.stageBlades(mean, nRotorBlades, nStatorBlades, ARrotor, ARstator, nSection, mFlux=mFlux, Pt0=Pt0, Tt0=Tt0, VtTarget=30, STL=True, figures=True)
 
         # .scad file generation 
         nRotorBlades  = rotorBlade.nBlade
@@ -137,5 +55,16 @@ with open(file_path, "w") as file:
         b1            = b0 
         bladeGenerator.SCADsaving(nRotorBlades, nStatorBlades, rotorHub, statorHub, rMean, b0, b1, rotorPath='../container/rotor.stl', statorPath='../container/stator.stl', geometryPath='geometry/')
 
+        # full annulus assembly .stl generation 
+        # the stator row is placed with the same axial offset used in geometry/compressor.scad
+        statorOffset = 0.2
+        rotorRow     = {'airfoils': rotorBlade.blade, 'nBlade': nRotorBlades, 'origin': [0, 0, hubRadius], 'kind': 'rotor'}
+        statorRow    = {'airfoils': statorBlade.blade, 'nBlade': nStatorBlades, 'origin': [statorOffset, 0, hubRadius], 'kind': 'stator'}
+        xInlet       = np.min(rotorBlade.blade[0].upper[:,0]) - rotorBlade.blade[0].chord
+        xOutlet      = np.max(statorBlade.blade[0].upper[:,0]) + statorOffset + statorBlade.blade[0].chord
+        bladeMesh.assemblySaving([rotorRow, statorRow], name='stage', hub=[xInlet, xOutlet, hubRadius, hubRadius], casing=[xInlet, xOutlet, hubRadius + b0, hubRadius + b1], printout=True)
+        # coarse assembly for previews
+        bladeMesh.previewSaving([rotorRow, statorRow], name='stagePreview', hub=[xInlet, xOutlet, hubRadius, hubRadius], casing=[xInlet, xOutlet, hubRadius + b0, hubRadius + b1], printout=True)
+
         # computing stage efficiency
         coeff.stageEfficiency(rotorBlade, statorBlade)
\ No newline at end of file
@@ -242,7 +242,7 @@ def writeFacet(file, versor, vec1, vec2, vec3):
     file.write('\t\tendloop\n')
     file.write('\tendfacet\n')
 
-def STLsaving(airfoils, STLname='cad', containerPath='container/', kind='rotor'):
+def STLsaving(airfoils, STLname='cad', containerPath='container/', kind='rotor', indexedMesh=None, check=False, lodLevels=()):
     '''
     This function saves the blade in .stl format.
         inputs: 
@@ -250,6 +250,12 @@ def STLsaving(airfoils, STLname='cad', containerPath='container/', kind='rotor')
             STLname     -- .stl file name
             kind        -- rotor/stator => allows computing the correct direction of the versors
             checkVersor -- boolean array value for the plotting/checking of versor
+            indexedMesh -- None/ply/obj => the blade is also saved as indexed mesh (vertex array + face index array) with the same name
+            check       -- boolean value for the mesh check (watertightness, versors orientation, self intersections, bounding box)
+            lodLevels   -- tuple of decimated levels of detail saved as binary .stl in <STLname>_lod<level>.stl
+                        -- lod = 1 -> 1/4 of the triangles, lod = 2 -> 1/16 of the triangles
+        output:
+            report      -- mesh check report (see geometry.meshCheck.checkMesh) -> None if check == False
         !!! it is assumed that each airfoil has the same number of description points !!!
         !!! it is assumed that the each airfoil section element is in sequence with respect the hub !!!
     '''
@@ -498,6 +504,30 @@ def STLsaving(airfoils, STLname='cad', containerPath='container/', kind='rotor')
     # file closure 
     file.close()
 
+    # indexed mesh generation 
+    if indexedMesh is not None:
+        from geometry import bladeMesh
+        bladeMesh.indexedSaving(airfoils, name=STLname, containerPath=containerPath, kind=kind, meshFormat=indexedMesh)
+
+    # decimated meshes generation 
+    if len(lodLevels) > 0:
+        from geometry import bladeMesh
+        for lod in lodLevels:
+            bladeMesh.binarySTLsaving(bladeMesh.bladeTriangles(airfoils, kind, lod), STLname=STLname + '_lod{0:d}'.format(lod), containerPath=containerPath)
+
+    # mesh check 
+    report = None
+    if check:
+        from geometry import bladeMesh
+        from geometry import meshCheck
+        triangles = bladeMesh.bladeTriangles(airfoils, kind)
+        report = meshCheck.checkMesh(triangles, printout=False, name=STLname)
+        # printing the report only for not valid meshes
+        if not report['valid']:
+            meshCheck.printReport(report, name=STLname)
+
+    return report
+
 def SCADsaving(nRotorBlades, nStatorBlades, rotorHub, statorHub, rMean, b0, b1, rotorPath='../container/rotor.stl', statorPath='../container/stator.stl', geometryPath='../geometry/'):
     '''
     This function saves the computed results into .scad file that will use for the visualization of the stage.
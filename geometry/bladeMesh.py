@@ -0,0 +1,567 @@
+# TURBOMACHINERY -- LIBRARY FOR THE BLADE MESH GENERATION
+# AUTHOR: antonio pucciarelli
+#
+# PROGRAM DESCRIPTION
+#   BLADE MESH LIBRARY:
+#       this script converts the blade geometry computed by geometryData objects into triangle meshes
+#           -- the blade triangulation is the same used by bladeGenerator.STLsaving
+#           -- the blade mesh is also available as indexed mesh (vertex array + face index array) in .ply/.obj format
+#           -- the full annulus assembly (rotor + stator rows + hub/casing) is streamed into a single binary .stl/.ply file
+#           -- level of detail (LOD) meshes are computed by structured decimation of the span x chord grid
+#               -- lod = 0 -> full mesh, lod = 1 -> 1/4 of the triangles, lod = 2 -> 1/16 of the triangles
+#
+
+# importing libraries
+import numpy as np
+from functools import lru_cache
+
+# binary .stl facet description -> 50 bytes for each facet
+STLdtype = np.dtype([('normal', '<f4', (3,)), ('vertex', '<f4', (3,3)), ('attribute', '<u2')])
+# binary .ply face description -> # of vertices + vertex indices
+PLYfaceDtype = np.dtype([('n', 'u1'), ('index', '<i4', (3,))])
+
+def lodIndex(nPoints, lod=0):
+    '''
+    This function computes the grid indices kept by the structured decimation.
+        inputs:
+            nPoints     -- # of grid points
+            lod         -- level of detail -> every 2**lod points is kept
+        output:
+            index       -- kept indices -> first and last points are always kept
+    '''
+
+    # decimation step
+    step = 2**lod
+
+    # kept indices
+    index = np.arange(0, nPoints, step)
+    if index[-1] != nPoints - 1:
+        index = np.append(index, nPoints - 1)
+
+    return index
+
+def bladeVertices(airfoils, lod=0):
+    '''
+    This function stacks the airfoils coordinates into a single vertex array.
+        inputs:
+            airfoils    -- tuple of airfoils objects -> geometryData objects with upper, lower and camber coordinates
+            lod         -- level of detail -> 0 full mesh, 1 -> 1/4 of the triangles, 2 -> 1/16 of the triangles
+        output:
+            vertices    -- vertex array [nSpan * 2 * nPoints + 2 * nPoints, 3]
+                        -- for each span section: upper surface points + lower surface points
+                        -- at the end: hub camber line points + tip camber line points
+        !!! it is assumed that each airfoil has the same number of description points !!!
+        !!! it is assumed that the each airfoil section element is in sequence with respect the hub !!!
+    '''
+
+    # decimation indices
+    spanIndex  = lodIndex(len(airfoils), lod)
+    chordIndex = lodIndex(airfoils[0].upper.shape[0], lod)
+
+    # stacking span sections -> [nSpan, nPoints, 3]
+    upper = np.stack([airfoils[ii].upper[chordIndex] for ii in spanIndex])
+    lower = np.stack([airfoils[ii].lower[chordIndex] for ii in spanIndex])
+
+    # surface vertices
+    vertices = np.concatenate((upper, lower), axis=1).reshape(-1, 3)
+
+    # adding hub and tip camber line
+    vertices = np.concatenate((vertices, airfoils[0].camber[chordIndex], airfoils[-1].camber[chordIndex]), axis=0)
+
+    return vertices
+
+@lru_cache(maxsize=None)
+def bladeFaces(nSpan, nPoints, kind='rotor'):
+    '''
+    This function computes the triangle vertex indices of the blade mesh with respect to the bladeVertices layout.
+    The faces depend only on the grid topology -> they are computed once for each (nSpan, nPoints, kind) and then reused.
+        inputs:
+            nSpan       -- # of span sections
+            nPoints     -- # of points that describe each airfoil surface
+            kind        -- rotor/stator => allows computing the correct direction of the versors
+        output:
+            faces       -- triangle vertex indices [nTriangles, 3]
+                        -- the triangle order and the versor direction are the same of bladeGenerator.STLsaving
+    '''
+
+    # index counters
+    jj, ii = np.meshgrid(np.arange(nSpan-1), np.arange(nPoints-1), indexing='ij')
+
+    # vertex indices
+    sectionDim = 2 * nPoints
+    upper0 = jj * sectionDim + ii
+    upper1 = (jj + 1) * sectionDim + ii
+    lower0 = upper0 + nPoints
+    lower1 = upper1 + nPoints
+
+    # upper surface faces -> [nSpan-1, nPoints-1, 2, 3]
+    upperFaces = np.stack((np.stack((upper0, upper0 + 1, upper1), axis=-1),
+                           np.stack((upper0 + 1, upper1 + 1, upper1), axis=-1)), axis=2)
+    # lower surface faces -> [nSpan-1, nPoints-1, 2, 3]
+    lowerFaces = np.stack((np.stack((lower0 + 1, lower0, lower1), axis=-1),
+                           np.stack((lower1, lower1 + 1, lower0 + 1), axis=-1)), axis=2)
+
+    # side surface faces -> for each span position: upper surface and then lower surface
+    sideFaces = np.stack((upperFaces, lowerFaces), axis=1).reshape(-1, 3)
+
+    # closing airfoil faces
+    ii = np.arange(nPoints-2)
+    # hub and tip camber line starting index
+    hubCamber = nSpan * sectionDim
+    tipCamber = hubCamber + nPoints
+    # hub and tip surface starting index
+    hub = 0
+    tip = (nSpan - 1) * sectionDim
+
+    # hub faces
+    hubFaces = np.concatenate((np.stack((hubCamber + ii + 1, hub + ii + 1, hub + ii), axis=-1),
+                               np.stack((hubCamber + ii + 1, hub + nPoints + ii, hub + nPoints + ii + 1), axis=-1),
+                               np.stack((hubCamber + ii + 2, hub + ii + 1, hubCamber + ii + 1), axis=-1),
+                               np.stack((hubCamber + ii + 1, hub + nPoints + ii + 1, hubCamber + ii + 2), axis=-1)), axis=0)
+
+    # tip faces
+    tipFaces = np.concatenate((np.stack((tipCamber + ii + 1, tip + ii, tip + ii + 1), axis=-1),
+                               np.stack((tipCamber + ii + 1, tip + nPoints + ii + 1, tip + nPoints + ii), axis=-1),
+                               np.stack((tipCamber + ii + 1, tip + ii + 1, tipCamber + ii + 2), axis=-1),
+                               np.stack((tipCamber + ii + 2, tip + nPoints + ii + 1, tipCamber + ii + 1), axis=-1)), axis=0)
+
+    # faces assembly
+    faces = np.concatenate((sideFaces, hubFaces, tipFaces), axis=0)
+
+    # the stator versors have the opposite direction
+    if kind == 'stator':
+        faces = faces[:, [0, 2, 1]]
+
+    # the cached array is shared between blades -> read only
+    faces.flags.writeable = False
+
+    return faces
+
+def bladeIndexed(airfoils, kind='rotor', lod=0):
+    '''
+    This function computes the blade indexed mesh.
+        inputs:
+            airfoils    -- tuple of airfoils objects
+            kind        -- rotor/stator => allows computing the correct direction of the versors
+            lod         -- level of detail -> 0 full mesh, 1 -> 1/4 of the triangles, 2 -> 1/16 of the triangles
+        output:
+            vertices    -- vertex array [nVertices, 3]
+            faces       -- triangle vertex indices [nTriangles, 3]
+    '''
+
+    # vertices computation
+    vertices = bladeVertices(airfoils, lod)
+
+    # faces computation -> cached with respect to the grid topology
+    faces = bladeFaces(lodIndex(len(airfoils), lod).shape[0], lodIndex(airfoils[0].upper.shape[0], lod).shape[0], kind)
+
+    return vertices, faces
+
+def bladeTriangles(airfoils, kind='rotor', lod=0):
+    '''
+    This function computes the blade triangle soup.
+        inputs:
+            airfoils    -- tuple of airfoils objects
+            kind        -- rotor/stator => allows computing the correct direction of the versors
+            lod         -- level of detail -> 0 full mesh, 1 -> 1/4 of the triangles, 2 -> 1/16 of the triangles
+        output:
+            triangles   -- triangle vertices [nTriangles, 3, 3]
+    '''
+
+    # indexed mesh computation
+    vertices, faces = bladeIndexed(airfoils, kind, lod)
+
+    return vertices[faces]
+
+def triangleNormals(triangles):
+    '''
+    This function computes the triangle normal versors.
+        inputs:
+            triangles   -- triangle vertices [..., 3, 3]
+        output:
+            normals     -- normal versors [..., 3]
+    '''
+
+    # versor computation
+    normals = np.cross(triangles[..., 1, :] - triangles[..., 0, :], triangles[..., 2, :] - triangles[..., 0, :])
+
+    # vector normalization -> degenerate triangles get a null versor
+    norm = np.linalg.norm(normals, axis=-1, keepdims=True)
+    normals = np.divide(normals, norm, out=np.zeros(normals.shape), where=norm > 0)
+
+    return normals
+
+def rotationMatrix(theta):
+    '''
+    This function computes the rotation matrices around the machine axis (x axis).
+        inputs:
+            theta       -- rotation angles array [rad]
+        output:
+            rotMatrix   -- rotation matrices [theta.shape[0], 3, 3]
+    '''
+
+    # trigonometric values
+    c = np.cos(theta)
+    s = np.sin(theta)
+    z = np.zeros(theta.shape)
+    o = np.ones(theta.shape)
+
+    # rotation matrices
+    # | 1,   0,    0 |
+    # | 0, cos, -sin |
+    # | 0, sin,  cos |
+    rotMatrix = np.stack((np.stack((o, z, z), axis=-1),
+                          np.stack((z, c, -s), axis=-1),
+                          np.stack((z, s, c), axis=-1)), axis=-2)
+
+    return rotMatrix
+
+def annulusMesh(x0, x1, r0, r1, nTheta=360, outward=True):
+    '''
+    This function computes the indexed mesh of an annulus surface (hub or casing) that revolves around the machine axis.
+        inputs:
+            x0          -- annulus surface inlet axial position
+            x1          -- annulus surface outlet axial position
+            r0          -- annulus surface inlet radius
+            r1          -- annulus surface outlet radius
+            nTheta      -- # of tangential subdivisions
+            outward     -- boolean value for the versor direction
+                        -- True  -> versors point outward (hub surface)
+                        -- False -> versors point toward the machine axis (casing surface)
+        output:
+            vertices    -- vertex array [2 * nTheta, 3]
+            faces       -- triangle vertex indices [2 * nTheta, 3]
+    '''
+
+    # tangential discretization
+    theta = 2 * np.pi * np.arange(nTheta) / nTheta
+
+    # annulus rings
+    ring0 = np.stack((x0 * np.ones(theta.shape), - r0 * np.sin(theta), r0 * np.cos(theta)), axis=-1)
+    ring1 = np.stack((x1 * np.ones(theta.shape), - r1 * np.sin(theta), r1 * np.cos(theta)), axis=-1)
+    vertices = np.concatenate((ring0, ring1), axis=0)
+
+    # faces generation
+    ii = np.arange(nTheta)
+    jj = np.mod(ii + 1, nTheta)
+    faces = np.concatenate((np.stack((ii, jj, ii + nTheta), axis=-1),
+                            np.stack((jj, jj + nTheta, ii + nTheta), axis=-1)), axis=0)
+
+    # checking versor direction with respect to the radial direction
+    triangles = vertices[faces]
+    radial = np.mean(triangles, axis=1) * np.array([0, 1, 1])
+    flip = np.sum(triangleNormals(triangles) * radial, axis=-1) < 0
+    if not outward:
+        flip = np.logical_not(flip)
+    faces[flip] = faces[flip][:, [0, 2, 1]]
+
+    return vertices, faces
+
+def annulusTriangles(x0, x1, r0, r1, nTheta=360, outward=True):
+    '''
+    This function computes the triangles of an annulus surface (hub or casing) that revolves around the machine axis.
+        inputs:
+            x0          -- annulus surface inlet axial position
+            x1          -- annulus surface outlet axial position
+            r0          -- annulus surface inlet radius
+            r1          -- annulus surface outlet radius
+            nTheta      -- # of tangential subdivisions
+            outward     -- boolean value for the versor direction
+        output:
+            triangles   -- triangle vertices [2 * nTheta, 3, 3]
+    '''
+
+    # indexed mesh computation
+    vertices, faces = annulusMesh(x0, x1, r0, r1, nTheta, outward)
+
+    return vertices[faces]
+
+def writeBinarySTL(file, triangles, normals=None):
+    '''
+    This function writes triangles into an already opened binary .stl file.
+        inputs:
+            file        -- binary file object
+            triangles   -- triangle vertices [nTriangles, 3, 3]
+            normals     -- triangle normal versors [nTriangles, 3]
+                        -- if None the versors are computed from the triangles
+    '''
+
+    # versor computation
+    if normals is None:
+        normals = triangleNormals(triangles)
+
+    # facet allocation
+    facets = np.zeros(triangles.shape[0], dtype=STLdtype)
+    facets['normal'] = normals
+    facets['vertex'] = triangles
+
+    # writing data
+    file.write(facets.tobytes())
+
+def binarySTLsaving(triangles, STLname='cad', containerPath='container/', header='turboLIB'):
+    '''
+    This function saves a triangle soup in binary .stl format.
+        inputs:
+            triangles       -- triangle vertices [nTriangles, 3, 3]
+            STLname         -- .stl file name
+            containerPath   -- directory where the file is saved
+            header          -- .stl header text -> 80 characters max
+    '''
+
+    with open(containerPath + STLname + '.stl', 'wb') as file:
+        # header + # of facets
+        file.write(header.encode('ascii')[:80].ljust(80, b' '))
+        file.write(np.uint32(triangles.shape[0]).tobytes())
+
+        # facets
+        writeBinarySTL(file, triangles)
+
+def writeBinaryPLYheader(file, nVertices, nFaces):
+    '''
+    This function writes the header of a binary little endian .ply file.
+        inputs:
+            file        -- binary file object
+            nVertices   -- # of vertices
+            nFaces      -- # of triangles
+    '''
+
+    # header definition
+    header = 'ply\n' \
+             'format binary_little_endian 1.0\n' \
+             'comment turboLIB\n' \
+             'element vertex {0:d}\n' \
+             'property float x\n' \
+             'property float y\n' \
+             'property float z\n' \
+             'element face {1:d}\n' \
+             'property list uchar int vertex_indices\n' \
+             'end_header\n'.format(nVertices, nFaces)
+
+    # writing data
+    file.write(header.encode('ascii'))
+
+def writeBinaryPLYfaces(file, faces, offset=0):
+    '''
+    This function writes triangle vertex indices into an already opened binary .ply file.
+        inputs:
+            file        -- binary file object
+            faces       -- triangle vertex indices [nTriangles, 3]
+            offset      -- index of the first vertex of the mesh in the file vertex list
+    '''
+
+    # face allocation
+    data = np.zeros(faces.shape[0], dtype=PLYfaceDtype)
+    data['n']     = 3
+    data['index'] = faces + offset
+
+    # writing data
+    file.write(data.tobytes())
+
+def PLYsaving(vertices, faces, name='cad', containerPath='container/'):
+    '''
+    This function saves an indexed mesh in binary .ply format.
+        inputs:
+            vertices        -- vertex array [nVertices, 3]
+            faces           -- triangle vertex indices [nTriangles, 3]
+            name            -- .ply file name
+            containerPath   -- directory where the file is saved
+    '''
+
+    with open(containerPath + name + '.ply', 'wb') as file:
+        # header
+        writeBinaryPLYheader(file, vertices.shape[0], faces.shape[0])
+        # vertices
+        file.write(vertices.astype('<f4').tobytes())
+        # faces
+        writeBinaryPLYfaces(file, faces)
+
+def OBJsaving(vertices, faces, name='cad', containerPath='container/'):
+    '''
+    This function saves an indexed mesh in .obj format.
+        inputs:
+            vertices        -- vertex array [nVertices, 3]
+            faces           -- triangle vertex indices [nTriangles, 3]
+            name            -- .obj file name
+            containerPath   -- directory where the file is saved
+    '''
+
+    with open(containerPath + name + '.obj', 'w') as file:
+        file.write('# turboLIB\n')
+        # vertices
+        np.savetxt(file, vertices, fmt='v %.6f %.6f %.6f')
+        # faces -> .obj indices start from 1
+        np.savetxt(file, faces + 1, fmt='f %d %d %d')
+
+def indexedSaving(airfoils, name='cad', containerPath='container/', kind='rotor', meshFormat='ply', lod=0):
+    '''
+    This function saves the blade as indexed mesh.
+        inputs:
+            airfoils        -- tuple of airfoils objects
+            name            -- file name
+            containerPath   -- directory where the file is saved
+            kind            -- rotor/stator => allows computing the correct direction of the versors
+            meshFormat      -- ply/obj => file format
+            lod             -- level of detail -> 0 full mesh, 1 -> 1/4 of the triangles, 2 -> 1/16 of the triangles
+    '''
+
+    # indexed mesh computation
+    vertices, faces = bladeIndexed(airfoils, kind, lod)
+
+    # saving data
+    if meshFormat == 'ply':
+        PLYsaving(vertices, faces, name, containerPath)
+    elif meshFormat == 'obj':
+        OBJsaving(vertices, faces, name, containerPath)
+    else:
+        raise ValueError('Wrong mesh format: meshFormat = ply/obj')
+
+def assemblySaving(rows, name='stage', containerPath='container/', hub=None, casing=None, nTheta=360, chunkSize=500000, meshFormat='stl', lod=0, printout=False):
+    '''
+    This function saves the full annulus assembly in binary .stl or binary .ply format.
+    The blades of each row are rotated around the machine axis (x axis) in chunks of blades;
+    each chunk is written into the file as soon as it is computed -> the memory usage depends only on chunkSize.
+        inputs:
+            rows            -- list of blade rows; each row is a dictionary with:
+                                -- 'airfoils' : tuple of airfoils objects -> blade.blade
+                                -- 'nBlade'   : # of blades of the row
+                                -- 'origin'   : translation vector applied to the blade before the rotation -> [x, y, z]
+                                                the z coordinate is the blade hub radius
+                                -- 'kind'     : rotor/stator => allows computing the correct direction of the versors
+                                -- 'lod'      : level of detail of the row blades -> optional, it overrides lod
+            name            -- file name
+            containerPath   -- directory where the file is saved
+            hub             -- hub annulus description [x0, x1, r0, r1] -> None for no hub surface
+            casing          -- casing annulus description [x0, x1, r0, r1] -> None for no casing surface
+            nTheta          -- # of tangential subdivisions of hub and casing surfaces
+            chunkSize       -- maximum # of triangles computed at the same time
+            meshFormat      -- stl/ply => file format
+                                -- stl: triangle soup
+                                -- ply: indexed mesh -> vertices are written first and then faces
+            lod             -- level of detail of the blades -> 0 full mesh, 1 -> 1/4 of the triangles, 2 -> 1/16 of the triangles
+            printout        -- boolean value for the printing of the assembly properties
+        output:
+            nFacets         -- # of triangles written into the file
+    '''
+
+    # checking file format
+    if meshFormat != 'stl' and meshFormat != 'ply':
+        raise ValueError('Wrong mesh format: meshFormat = stl/ply')
+
+    # blade rows mesh -> single blade
+    rowVertices = []
+    rowFaces    = []
+    for row in rows:
+        # blade indexed mesh
+        vertices, faces = bladeIndexed(row['airfoils'], row.get('kind', 'rotor'), row.get('lod', lod))
+        # blade positioning
+        rowVertices.append(vertices + np.array(row.get('origin', [0.0, 0.0, 0.0])))
+        rowFaces.append(faces)
+
+    # annulus mesh
+    annulus = []
+    if hub is not None:
+        annulus.append(annulusMesh(hub[0], hub[1], hub[2], hub[3], nTheta=nTheta, outward=True))
+    if casing is not None:
+        annulus.append(annulusMesh(casing[0], casing[1], casing[2], casing[3], nTheta=nTheta, outward=False))
+
+    # total # of vertices and facets -> needed for the file header
+    nVertices = int(np.sum([row['nBlade'] * vertices.shape[0] for row, vertices in zip(rows, rowVertices)]) + np.sum([mesh[0].shape[0] for mesh in annulus]))
+    nFacets   = int(np.sum([row['nBlade'] * faces.shape[0] for row, faces in zip(rows, rowFaces)]) + np.sum([mesh[1].shape[0] for mesh in annulus]))
+
+    with open(containerPath + name + '.' + meshFormat, 'wb') as file:
+        # header
+        if meshFormat == 'stl':
+            file.write('turboLIB assembly'.encode('ascii').ljust(80, b' '))
+            file.write(np.uint32(nFacets).tobytes())
+        else:
+            writeBinaryPLYheader(file, nVertices, nFacets)
+
+        for row, vertices, faces in zip(rows, rowVertices, rowFaces):
+            # rotation angles
+            theta = 2 * np.pi * np.arange(row['nBlade']) / row['nBlade']
+
+            if meshFormat == 'stl':
+                # blade triangles and versors -> the rotation does not change the versors module
+                triangles = vertices[faces]
+                normals   = triangleNormals(triangles)
+                # # of blades computed at the same time
+                chunkBlades = int(np.max([1, chunkSize // triangles.shape[0]]))
+            else:
+                # # of blades computed at the same time
+                chunkBlades = int(np.max([1, chunkSize // vertices.shape[0]]))
+
+            for ii in range(0, row['nBlade'], chunkBlades):
+                # chunk rotation matrices
+                rotMatrix = rotationMatrix(theta[ii:ii+chunkBlades])
+
+                if meshFormat == 'stl':
+                    # rotating blades
+                    chunkTriangles = np.einsum('bij,tvj->btvi', rotMatrix, triangles).reshape(-1, 3, 3)
+                    chunkNormals   = np.einsum('bij,tj->bti', rotMatrix, normals).reshape(-1, 3)
+                    # writing data
+                    writeBinarySTL(file, chunkTriangles, chunkNormals)
+                else:
+                    # rotating blades
+                    chunkVertices = np.einsum('bij,vj->bvi', rotMatrix, vertices).reshape(-1, 3)
+                    # writing data
+                    file.write(chunkVertices.astype('<f4').tobytes())
+
+        # writing annulus surfaces
+        for vertices, faces in annulus:
+            if meshFormat == 'stl':
+                writeBinarySTL(file, vertices[faces])
+            else:
+                file.write(vertices.astype('<f4').tobytes())
+
+        # writing faces -> .ply only
+        if meshFormat == 'ply':
+            offset = 0
+            for row, vertices, faces in zip(rows, rowVertices, rowFaces):
+                # # of blades computed at the same time
+                chunkBlades = int(np.max([1, chunkSize // faces.shape[0]]))
+                for ii in range(0, row['nBlade'], chunkBlades):
+                    # chunk blade offsets
+                    bladeOffset = offset + vertices.shape[0] * np.arange(ii, np.min([ii + chunkBlades, row['nBlade']]))
+                    # writing data
+                    writeBinaryPLYfaces(file, (faces[np.newaxis,:,:] + bladeOffset[:,np.newaxis,np.newaxis]).reshape(-1, 3))
+                # updating offset
+                offset = offset + row['nBlade'] * vertices.shape[0]
+
+            for vertices, faces in annulus:
+                # writing data
+                writeBinaryPLYfaces(file, faces, offset)
+                # updating offset
+                offset = offset + vertices.shape[0]
+
+    if printout:
+        starDim = 32
+        titleDim = int((starDim - len(' ASSEMBLY MESH '))/2)
+        print('*' * titleDim + ' ASSEMBLY MESH ' + '*' * titleDim)
+        for ii, row in enumerate(rows):
+            print('-- row {0:d}: # blades = {1:>4d} -- # facets = {2:>9d}'.format(ii, row['nBlade'], row['nBlade'] * rowFaces[ii].shape[0]))
+        print('-- # vertices    = {0:>9d}'.format(nVertices))
+        print('-- # facets      = {0:>9d}'.format(nFacets))
+        print('-- file          = {0}'.format(containerPath + name + '.' + meshFormat))
+        print('*' * starDim + '\n')
+
+    return nFacets
+
+def previewSaving(rows, name='stagePreview', containerPath='container/', hub=None, casing=None, nTheta=90, meshFormat='stl', lod=2, printout=False):
+    '''
+    This function saves a light full annulus assembly used for previews and design reviews.
+    It is the same of assemblySaving with the coarse blade mesh (lod = 2 -> 1/16 of the triangles) and a coarse annulus as default.
+        inputs:
+            rows            -- list of blade rows (see assemblySaving)
+            name            -- file name
+            containerPath   -- directory where the file is saved
+            hub             -- hub annulus description [x0, x1, r0, r1] -> None for no hub surface
+            casing          -- casing annulus description [x0, x1, r0, r1] -> None for no casing surface
+            nTheta          -- # of tangential subdivisions of hub and casing surfaces
+            meshFormat      -- stl/ply => file format
+            lod             -- level of detail of the blades
+            printout        -- boolean value for the printing of the assembly properties
+        output:
+            nFacets         -- # of triangles written into the file
+    '''
+
+    return assemblySaving(rows, name=name, containerPath=containerPath, hub=hub, casing=casing, nTheta=nTheta, meshFormat=meshFormat, lod=lod, printout=printout)
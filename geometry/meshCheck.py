@@ -0,0 +1,288 @@
+# TURBOMACHINERY -- LIBRARY FOR THE BLADE MESH CHECK
+# AUTHOR: antonio pucciarelli
+#
+# PROGRAM DESCRIPTION
+#   MESH CHECK LIBRARY:
+#       this script checks the triangle meshes generated by bladeGenerator/bladeMesh
+#           -- edge manifoldness (watertightness) through sorted edge pairs count
+#           -- normal orientation through directed edges count and signed volume
+#           -- degenerate triangles and bounding box sanity
+#           -- self intersections: uniform grid broad phase on the triangle bounding boxes, 
+#              then edge vs triangle crossing test on the candidate pairs that do not share vertices
+#
+
+# importing libraries
+import numpy as np
+
+def weldVertices(triangles, tol=1e-9):
+    '''
+    This function computes the vertex indices of a triangle soup merging the vertices that have the same coordinates.
+        inputs:
+            triangles   -- triangle vertices [nTriangles, 3, 3]
+            tol         -- merging tolerance [m]
+        output:
+            vertices    -- unique vertices [nVertices, 3]
+            faces       -- triangle vertex indices [nTriangles, 3]
+    '''
+
+    # coordinates quantization
+    keys = np.round(triangles.reshape(-1, 3) / tol).astype(np.int64)
+
+    # unique vertices
+    _, index, faces = np.unique(keys, axis=0, return_index=True, return_inverse=True)
+    vertices = triangles.reshape(-1, 3)[index]
+
+    return vertices, faces.reshape(-1, 3)
+
+def edgeCount(faces):
+    '''
+    This function counts how many times each edge is used by the mesh triangles.
+        inputs:
+            faces       -- triangle vertex indices [nTriangles, 3]
+        output:
+            edgeCounts  -- # of triangles for each undirected edge
+            dirCounts   -- # of triangles for each directed edge
+    '''
+
+    # directed edges -> [3 * nTriangles, 2]
+    edges = np.concatenate((faces[:, [0, 1]], faces[:, [1, 2]], faces[:, [2, 0]]), axis=0)
+
+    # undirected edges -> sorted edge pairs
+    _, edgeCounts = np.unique(np.sort(edges, axis=1), axis=0, return_counts=True)
+
+    # directed edges
+    _, dirCounts = np.unique(edges, axis=0, return_counts=True)
+
+    return edgeCounts, dirCounts
+
+def signedVolume(triangles):
+    '''
+    This function computes the signed volume enclosed by a closed triangle mesh.
+        inputs:
+            triangles   -- triangle vertices [nTriangles, 3, 3]
+        output:
+            volume      -- signed volume -> positive with outward versors
+    '''
+
+    # divergence theorem: sum of the tetrahedra made by each triangle and the origin
+    volume = np.sum(np.einsum('ij,ij->i', triangles[:, 0, :], np.cross(triangles[:, 1, :], triangles[:, 2, :]))) / 6
+
+    return volume
+
+def candidatePairs(triangles, faces, tol=1e-9):
+    '''
+    This function computes the triangle pairs that can intersect (broad phase).
+        -- the triangles are binned in a uniform grid with the cell size of the median triangle extension
+        -- the pairs in the same cell with overlapping bounding boxes and without common vertices are kept 
+
+        inputs:
+            triangles   -- triangle vertices [nTriangles, 3, 3]
+            faces       -- triangle vertex indices [nTriangles, 3] (see weldVertices)
+            tol         -- bounding box tolerance [m]
+        output:
+            pairs       -- candidate triangle pairs [nPairs, 2]
+    '''
+
+    # triangle bounding boxes
+    boxMin = np.min(triangles, axis=1) - tol
+    boxMax = np.max(triangles, axis=1) + tol
+
+    # grid cell size
+    cellSize = max(float(np.median(np.max(boxMax - boxMin, axis=1))), tol)
+
+    # cells covered by each triangle 
+    cellMin = np.floor((boxMin - np.min(boxMin, axis=0)) / cellSize).astype(np.int64)
+    cellMax = np.floor((boxMax - np.min(boxMin, axis=0)) / cellSize).astype(np.int64)
+    nCells  = cellMax - cellMin + 1
+    nCover  = np.prod(nCells, axis=1)
+
+    # (triangle, cell) allocation 
+    tri   = np.repeat(np.arange(triangles.shape[0]), nCover)
+    local = np.arange(tri.shape[0]) - np.repeat(np.cumsum(nCover) - nCover, nCover)
+    cx    = cellMin[tri,0] + local % nCells[tri,0]
+    cy    = cellMin[tri,1] + (local // nCells[tri,0]) % nCells[tri,1]
+    cz    = cellMin[tri,2] + local // (nCells[tri,0] * nCells[tri,1])
+    dims  = np.max(cellMax, axis=0) + 1
+    cell  = (cz * dims[1] + cy) * dims[0] + cx
+
+    # triangles sorted by cell 
+    order = np.argsort(cell, kind='stable')
+    cell  = cell[order]
+    tri   = tri[order]
+
+    # pairs in the same cell -> each element is paired with the next ones of its cell 
+    _, start, count = np.unique(cell, return_index=True, return_counts=True)
+    end   = np.repeat(start + count, count)
+    nNext = end - np.arange(cell.shape[0]) - 1
+    first = np.repeat(np.arange(cell.shape[0]), nNext)
+    second = first + 1 + np.arange(first.shape[0]) - np.repeat(np.cumsum(nNext) - nNext, nNext)
+    nTriangles = np.int64(triangles.shape[0])
+    key   = np.minimum(tri[first], tri[second]) * nTriangles + np.maximum(tri[first], tri[second])
+    key   = np.unique(key[tri[first] != tri[second]])
+    pairs = np.stack((key // nTriangles, key % nTriangles), axis=1)
+
+    # bounding boxes overlap
+    overlap = np.all((boxMin[pairs[:,0]] <= boxMax[pairs[:,1]]) & (boxMin[pairs[:,1]] <= boxMax[pairs[:,0]]), axis=1)
+    pairs = pairs[overlap]
+
+    # adjacent triangles -> common vertices
+    common = np.any(faces[pairs[:,0]][:,:,np.newaxis] == faces[pairs[:,1]][:,np.newaxis,:], axis=(1,2))
+
+    return pairs[np.logical_not(common)]
+
+def edgeCrossing(p0, p1, triangles, tol=1e-9):
+    '''
+    This function checks if the segments p0 -> p1 cross the triangles (Moller-Trumbore test).
+        inputs:
+            p0          -- segment start points [n, 3]
+            p1          -- segment end points [n, 3]
+            triangles   -- triangle vertices [n, 3, 3]
+            tol         -- tolerance -> the segments that only touch the triangles are not counted
+        output:
+            crossing    -- boolean array [n]
+    '''
+
+    # triangle edges 
+    e1 = triangles[:,1,:] - triangles[:,0,:]
+    e2 = triangles[:,2,:] - triangles[:,0,:]
+
+    # segment direction 
+    d = p1 - p0
+    h = np.cross(d, e2)
+    a = np.einsum('ij,ij->i', e1, h)
+
+    # parallel segments are not counted 
+    parallel = np.abs(a) <= tol**2
+    a = np.where(parallel, 1.0, a)
+
+    # barycentric coordinates and segment parameter 
+    t0 = p0 - triangles[:,0,:]
+    u  = np.einsum('ij,ij->i', t0, h) / a
+    q  = np.cross(t0, e1)
+    v  = np.einsum('ij,ij->i', d, q) / a
+    t  = np.einsum('ij,ij->i', e2, q) / a
+
+    # strict crossing -> inside the triangle and inside the segment
+    eps = 1e-9
+    crossing = (u > eps) & (v > eps) & (u + v < 1 - eps) & (t > eps) & (t < 1 - eps)
+
+    return crossing & np.logical_not(parallel)
+
+def selfIntersections(triangles, faces, tol=1e-9):
+    '''
+    This function counts the triangle pairs that intersect each other.
+        -- the pairs with common vertices and the coplanar overlaps are not counted
+
+        inputs:
+            triangles   -- triangle vertices [nTriangles, 3, 3]
+            faces       -- triangle vertex indices [nTriangles, 3] (see weldVertices)
+            tol         -- tolerance [m]
+        output:
+            nIntersections  -- # of intersecting triangle pairs
+    '''
+
+    # broad phase 
+    pairs = candidatePairs(triangles, faces, tol)
+    if pairs.shape[0] == 0:
+        return 0
+
+    A = triangles[pairs[:,0]]
+    B = triangles[pairs[:,1]]
+
+    # narrow phase -> an edge of a triangle crosses the other triangle 
+    intersecting = np.zeros(pairs.shape[0], dtype=bool)
+    for ii in range(3):
+        jj = (ii + 1) % 3
+        intersecting = intersecting | edgeCrossing(A[:,ii,:], A[:,jj,:], B, tol) | edgeCrossing(B[:,ii,:], B[:,jj,:], A, tol)
+
+    return int(np.sum(intersecting))
+
+def printReport(report, name='mesh'):
+    '''
+    This function prints the mesh check report (see checkMesh).
+    '''
+
+    starDim = 40
+    titleDim = int((starDim - len(' MESH CHECK ') - len(name) - 1)/2)
+    print('*' * titleDim + ' MESH CHECK ' + name + ' ' + '*' * titleDim)
+    print('-- # triangles      = {0:>9d}'.format(report['nTriangles']))
+    print('-- # vertices       = {0:>9d}'.format(report['nVertices']))
+    print('-- boundary edges   = {0:>9d}'.format(report['boundary']))
+    print('-- non manifold     = {0:>9d}'.format(report['nonManifold']))
+    print('-- flipped edges    = {0:>9d}'.format(report['flipped']))
+    print('-- degenerate       = {0:>9d}'.format(report['degenerate']))
+    if report['intersections'] is not None:
+        print('-- intersections    = {0:>9d}'.format(report['intersections']))
+    print('-- volume           = {0:>9.3e} m3'.format(report['volume']))
+    print('-- bounding box     = [{0:.3f}, {1:.3f}, {2:.3f}] -- [{3:.3f}, {4:.3f}, {5:.3f}] m'.format(*report['bbox'].flatten()))
+    print('-- valid            = {0}'.format(report['valid']))
+    print('*' * (2 * titleDim + len(' MESH CHECK ') + len(name) + 1) + '\n')
+
+def checkMesh(triangles, tol=1e-9, bounds=None, printout=False, name='mesh', intersections=True):
+    '''
+    This function checks a triangle mesh.
+        inputs:
+            triangles   -- triangle vertices [nTriangles, 3, 3]
+            tol         -- vertices merging tolerance [m]
+            bounds      -- expected bounding box [[xMin, yMin, zMin], [xMax, yMax, zMax]] -> None for no check
+            printout    -- boolean value for the printing of the mesh check
+            name        -- mesh name used in the printout
+            intersections   -- boolean value for the self intersections check
+        output:
+            report      -- dictionary with the check results:
+                            -- 'valid'      : the mesh passes all the checks
+                            -- 'boundary'   : # of edges used by only 1 triangle
+                            -- 'nonManifold': # of edges used by more than 2 triangles
+                            -- 'flipped'    : # of directed edges used by more than 1 triangle -> inconsistent versors
+                            -- 'degenerate' : # of triangles with null area
+                            -- 'intersections' : # of intersecting triangle pairs -> None if intersections == False
+                            -- 'volume'     : signed volume -> positive with outward versors
+                            -- 'bbox'       : mesh bounding box [[xMin, yMin, zMin], [xMax, yMax, zMax]]
+                            -- 'bboxValid'  : bounding box sanity -> finite coordinates, not null extension and inside bounds
+    '''
+
+    # vertices merging
+    vertices, faces = weldVertices(triangles, tol)
+
+    # degenerate triangles: null area or collapsed vertices
+    area = np.linalg.norm(np.cross(triangles[:, 1, :] - triangles[:, 0, :], triangles[:, 2, :] - triangles[:, 0, :]), axis=1) / 2
+    collapsed = (faces[:, 0] == faces[:, 1]) | (faces[:, 1] == faces[:, 2]) | (faces[:, 2] == faces[:, 0])
+    degenerate = (area <= tol**2) | collapsed
+
+    # edge manifoldness and versor consistency -> only not degenerate triangles
+    edgeCounts, dirCounts = edgeCount(faces[np.logical_not(degenerate)])
+    boundary    = int(np.sum(edgeCounts == 1))
+    nonManifold = int(np.sum(edgeCounts > 2))
+    flipped     = int(np.sum(dirCounts > 1))
+
+    # signed volume
+    volume = float(signedVolume(triangles))
+
+    # self intersections -> only not degenerate triangles
+    nIntersections = None
+    if intersections:
+        nIntersections = selfIntersections(triangles[np.logical_not(degenerate)], faces[np.logical_not(degenerate)], tol)
+
+    # bounding box sanity
+    bbox = np.array([np.min(vertices, axis=0), np.max(vertices, axis=0)])
+    bboxValid = bool(np.all(np.isfinite(bbox)) and np.all(bbox[1] - bbox[0] > 0))
+    if bounds is not None:
+        bboxValid = bboxValid and bool(np.all(bbox[0] >= np.array(bounds[0]) - tol) and np.all(bbox[1] <= np.array(bounds[1]) + tol))
+
+    # report generation
+    report = {'valid'      : bool(boundary == 0 and nonManifold == 0 and flipped == 0 and volume > 0 and bboxValid and not nIntersections),
+              'nTriangles' : int(triangles.shape[0]),
+              'nVertices'  : int(vertices.shape[0]),
+              'boundary'   : boundary,
+              'nonManifold': nonManifold,
+              'flipped'    : flipped,
+              'degenerate' : int(np.sum(degenerate)),
+              'intersections' : nIntersections,
+              'volume'     : volume,
+              'bbox'       : bbox,
+              'bboxValid'  : bboxValid}
+
+    if printout:
+        printReport(report, name)
+
+    return report
@@ -0,0 +1,227 @@
+# TURBOMACHINERY -- LIBRARY FOR THE BLADE MESH COMPARISON
+# AUTHOR: antonio pucciarelli
+#
+# PROGRAM DESCRIPTION
+#   MESH DIFF LIBRARY:
+#       this script reads .stl files (binary and ASCII) and compares blade geometries of different design revisions
+#           -- same grid topology: vectorized point to point distances
+#           -- different grid topology: nearest point distances through KD-tree
+#           -- the deviation is reported for each span strip of the blade (+ hub and tip surfaces)
+#
+
+# importing libraries
+import os
+import numpy as np
+
+def STLreading(file):
+    '''
+    This function reads a .stl file (binary or ASCII).
+        inputs:
+            file        -- .stl file path
+        output:
+            triangles   -- triangle vertices [nTriangles, 3, 3]
+            normals     -- triangle normal versors [nTriangles, 3]
+    '''
+
+    # importing libraries
+    from geometry import bladeMesh
+
+    # file dimension
+    fileSize = os.path.getsize(file)
+
+    # binary file check: header + # of facets + 50 bytes for each facet
+    with open(file, 'rb') as stream:
+        header = stream.read(84)
+    binary = False
+    if len(header) == 84:
+        nFacets = int(np.frombuffer(header[80:84], dtype='<u4')[0])
+        binary  = fileSize == 84 + 50 * nFacets
+
+    if binary:
+        # binary data reading
+        data = np.fromfile(file, dtype=bladeMesh.STLdtype, count=nFacets, offset=84)
+        triangles = data['vertex'].astype(float)
+        normals   = data['normal'].astype(float)
+    else:
+        # ASCII data reading
+        with open(file, 'r') as stream:
+            tokens = np.array(stream.read().split())
+        # vertex coordinates
+        index     = np.flatnonzero(tokens == 'vertex')
+        triangles = tokens[index[:,np.newaxis] + np.arange(1,4)].astype(float).reshape(-1, 3, 3)
+        # normal versors
+        index     = np.flatnonzero(tokens == 'normal')
+        normals   = tokens[index[:,np.newaxis] + np.arange(1,4)].astype(float)
+
+    return triangles, normals
+
+def planarity(points):
+    '''
+    This function computes the distance of a set of points from their best fitting plane.
+        inputs:
+            points      -- points array [nPoints, 3]
+        output:
+            distance    -- maximum distance from the plane relative to the points dimension
+    '''
+
+    # centering points
+    points = points - np.mean(points, axis=0)
+
+    # singular values -> the last one refers to the plane normal direction
+    sigma = np.linalg.svd(points, compute_uv=False)
+
+    return sigma[-1] / sigma[0]
+
+def gridSize(triangles, tol=1e-6):
+    '''
+    This function computes the # of span sections and the # of airfoil points of a blade triangle mesh generated by
+    bladeGenerator.STLsaving/bladeMesh.bladeTriangles.
+        # of triangles = 4 * (nSpan - 1) * (nPoints - 1) + 8 * (nPoints - 2)
+    Since different (nSpan, nPoints) couples can give the same # of triangles, the chosen one is the one that has
+    planar hub and tip surfaces placed on different planes.
+        inputs:
+            triangles   -- triangle vertices [nTriangles, 3, 3]
+            tol         -- planarity tolerance
+        output:
+            nSpan       -- # of span sections
+            nPoints     -- # of points that describe each airfoil surface
+    '''
+
+    # # of triangles
+    nTriangles = triangles.shape[0]
+
+    for nPoints in range(3, int(nTriangles / 8) + 3):
+        # side surface triangles
+        nSide = nTriangles - 8 * (nPoints - 2)
+        if nSide <= 0 or np.mod(nSide, 4 * (nPoints - 1)) != 0:
+            continue
+        nSpan = int(nSide / (4 * (nPoints - 1))) + 1
+
+        # hub and tip surface triangles
+        hub = triangles[nSide:nSide + 4 * (nPoints - 2)].reshape(-1, 3)
+        tip = triangles[nSide + 4 * (nPoints - 2):].reshape(-1, 3)
+
+        # hub and tip surfaces have to be planar and they do not have to lay on the same plane
+        if planarity(hub) < tol and planarity(tip) < tol and planarity(np.concatenate((hub, tip), axis=0)) > tol:
+            return nSpan, nPoints
+
+    raise ValueError('The triangle mesh does not have the bladeGenerator.STLsaving structure.')
+
+def sectionGroups(nSpan, nPoints):
+    '''
+    This function computes the span strip of each triangle of a blade mesh.
+        inputs:
+            nSpan       -- # of span sections
+            nPoints     -- # of points that describe each airfoil surface
+        output:
+            groups      -- triangle group index [nTriangles]
+                            -- 0, ..., nSpan-2 : side surface strip between span section jj and jj+1
+                            -- nSpan-1         : hub surface
+                            -- nSpan           : tip surface
+    '''
+
+    # side surface strips
+    groups = np.repeat(np.arange(nSpan-1), 4 * (nPoints - 1))
+
+    # hub and tip surfaces
+    groups = np.concatenate((groups, (nSpan - 1) * np.ones(4 * (nPoints - 2), dtype=int), nSpan * np.ones(4 * (nPoints - 2), dtype=int)))
+
+    return groups
+
+def meshInput(mesh, kind='rotor'):
+    '''
+    This function converts the diff inputs into a triangle array.
+        inputs:
+            mesh        -- .stl file path or triangle vertices [nTriangles, 3, 3] or tuple of airfoils objects (blade.blade)
+            kind        -- rotor/stator => used only for tuple of airfoils objects
+        output:
+            triangles   -- triangle vertices [nTriangles, 3, 3]
+    '''
+
+    # importing libraries
+    from geometry import bladeMesh
+
+    if isinstance(mesh, str):
+        triangles, _ = STLreading(mesh)
+    elif isinstance(mesh, np.ndarray):
+        triangles = mesh
+    else:
+        triangles = bladeMesh.bladeTriangles(mesh, kind)
+
+    return triangles
+
+def bladeDiff(mesh1, mesh2, kind='rotor', printout=False):
+    '''
+    This function computes the surface deviation between two blade meshes for each span strip.
+        inputs:
+            mesh1       -- reference blade -> .stl file path or triangle vertices or tuple of airfoils objects
+            mesh2       -- compared blade  -> .stl file path or triangle vertices or tuple of airfoils objects
+            kind        -- rotor/stator => used only for tuple of airfoils objects
+            printout    -- boolean value for the printing of the deviation
+        output:
+            report      -- dictionary with the comparison results:
+                            -- 'method' : grid   -> same topology (same nSpan and nPoints), point to point distances
+                                          kdtree -> different topology, distance from the nearest mesh1 vertex
+                            -- 'max'    : maximum deviation for each group of mesh2 [nSpan+1] -> span strips + hub + tip
+                            -- 'rms'    : RMS deviation for each group of mesh2 [nSpan+1]
+                            -- 'maxAll' : maximum deviation
+                            -- 'rmsAll' : RMS deviation
+    '''
+
+    # triangles allocation
+    triangles1 = meshInput(mesh1, kind)
+    triangles2 = meshInput(mesh2, kind)
+
+    # grid dimensions and triangle groups of the compared blade
+    nSpan, nPoints = gridSize(triangles2)
+    groups = sectionGroups(nSpan, nPoints)
+
+    # same topology -> the same # of triangles can be given by different grids (see gridSize)
+    sameGrid = triangles1.shape == triangles2.shape and gridSize(triangles1) == (nSpan, nPoints)
+
+    if sameGrid:
+        # same topology -> point to point distances [nTriangles, 3]
+        method   = 'grid'
+        distance = np.linalg.norm(triangles2 - triangles1, axis=-1)
+    else:
+        # different topology -> distance from the nearest reference vertex
+        from scipy.spatial import cKDTree
+        from geometry import meshCheck
+        method = 'kdtree'
+        # reference vertices without duplicates
+        vertices, _ = meshCheck.weldVertices(triangles1)
+        # nearest point distances [nTriangles, 3]
+        distance, _ = cKDTree(vertices).query(triangles2.reshape(-1, 3))
+        distance = distance.reshape(-1, 3)
+
+    # group statistics
+    nGroups = nSpan + 1
+    count   = np.bincount(groups, minlength=nGroups) * 3
+    maxDev  = np.zeros(nGroups)
+    np.maximum.at(maxDev, groups, np.max(distance, axis=1))
+    rmsDev  = np.sqrt(np.bincount(groups, weights=np.sum(distance**2, axis=1), minlength=nGroups) / count)
+
+    # report generation
+    report = {'method': method,
+              'max'   : maxDev,
+              'rms'   : rmsDev,
+              'maxAll': np.max(distance),
+              'rmsAll': np.sqrt(np.mean(distance**2))}
+
+    if printout:
+        starDim = 40
+        titleDim = int((starDim - len(' BLADE DIFF '))/2)
+        print('*' * titleDim + ' BLADE DIFF ' + '*' * titleDim)
+        print('-- method = {0}'.format(method))
+        for ii in range(nGroups):
+            if ii < nSpan - 1:
+                name = 'strip {0:>3d}'.format(ii)
+            elif ii == nSpan - 1:
+                name = 'hub      '
+            else:
+                name = 'tip      '
+            print('-- {0}: max = {1:>9.3e} m -- rms = {2:>9.3e} m'.format(name, maxDev[ii], rmsDev[ii]))
+        print('-- all      : max = {0:>9.3e} m -- rms = {1:>9.3e} m'.format(report['maxAll'], report['rmsAll']))
+        print('*' * starDim + '\n')
+
+    return report
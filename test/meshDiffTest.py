@@ -0,0 +1,55 @@
+import numpy as np
+from types import SimpleNamespace
+from geometry import bladeMesh
+from geometry import meshDiff
+
+# blade description
+chord  = 0.05   # airfoil chord       [m]
+height = 0.10   # blade height        [m]
+twist  = 30     # hub to tip twist    [deg]
+
+def bladeAirfoils(nSpan, nPoints):
+    '''
+    This function generates the airfoils of a twisted blade with a parabolic thickness distribution.
+        inputs:
+            nSpan       -- # of span sections
+            nPoints     -- # of points that describe each airfoil surface
+        output:
+            airfoils    -- list of airfoils objects (upper, lower and camber coordinates)
+    '''
+
+    # chord and span discretization
+    x = np.linspace(0, chord, nPoints)
+    z = np.linspace(0, height, nSpan)
+    thickness = 0.4 * x * (chord - x) / chord
+
+    airfoils = []
+    for zz in z:
+        # section rotation around the middle chord
+        theta = np.deg2rad(twist * zz / height)
+        def rotate(y):
+            return np.stack(((x - chord/2) * np.cos(theta) - y * np.sin(theta), (x - chord/2) * np.sin(theta) + y * np.cos(theta), zz * np.ones(nPoints)), axis=-1)
+
+        airfoils.append(SimpleNamespace(upper=rotate(thickness), lower=rotate(-thickness), camber=rotate(np.zeros(nPoints))))
+
+    return airfoils
+
+# same # of triangles with different grids -> 4 * (nSpan - 1) * (nPoints - 1) + 8 * (nPoints - 2) = 5192
+triangles1 = bladeMesh.bladeTriangles(bladeAirfoils(51, 26))
+triangles2 = bladeMesh.bladeTriangles(bladeAirfoils(99, 14))
+assert triangles1.shape == triangles2.shape
+assert meshDiff.gridSize(triangles1) == (51, 26)
+assert meshDiff.gridSize(triangles2) == (99, 14)
+
+# different grids -> nearest point distances
+report = meshDiff.bladeDiff(triangles1, triangles2, printout=False)
+print('-- different grids: method = {0} -- max = {1:.3e} m -- rms = {2:.3e} m'.format(report['method'], report['maxAll'], report['rmsAll']))
+assert report['method'] == 'kdtree'
+# same blade -> the distance from the nearest reference vertex is bounded by half the diagonal of the reference grid cell
+assert report['maxAll'] < 0.5 * np.hypot(chord / 25, height / 50)
+
+# same grid -> point to point distances
+report = meshDiff.bladeDiff(triangles1, triangles1.copy(), printout=False)
+print('-- same grid:       method = {0} -- max = {1:.3e} m'.format(report['method'], report['maxAll']))
+assert report['method'] == 'grid'
+assert report['maxAll'] == 0
@@ -0,0 +1,211 @@
+# TURBOMACHINERY -- LIBRARY FOR THE THERMODYNAMIC STATE OF THE FLOW
+# AUTHOR: antonio pucciarelli
+#
+# PROGRAM DESCRIPTION
+#   THERMODYNAMIC STATE: array container of the static/total/relative quantities of the flow
+#       -- the given quantities are stored as arrays (or floats)
+#       -- the derived quantities are computed only when they are used and then stored
+#       -- the gas model computes the gas relations -> perfectGas, gasTable.tabulatedGas or any object with the same methods
+#
+#   FLUID: air
+#
+
+# importing libraries
+import numpy as np
+
+class perfectGas:
+    '''
+    Perfect gas model with constant specific heats.
+    '''
+
+    def __init__(self, R=287.06, gamma=1.4, cP=None):
+        '''
+        Gas object declaration:
+            variables:
+                R       -- gas constant
+                gamma   -- specific heat ratio
+                cP      -- specific heat @ constant pressure -> None: gamma / (gamma - 1) * R
+        '''
+
+        self.R     = R
+        self.gamma = gamma
+        if cP is None:
+            self.cP = gamma / (gamma - 1) * R
+        else:
+            self.cP = cP
+        # minimum temperature of the model
+        self.Tmin  = 0.0
+        # gas model key -> cache keys (see turboCoeff.similarity.stageCache)
+        self.key   = ('perfect', R, gamma, self.cP)
+
+    def temperatureChange(self, T, deltaH):
+        '''
+        This function computes the temperature after an enthalpy change.
+            inputs:
+                T       -- initial temperature
+                deltaH  -- enthalpy change
+        '''
+
+        return T + deltaH / self.cP
+
+    def staticTemperature(self, Tt, V):
+        '''
+        This function computes the static temperature: Tt = T + V**2 / (2 * cP).
+        '''
+
+        return self.temperatureChange(Tt, - V**2 / 2)
+
+    def totalTemperature(self, T, V):
+        '''
+        This function computes the total temperature: Tt = T + V**2 / (2 * cP).
+        '''
+
+        return self.temperatureChange(T, V**2 / 2)
+
+    def enthalpyChange(self, T0, T1):
+        '''
+        This function computes the enthalpy change between two temperatures.
+        '''
+
+        return self.cP * (T1 - T0)
+
+    def velocity(self, Tt, T):
+        '''
+        This function computes the velocity from the total and static temperatures.
+        '''
+
+        return np.sqrt(2 * self.cP * (Tt - T))
+
+    def isentropicTemperature(self, T0, ratio):
+        '''
+        This function computes the final temperature of an isentropic transformation: T1 / T0 = (P1 / P0)**((gamma-1)/gamma).
+            inputs:
+                T0      -- initial temperature
+                ratio   -- pressure ratio P1 / P0
+        '''
+
+        return T0 * ratio**((self.gamma-1)/self.gamma)
+
+    def isentropicPressure(self, P0, T0, T1):
+        '''
+        This function computes the pressure of an isentropic transformation: P1 / P0 = (T1 / T0)**(gamma/(gamma-1)).
+            inputs:
+                P0      -- initial pressure
+                T0      -- initial temperature
+                T1      -- final temperature
+        '''
+
+        return P0 * (T1/T0)**(self.gamma/(self.gamma-1))
+
+    def density(self, P, T):
+        '''
+        This function computes the density: P = rho * R * T.
+        '''
+
+        return P / (self.R * T)
+
+    def soundSpeed(self, T):
+        '''
+        This function computes the speed of sound.
+        '''
+
+        return np.sqrt(self.gamma * self.R * T)
+
+# derived quantities rules -> {name: [(inputs, function(gas, *inputs)), ...]}, the first rule with all the inputs available is used
+flowRules = {'T'    : [(('Tt', 'V'),         lambda gas, Tt, V: gas.staticTemperature(Tt, V))],
+             'Tt'   : [(('T', 'V'),          lambda gas, T, V: gas.totalTemperature(T, V))],
+             'P'    : [(('Pt', 'Tt', 'T'),   lambda gas, Pt, Tt, T: gas.isentropicPressure(Pt, Tt, T))],
+             'Pt'   : [(('P', 'T', 'Tt'),    lambda gas, P, T, Tt: gas.isentropicPressure(P, T, Tt)),
+                       (('Ptr', 'Ttr', 'Tt'), lambda gas, Ptr, Ttr, Tt: gas.isentropicPressure(Ptr, Ttr, Tt))],
+             'Ttr'  : [(('T', 'W'),          lambda gas, T, W: gas.totalTemperature(T, W))],
+             'Ptr'  : [(('Pt', 'Tt', 'Ttr'), lambda gas, Pt, Tt, Ttr: gas.isentropicPressure(Pt, Tt, Ttr))],
+             'rho'  : [(('P', 'T'),          lambda gas, P, T: gas.density(P, T))],
+             'rhot' : [(('Pt', 'Tt'),        lambda gas, Pt, Tt: gas.density(Pt, Tt))],
+             'rhotr': [(('Ptr', 'Ttr'),      lambda gas, Ptr, Ttr: gas.density(Ptr, Ttr))],
+             'a'    : [(('T',),              lambda gas, T: gas.soundSpeed(T))],
+             'M'    : [(('V', 'a'),          lambda gas, V, a: V / a)],
+             'Mr'   : [(('W', 'a'),          lambda gas, W, a: W / a)]}
+
+class flowState:
+    '''
+    Thermodynamic state of the flow, it is used by the blade sections, the mean line and the thermodynamic processes.
+        quantities:
+            V, W                -- absolute and relative velocity magnitude
+            T, P, rho           -- static temperature, pressure and density
+            Tt, Pt, rhot        -- total temperature, pressure and density
+            Ttr, Ptr, rhotr     -- relative total temperature, pressure and density
+            a, M, Mr            -- speed of sound, mach and relative mach
+        the quantities that are not given are computed from the given ones with the flowRules relations (i.e. T from Tt and V)
+        the inputs are arrays with the same shape (or broadcastable) -> one state for many points at once
+    '''
+
+    def __init__(self, gas=None, **quantities):
+        '''
+        State object declaration:
+            variables:
+                gas         -- gas model -> None: perfectGas()
+                quantities  -- given quantities, i.e. Tt=Tt, Pt=Pt, V=V
+        '''
+
+        # the attributes are stored directly in __dict__ -> __getattr__ is used only for the derived quantities
+        for name in quantities.keys():
+            if name not in flowRules.keys() and name not in ['V', 'W']:
+                raise ValueError('Unknown flow quantity: {0}. Allowed quantities: {1}.'.format(name, ', '.join(['V', 'W'] + list(flowRules.keys()))))
+
+        self.__dict__['gas']       = gas if gas is not None else perfectGas()
+        self.__dict__['given']     = tuple(quantities.keys())
+        self.__dict__['resolving'] = set()
+        for name, value in quantities.items():
+            self.__dict__[name] = value
+
+    def __getattr__(self, name):
+        '''
+        This function computes a derived quantity the first time it is used.
+        '''
+
+        # not flow quantities or quantities that are already being computed (rules loop)
+        resolving = self.__dict__.get('resolving')
+        if name not in flowRules.keys() or resolving is None or name in resolving:
+            raise AttributeError(name)
+
+        resolving.add(name)
+        try:
+            for inputs, function in flowRules[name]:
+                try:
+                    values = [getattr(self, key) for key in inputs]
+                except AttributeError:
+                    continue
+
+                # derived quantity computation and storage
+                value = function(self.gas, *values)
+                self.__dict__[name] = value
+
+                return value
+        finally:
+            resolving.discard(name)
+
+        raise AttributeError('{0} cannot be computed from the given flow quantities ({1}).'.format(name, ', '.join(self.given)))
+
+    def __setattr__(self, name, value):
+        '''
+        This function sets a given quantity: the derived quantities are removed and computed again when they are used.
+        '''
+
+        for key in flowRules.keys():
+            if key not in self.given:
+                self.__dict__.pop(key, None)
+
+        self.__dict__[name] = value
+        if name not in self.given:
+            self.__dict__['given'] = self.given + (name,)
+
+    def fields(self, names):
+        '''
+        This function returns many quantities at once.
+            inputs:
+                names   -- list of quantity names
+            output:
+                values  -- list of quantities
+        '''
+
+        return [getattr(self, name) for name in names]
@@ -0,0 +1,109 @@
+# TURBOMACHINERY -- LIBRARY FOR THE PYROMAT GAS BACKEND
+# AUTHOR: antonio pucciarelli
+#
+# PROGRAM DESCRIPTION
+#   GAS BACKEND: pyromat gas object used by the thermodynamic processes and nozzle functions
+#       -- pyromat is imported only when the gas is used for the first time -> importing thermoProcess/thermoDuct is fast
+#       -- the pyromat units are set only inside the units context and then restored
+#           -> the process-wide pyromat configuration of other users is not changed
+#       -- the functions take the backend as input (gas=None -> shared default backend, see getGas)
+#
+#   FLUID: air
+#
+
+# importing libraries
+import contextlib
+
+# default units of the thermodynamic processes
+defaultUnits = {'unit_pressure': 'bar', 'unit_temperature': 'K', 'unit_energy': 'kJ', 'unit_mass': 'kg'}
+
+# shared default backend -> generated by getGas
+defaultGas = None
+
+class pyromatGas:
+    '''
+    Lazily initialized pyromat gas backend.
+    '''
+
+    def __init__(self, species='ig.air', units={}):
+        '''
+        Backend object declaration:
+            variables:
+                species     -- pyromat species ID
+                units       -- pyromat units {config key: unit} -> the missing keys are taken from defaultUnits
+        '''
+
+        self.species = species
+        self.units   = dict(defaultUnits, **units)
+
+        # pyromat module and gas object -> allocated when they are used for the first time
+        self.pm   = None
+        self.data = None
+
+    def module(self):
+        '''
+        This function imports pyromat.
+        '''
+
+        if self.pm is None:
+            try:
+                import pyromat as pm
+            except ImportError as error:
+                raise ImportError('pyromat is needed for the {0} gas backend (pip install pyromat).'.format(self.species)) from error
+
+            self.pm = pm
+
+        return self.pm
+
+    @contextlib.contextmanager
+    def unitContext(self):
+        '''
+        This function sets the backend units in the pyromat configuration, the previous units are restored at the end.
+            usage:
+                with gas.unitContext() as air:
+                    h = air.h(T=T, p=p)
+        '''
+
+        pm = self.module()
+
+        # units setting
+        previous = {name: pm.config[name] for name in self.units.keys()}
+        for name, value in self.units.items():
+            pm.config[name] = value
+
+        try:
+            # gas object generation
+            if self.data is None:
+                self.data = pm.get(self.species)
+
+            yield self.data
+        finally:
+            # units restoring
+            for name, value in previous.items():
+                pm.config[name] = value
+
+    def unit(self, name):
+        '''
+        This function returns the unit of a quantity: pressure/temperature/energy/mass.
+        '''
+
+        return self.units['unit_' + name]
+
+def getGas(gas=None):
+    '''
+    This function returns the gas backend.
+        inputs:
+            gas     -- gas backend -> None: shared default backend (ig.air, defaultUnits)
+        output:
+            gas     -- gas backend
+    '''
+
+    global defaultGas
+
+    if gas is not None:
+        return gas
+
+    if defaultGas is None:
+        defaultGas = pyromatGas()
+
+    return defaultGas
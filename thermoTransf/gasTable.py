@@ -0,0 +1,287 @@
+# TURBOMACHINERY -- LIBRARY FOR THE TABULATED GAS MODEL
+# AUTHOR: antonio pucciarelli
+#
+# PROGRAM DESCRIPTION
+#   GAS MODEL: thermally perfect gas with temperature dependent specific heat (see flowState.perfectGas for the gas methods)
+#       -- the gas properties are sampled once into dense tables: cp(T), h(T), s0(T)
+#           -- pyromat ig.air if pyromat is available
+#           -- NASA 7 coefficients polynomials (GRI-Mech 3.0) for the N2/O2/Ar air mixture otherwise
+#       -- the tables are stored in gasTables and shared by all the gas objects with the same settings
+#       -- direct lookups: cp(T), h(T), s0(T), Pr(T)
+#       -- inverse lookups: Th(h), TPr(Pr)
+#       -- all the lookups are vectorized linear interpolations of the dense tables
+#
+#   FLUID: air
+#
+
+# importing libraries
+import numpy as np
+
+# universal gas constant [J/mol K]
+Ru = 8.314462618
+
+# NASA 7 coefficients polynomials -> cp/R = a0 + a1 T + a2 T**2 + a3 T**3 + a4 T**4, a5 -> enthalpy, a6 -> entropy
+nasaSpecies = {'N2': {'M'    : 28.0134e-3,
+                      'Tmid' : 1000.0,
+                      'low'  : [3.298677, 1.4082404e-3, -3.963222e-6, 5.641515e-9, -2.444854e-12, -1.0208999e+3, 3.950372],
+                      'high' : [2.926640, 1.4879768e-3, -5.684760e-7, 1.0097038e-10, -6.753351e-15, -9.227977e+2, 5.980528]},
+               'O2': {'M'    : 31.9988e-3,
+                      'Tmid' : 1000.0,
+                      'low'  : [3.78245636, -2.99673416e-3, 9.84730201e-6, -9.68129509e-9, 3.24372837e-12, -1.06394356e+3, 3.65767573],
+                      'high' : [3.28253784, 1.48308754e-3, -7.57966669e-7, 2.09470555e-10, -2.16717794e-14, -1.08845772e+3, 5.45323129]},
+               'Ar': {'M'    : 39.948e-3,
+                      'Tmid' : 1000.0,
+                      'low'  : [2.5, 0.0, 0.0, 0.0, 0.0, -7.45375e+2, 4.366],
+                      'high' : [2.5, 0.0, 0.0, 0.0, 0.0, -7.45375e+2, 4.366]}}
+
+# dry air composition -> mole fractions
+airComposition = {'N2': 0.7812, 'O2': 0.2096, 'Ar': 0.0092}
+
+# sampled tables -> {table key: (T, cp, h, s0, R)}
+gasTables = {}
+
+def nasaProperties(T, composition=airComposition):
+    '''
+    This function computes the gas mixture properties with the NASA 7 coefficients polynomials.
+        inputs:
+            T           -- temperature array [K]
+            composition -- mole fractions {species: fraction} (see nasaSpecies)
+        output:
+            cp          -- specific heat @ constant pressure [J/kg K]
+            h           -- enthalpy [J/kg]
+            s0          -- entropy @ reference pressure [J/kg K]
+            R           -- gas constant [J/kg K]
+    '''
+
+    # mixture molar mass
+    fractions = np.array(list(composition.values())) / np.sum(list(composition.values()))
+    M = np.sum([fraction * nasaSpecies[name]['M'] for name, fraction in zip(composition.keys(), fractions)])
+
+    # molar properties allocation
+    cp = np.zeros(T.shape)
+    h  = np.zeros(T.shape)
+    s0 = np.zeros(T.shape)
+
+    for name, fraction in zip(composition.keys(), fractions):
+        # polynomial coefficients for each temperature -> [7, nPoints]
+        a = np.where(T < nasaSpecies[name]['Tmid'], np.array(nasaSpecies[name]['low'])[:,np.newaxis], np.array(nasaSpecies[name]['high'])[:,np.newaxis])
+
+        # adimensional properties
+        cpR = a[0] + a[1] * T + a[2] * T**2 + a[3] * T**3 + a[4] * T**4
+        hRT = a[0] + a[1] / 2 * T + a[2] / 3 * T**2 + a[3] / 4 * T**3 + a[4] / 5 * T**4 + a[5] / T
+        s0R = a[0] * np.log(T) + a[1] * T + a[2] / 2 * T**2 + a[3] / 3 * T**3 + a[4] / 4 * T**4 + a[6]
+
+        # molar mixture properties
+        cp = cp + fraction * cpR * Ru
+        h  = h  + fraction * hRT * Ru * T
+        s0 = s0 + fraction * s0R * Ru
+
+    return cp / M, h / M, s0 / M, Ru / M
+
+def pyromatProperties(T):
+    '''
+    This function computes the air properties with pyromat (ig.air).
+        inputs:
+            T           -- temperature array [K]
+        output:
+            cp          -- specific heat @ constant pressure [J/kg K]
+            h           -- enthalpy [J/kg]
+            s0          -- entropy @ 1 bar [J/kg K]
+            R           -- gas constant [J/kg K]
+    '''
+
+    # importing libraries
+    from thermoTransf.gasBackend import pyromatGas
+
+    # SI units -> the previous pyromat units are restored at the end
+    gas = pyromatGas(units={'unit_energy': 'J', 'unit_matter': 'kg'})
+
+    with gas.unitContext() as air:
+        # properties sampling
+        cp = np.asarray(air.cp(T=T), dtype=float).reshape(T.shape)
+        h  = np.asarray(air.h(T=T), dtype=float).reshape(T.shape)
+        s0 = np.asarray(air.s(T=T, p=1.0), dtype=float).reshape(T.shape)
+        R  = Ru / (float(np.asarray(air.mw())) * 1e-3)
+
+    return cp, h, s0, R
+
+def gasSource(source='auto'):
+    '''
+    This function chooses the gas properties source.
+        inputs:
+            source      -- auto/pyromat/nasa -> auto: pyromat if it is available, nasa otherwise
+        output:
+            source      -- pyromat/nasa
+    '''
+
+    if source not in ['auto', 'pyromat', 'nasa']:
+        raise ValueError('Unknown gas properties source: {0}. Allowed sources: auto, pyromat, nasa.'.format(source))
+
+    if source == 'auto':
+        # importing libraries
+        import importlib.util
+
+        if importlib.util.find_spec('pyromat') is not None:
+            source = 'pyromat'
+        else:
+            source = 'nasa'
+
+    return source
+
+class tabulatedGas:
+    '''
+    Thermally perfect gas model with tabulated properties, it can be used instead of flowState.perfectGas.
+    '''
+
+    def __init__(self, source='auto', Tmin=150.0, Tmax=2500.0, nPoints=4701, composition=airComposition, Tref=288.15):
+        '''
+        Gas object declaration:
+            variables:
+                source      -- auto/pyromat/nasa (see gasSource)
+                Tmin        -- table minimum temperature [K] -> the lookups are clipped to the table range
+                Tmax        -- table maximum temperature [K]
+                nPoints     -- # of table points
+                composition -- mole fractions {species: fraction} -> only for the nasa source
+                Tref        -- reference temperature for the constant cP and gamma values (cP, gamma attributes)
+        '''
+
+        # table generation -> only once for each table key
+        source = gasSource(source)
+        if source == 'nasa':
+            key = (source, float(Tmin), float(Tmax), int(nPoints), tuple(sorted(composition.items())))
+        else:
+            key = (source, float(Tmin), float(Tmax), int(nPoints))
+
+        if key not in gasTables.keys():
+            T = np.linspace(Tmin, Tmax, nPoints)
+            if source == 'nasa':
+                cp, h, s0, R = nasaProperties(T, composition)
+            else:
+                cp, h, s0, R = pyromatProperties(T)
+            gasTables[key] = (T, cp, h, s0, R)
+
+        # tables allocation
+        self.key    = key
+        self.source = source
+        self.Tmin   = Tmin
+        self.Tmax   = Tmax
+        self.Ttab, self.cpTab, self.hTab, self.s0Tab, self.R = gasTables[key]
+        # log of the relative pressure -> ln(Pr) = (s0(T) - s0(Tmin)) / R
+        self.lnPrTab = (self.s0Tab - self.s0Tab[0]) / self.R
+
+        # reference constant properties
+        self.cP    = float(self.cp(Tref))
+        self.gamma = self.cP / (self.cP - self.R)
+
+    # DIRECT LOOKUPS
+
+    def cp(self, T):
+        '''
+        This function computes the specific heat @ constant pressure.
+        '''
+
+        return np.interp(T, self.Ttab, self.cpTab)
+
+    def h(self, T):
+        '''
+        This function computes the enthalpy.
+        '''
+
+        return np.interp(T, self.Ttab, self.hTab)
+
+    def s0(self, T):
+        '''
+        This function computes the entropy @ reference pressure -> s(T, P) = s0(T) - R * ln(P/Pref).
+        '''
+
+        return np.interp(T, self.Ttab, self.s0Tab)
+
+    def Pr(self, T):
+        '''
+        This function computes the relative pressure -> P1/P0 = Pr(T1)/Pr(T0) for an isentropic transformation.
+        '''
+
+        return np.exp(np.interp(T, self.Ttab, self.lnPrTab))
+
+    # INVERSE LOOKUPS
+
+    def Th(self, h):
+        '''
+        This function computes the temperature from the enthalpy.
+        '''
+
+        return np.interp(h, self.hTab, self.Ttab)
+
+    def TPr(self, Pr):
+        '''
+        This function computes the temperature from the relative pressure.
+        '''
+
+        return np.interp(np.log(Pr), self.lnPrTab, self.Ttab)
+
+    # GAS METHODS (see flowState.perfectGas)
+
+    def temperatureChange(self, T, deltaH):
+        '''
+        This function computes the temperature after an enthalpy change.
+        '''
+
+        return self.Th(self.h(T) + deltaH)
+
+    def staticTemperature(self, Tt, V):
+        '''
+        This function computes the static temperature: h(Tt) = h(T) + V**2 / 2.
+        '''
+
+        return self.temperatureChange(Tt, - V**2 / 2)
+
+    def totalTemperature(self, T, V):
+        '''
+        This function computes the total temperature: h(Tt) = h(T) + V**2 / 2.
+        '''
+
+        return self.temperatureChange(T, V**2 / 2)
+
+    def enthalpyChange(self, T0, T1):
+        '''
+        This function computes the enthalpy change between two temperatures.
+        '''
+
+        return self.h(T1) - self.h(T0)
+
+    def velocity(self, Tt, T):
+        '''
+        This function computes the velocity from the total and static temperatures.
+        '''
+
+        return np.sqrt(2 * self.enthalpyChange(T, Tt))
+
+    def isentropicTemperature(self, T0, ratio):
+        '''
+        This function computes the final temperature of an isentropic transformation with pressure ratio P1/P0.
+        '''
+
+        return self.TPr(self.Pr(T0) * ratio)
+
+    def isentropicPressure(self, P0, T0, T1):
+        '''
+        This function computes the pressure of an isentropic transformation: P1 / P0 = Pr(T1) / Pr(T0).
+        '''
+
+        return P0 * np.exp(np.interp(T1, self.Ttab, self.lnPrTab) - np.interp(T0, self.Ttab, self.lnPrTab))
+
+    def density(self, P, T):
+        '''
+        This function computes the density: P = rho * R * T.
+        '''
+
+        return P / (self.R * T)
+
+    def soundSpeed(self, T):
+        '''
+        This function computes the speed of sound with the local specific heat ratio.
+        '''
+
+        cp = self.cp(T)
+
+        return np.sqrt(cp / (cp - self.R) * self.R * T)
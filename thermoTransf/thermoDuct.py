@@ -6,24 +6,104 @@
 #       -- nozzle shape 
 #       -- nozzle thermodynamics
 #       -- nozzle properties used in space propulsion 
+#       -- area vs Mach inversion for many stations and nozzle geometries at once (vectorized Newton method)
 #
 #   FLUID: air
-#  
+#
+#   GAS: pyromat backend (see gasBackend) -> pyromat is imported when the nozzle thermodynamics is computed for the first time
+#
 
 # importing libraries
 import matplotlib.pyplot as plt 
 import numpy as np 
-import pyromat as pm 
-from scipy.optimize import bisect 
+from thermoTransf.gasBackend import getGas
+
+def areaMachRatio(M, gamma=1.4):
+    '''
+    Isentropic transformation 
+        -- area ratio A/At vs Mach number
 
-# setting up dimensions
-unit_pressure = pm.config['unit_pressure'] = 'bar'
-unit_temperature = pm.config['unit_temperature'] = 'K'
-unit_energy = pm.config['unit_energy'] = 'kJ'
-unit_mass = pm.config['unit_mass'] = 'kg'
+        function inputs:
+            M       -- Mach number -> array
+            gamma   -- heat capacity ratio
+    '''
 
-# air object generation
-air = pm.get('ig.air')
+    return 1/M * (2/(gamma+1)*(1+(gamma-1)/2*M**2))**((gamma+1)/(2*(gamma-1)))
+
+def machArea(areaRatio, gamma=1.4, supersonic=False, tol=1e-12, nMax=100):
+    '''
+    Isentropic transformation 
+        -- Mach number vs area ratio A/At, all the stations are solved at once
+        -- Newton method on ln(A/At) - ln(areaRatio) for the subsonic or supersonic branch
+            -- d ln(A/At) / dM = (M**2 - 1) / (M * (1 + (gamma-1)/2 * M**2))
+            -- initial guess: series expansion near M = 1 -> ln(A/At) = 2/(gamma+1) * (M-1)**2
+                              low/high Mach asymptotes far from the throat
+            -- each station keeps a bracket of the root: the Newton steps outside the bracket are replaced by bisection
+
+        function inputs:
+            areaRatio   -- A/At -> array of any shape (i.e. [nGeometries, nStations])
+            gamma       -- heat capacity ratio -> float or array broadcastable with areaRatio
+            supersonic  -- boolean value (or array) for the supersonic branch
+            tol         -- relative tolerance on the Mach number (Newton step)
+            nMax        -- maximum # of iterations
+        function output:
+            M           -- Mach number with the broadcast shape of the inputs -> NaN for A/At < 1
+    '''
+
+    # broadcasting inputs
+    areaRatio, gamma, supersonic = np.broadcast_arrays(np.asarray(areaRatio, dtype=float), np.asarray(gamma, dtype=float), np.asarray(supersonic, dtype=bool))
+
+    with np.errstate(invalid='ignore', divide='ignore', over='ignore'):
+        # target 
+        lnRatio = np.log(areaRatio)
+        # exponent of the area Mach relation
+        k = (gamma+1)/(2*(gamma-1))
+
+        # initial guess 
+        # -- series expansion near the throat 
+        delta = np.sqrt((gamma+1)/2 * np.maximum(lnRatio, 0))
+        # -- low Mach asymptote: A/At = (2/(gamma+1))**k / M
+        lowMach = (2/(gamma+1))**k / areaRatio
+        # -- high Mach asymptote: A/At = (2/(gamma+1))**k * ((gamma-1)/2)**k * M**(2/(gamma-1))
+        highMach = (areaRatio / ((2/(gamma+1))**k * ((gamma-1)/2)**k))**((gamma-1)/2)
+        M = np.where(supersonic, np.minimum(1 + delta, highMach), np.clip(np.maximum(1 - delta, lowMach), 0, 1))
+
+        # bracket of the root -> subsonic [0, 1], supersonic [1, inf)
+        lo = np.where(supersonic, 1.0, 0.0)
+        hi = np.where(supersonic, np.inf, 1.0)
+
+        # stations to solve -> sonic stations and not physical stations (A < At) are not iterated 
+        active = np.isfinite(lnRatio) & (lnRatio > 0)
+        counter = 0
+        while np.any(active) and counter < nMax:
+            # updating counter
+            counter = counter + 1
+
+            # residual and derivative 
+            res  = np.log(areaMachRatio(M, gamma)) - lnRatio
+            dres = (M**2 - 1) / (M * (1 + (gamma-1)/2 * M**2))
+
+            # bracket update -> ln(A/At) decreases on the subsonic branch and increases on the supersonic branch 
+            tooLow = np.where(supersonic, res < 0, res > 0)
+            lo = np.where(active & tooLow, M, lo)
+            hi = np.where(active & np.logical_not(tooLow), M, hi)
+
+            # Newton step with bisection safeguard
+            step = res / dres
+            Mnew = M - step
+            outside = np.logical_not((Mnew >= lo) & (Mnew <= hi))
+            Mnew = np.where(outside, np.where(np.isfinite(hi), (lo + hi)/2, 2 * lo), Mnew)
+
+            # convergence check -> Newton step below the tolerance or residual at machine precision 
+            #   (near the throat M - 1 ~ sqrt(ln(A/At)) and the Mach number cannot be computed with a better accuracy)
+            converged = (np.logical_not(outside) & (np.abs(step) <= tol * np.abs(M))) | (np.abs(res) <= 4 * np.finfo(float).eps * np.maximum(1, lnRatio))
+            M = np.where(active, Mnew, M)
+            active = active & np.logical_not(converged)
+
+        # sonic and not physical stations
+        M = np.where(lnRatio == 0, 1.0, np.where(areaRatio < 1, np.nan, M))
+
+    return M[()]
 
 def nozzle(Ain=0,At=0,Aout=0,xIn=0,xT=0,xOut=0,dim1=100,dim2=100,color='k',name='nozzle',plot=True):
     '''
@@ -58,62 +138,42 @@ def nozzle(Ain=0,At=0,Aout=0,xIn=0,xT=0,xOut=0,dim1=100,dim2=100,color='k',name=
 
     return nozzleVec, convVec, divVec, xVec, xConvVec, xDivVec
 
-def nozzleThermo(nozzleVec=[],xVec=[],At=0,xT=0,Tin=0,pIn=0,plot=True):
+def nozzleThermo(nozzleVec=[],xVec=[],At=0,xT=0,Tin=0,pIn=0,plot=True,gas=None,gamma=None):
     '''
     Nozzle thermodynamics computation
         -- thermodynamic quantitties computation for a defined geometry nozzle without friction
+        -- many nozzle geometries can be studied at once: the stations are on the last axis 
     
         function inputs:
-            nozzleVec   -- nozzle area geometry
-            xVec        -- nozzle longitudinal dimension
-            At          -- nozzle throat area 
-            xT          -- throat position 
+            nozzleVec   -- nozzle area geometry -> [nStations] or [nGeometries, nStations]
+            xVec        -- nozzle longitudinal dimension -> [nStations] or [nGeometries, nStations]
+            At          -- nozzle throat area -> float or [nGeometries]
+            xT          -- throat position -> float or [nGeometries]
+            Tin         -- inlet total temperature -> float or [nGeometries]
+            pIn         -- inlet total pressure -> float or [nGeometries]
+            gas         -- pyromat gas backend (see gasBackend.pyromatGas) -> None: shared default backend
+            gamma       -- heat capacity ratio -> None: computed by the gas backend 
     '''
 
     # importing air object 
-    global air 
+    gas = getGas(gas)
 
     # importing dimensions
-    global unit_pressure, unit_temperature 
+    unit_pressure, unit_temperature = gas.unit('pressure'), gas.unit('temperature')
 
     # air heat capacity ratio
-    gamma = air.gam()
-
-    # nozzleVec dimension 
-    dim = len(nozzleVec)
-
-    # area vs Mach thermodynamics -- isentropic transformation 
-    def areaMach(M,area,At,gamma):
-        '''
-        Isentropic transformation 
-            -- Mach number vs area
-
-            function inputs:
-                M       -- nozzle Mach number at a defined area 
-                area    -- nozzle area design
-                At      -- nozzle throat area 
-                gamma   -- heat capacity ratio
-        '''
+    if gamma is None:
+        with gas.unitContext() as air:
+            gamma = air.gam()
 
-        return area/At - 1/M * (2/(gamma+1)*(1+(gamma-1)/2*M**2))**((gamma+1)/(2*(gamma-1)))
+    # geometry arrays -> the geometry parameters are broadcast on the stations axis
+    nozzleVec = np.asarray(nozzleVec, dtype=float)
+    xVec = np.asarray(xVec, dtype=float)
+    At, xT, Tin, pIn = [np.expand_dims(np.asarray(x, dtype=float), -1) for x in [At, xT, Tin, pIn]]
 
     # Mach number computation with respect to the defined geometry
-    #   -- using numerical approach for the computation of Mach number 
-    Mvec = np.zeros(dim)
-
-    for ii, A in enumerate(nozzleVec):
-        # bisection process for finding the 0
-        # studying for convergent and divergent part wrt x position along the nozzle 
-        if xVec[ii] < xT:
-            # convergent part 
-            extr1 = 1e-10
-            extr2 = 1
-            Mvec[ii] = bisect(f = areaMach, a = extr1, b = extr2, args=(A,At,gamma))
-        else: 
-            # divergent part 
-            extr1 = 1 + 1e-10
-            extr2 = 10
-            Mvec[ii] = bisect(f = areaMach, a = extr1, b = extr2, args=(A,At,gamma))
+    #   -- studying for convergent and divergent part wrt x position along the nozzle 
+    Mvec = machArea(nozzleVec / At, gamma=gamma, supersonic=xVec >= xT)
 
     # temperature and pressure computation 
     # vector allocation 
@@ -126,16 +186,16 @@ def nozzleThermo(nozzleVec=[],xVec=[],At=0,xT=0,Tin=0,pIn=0,plot=True):
         fig, ax = plt.subplots(3)
         fig.suptitle('Nozzle analysis')
         # Mach plot
-        ax[0].plot(xVec,Mvec,'k')
+        ax[0].plot(np.transpose(xVec),np.transpose(Mvec),'k')
         ax[0].set_title('Mach')
         ax[0].set_xlabel('x')
         ax[0].set_ylabel('M')
         # temperature plot 
-        ax[1].plot(xVec,Tvec,'k')
+        ax[1].plot(np.transpose(xVec),np.transpose(Tvec),'k')
         ax[1].set_title('Temperature')
         ax[1].set_xlabel('x')
         ax[1].set_ylabel('T [{0:s}]'.format(unit_temperature))
-        ax[2].plot(xVec,pVec,'k')
+        ax[2].plot(np.transpose(xVec),np.transpose(pVec),'k')
         # pressure plot 
         ax[2].set_title('Pressure')
         ax[2].set_xlabel('x')
@@ -11,21 +11,15 @@
 #       -- adiabatic real process 
 #
 #   FLUID: air
-#  
+#
+#   GAS: pyromat backend (see gasBackend) -> pyromat is imported when a process is computed for the first time
+#
 
 # importing libraries
-import pyromat as pm 
 import numpy as np
 import matplotlib.pyplot as plt 
-
-# setting up dimensions
-unit_pressure = pm.config['unit_pressure'] = 'bar'
-unit_temperature = pm.config['unit_temperature'] = 'K'
-unit_energy = pm.config['unit_energy'] = 'kJ'
-unit_mass = pm.config['unit_mass'] = 'kg'
-
-# air object generation 
-air = pm.get('ig.air')
+from thermoTransf.flowState import flowState, perfectGas
+from thermoTransf.gasBackend import getGas
 
 def quantities(V0, Tt0, Pt0, cP, R, gamma, plot=False):
     '''
@@ -39,17 +33,15 @@ def quantities(V0, Tt0, Pt0, cP, R, gamma, plot=False):
             gamma   -- specific heat ratio
             plot    -- boolean value for the plot
     '''
-    # from total temperature definition 
-    # Tt = T + V**2 / (2 * cP) -> T = Tt - V**2 / (2 * cP)
-    T0 = Tt0 - V0**2 / (2*cP)
-    
-    # from the isentropic flow description 
-    # P0 / Pt0 = (T0 / Tt0)**(gamma/(gamma-1))
-    P0 = Pt0 * (T0/Tt0)**(gamma/(gamma-1))
-    
-    # from perfect gas definition
-    # P / rho = R * T -> rho = P / (R * T)
-    rho0 = P0 / (R * T0)
+    # flow state 
+    #   from total temperature definition 
+    #       Tt = T + V**2 / (2 * cP) -> T = Tt - V**2 / (2 * cP)
+    #   from the isentropic flow description 
+    #       P0 / Pt0 = (T0 / Tt0)**(gamma/(gamma-1))
+    #   from perfect gas definition
+    #       P / rho = R * T -> rho = P / (R * T)
+    state = flowState(perfectGas(R=R, gamma=gamma, cP=cP), Tt=Tt0, Pt=Pt0, V=np.asarray(V0))
+    T0, P0, rho0 = state.fields(['T', 'P', 'rho'])
 
     if plot:
         fig, host = plt.subplots(figsize=(8,5))        
@@ -90,9 +82,105 @@ def quantities(V0, Tt0, Pt0, cP, R, gamma, plot=False):
 
     return T0, P0, rho0
 
-def isothermal(T=0,pIn=0,pOut=0,dim=100,name='isothermal',color='k',plot=True):
+def processPath(start, end, dim):
+    '''
+    This function generates the points of the process paths between the initial and the final values.
+        inputs:
+            start   -- initial value -> float or array [nProcesses]
+            end     -- final value -> float or array [nProcesses]
+            dim     -- number of points of each path
+        output:
+            path    -- path points -> [dim] or [nProcesses, dim]
+    '''
+
+    return np.linspace(np.asarray(start, dtype=float), np.asarray(end, dtype=float), dim, axis=-1)
+
+def processConstant(value, path):
+    '''
+    This function broadcasts a process constant (i.e. the temperature of an isothermal process) on the path points.
+        inputs:
+            value   -- process constant -> float or array [nProcesses]
+                    -- 1 element arrays (pyromat output of a scalar input) are used as floats -> the path shape is not changed
+            path    -- path points -> [dim] or [nProcesses, dim]
+        output:
+            value   -- process constant with the path shape
+    '''
+
+    # batch boundary -> pyromat returns 1 element arrays also for scalar inputs
+    value = np.atleast_1d(np.asarray(value, dtype=float)).ravel()
+    if value.size == 1:
+        value = float(value[0])
+
+    return np.broadcast_to(np.asarray(value)[..., np.newaxis], np.broadcast_shapes(np.shape(value) + (1,), np.shape(path)))
+
+def processEnds(*paths):
+    '''
+    This function returns the initial and final values of the process paths.
+        inputs:
+            paths   -- path arrays -> [dim] or [nProcesses, dim]
+        output:
+            initial -- initial values -> floats ([dim] paths) or arrays [nProcesses]
+            final   -- final values -> floats ([dim] paths) or arrays [nProcesses]
+    '''
+
+    paths = np.broadcast_arrays(*paths)
+
+    # single process -> float values
+    if paths[0].ndim == 1:
+        return [float(path[0]) for path in paths], [float(path[-1]) for path in paths]
+
+    return [path[...,0] for path in paths], [path[...,-1] for path in paths]
+
+def nonZero(*values):
+    '''
+    This function checks if all the values of the inputs are different from 0.
+    '''
+
+    return all([np.all(np.asarray(value) != 0) for value in values])
+
+def printProcess(title, name, initial, final, unit_energy, unit_mass, unit_pressure, unit_temperature, info={}):
+    '''
+    This function prints the initial and final values of the processes.
+        inputs:
+            title       -- transformation type
+            name        -- transformation name
+            initial     -- initial values [h, s, p, T] -> floats or arrays [nProcesses]
+            final       -- final values [h, s, p, T] -> floats or arrays [nProcesses]
+            unit_*      -- units of measure
+            info        -- other process values {label: value} (i.e. the polytropic index)
+    '''
+
+    # values broadcasting -> [nProcesses]
+    values = np.broadcast_arrays(*[np.atleast_1d(x) for x in list(initial) + list(final) + list(info.values())])
+    nProcesses = values[0].size
+    values = [x.ravel() for x in values]
+
+    for ii in range(nProcesses):
+        hIn, sIn, pIn, Tin, hOut, sOut, pOut, Tout = [x[ii] for x in values[:8]]
+
+        print('+++++++++++++++++++++++++++++++++++++++++++')
+        if nProcesses == 1:
+            print('{0:s} transformation: '.format(title), name)
+        else:
+            print('{0:s} transformation: '.format(title), name, '-- process {0:d}'.format(ii))
+        for label, value in zip(info.keys(), values[8:]):
+            print('-- {0:s} = {1}'.format(label, value[ii]))
+        print('-- Initial values:')
+        print('\ts = {0:>10.3f} {1:s}/{2:s}'.format(sIn, unit_energy, unit_mass))
+        print('\th = {0:>10.3f} {1:s}/{2:s}'.format(hIn, unit_energy, unit_mass))
+        print('\tp = {0:>10.3f} {1:s}'.format(pIn, unit_pressure))
+        print('\tT = {0:>10.3f} {1:s}'.format(Tin, unit_temperature))
+        print('-- Final values:')
+        print('\ts = {0:>10.3f} {1:s}/{2:s}'.format(sOut, unit_energy, unit_mass))
+        print('\th = {0:>10.3f} {1:s}/{2:s}'.format(hOut, unit_energy, unit_mass))
+        print('\tp = {0:>10.3f} {1:s}'.format(pOut, unit_pressure))
+        print('\tT = {0:>10.3f} {1:s}'.format(Tout, unit_temperature))
+        print('+++++++++++++++++++++++++++++++++++++++++++\n')
+
+def isothermal(T=0,pIn=0,pOut=0,dim=100,name='isothermal',color='k',plot=True,gas=None,printout=True,path=False):
     '''
     Isothermal transformation plot
+        -- many processes can be computed at once: the inputs are arrays [nProcesses] and the paths are [nProcesses, dim]
 
         function inputs:
             T       -- constant temperature during the process
@@ -102,63 +190,53 @@ def isothermal(T=0,pIn=0,pOut=0,dim=100,name='isothermal',color='k',plot=True):
                     -- default set to 100
             name    -- transformation name
             color   -- plotting color
+            gas     -- pyromat gas backend (see gasBackend.pyromatGas) -> None: shared default backend
+            printout -- boolean for printing 
+            path    -- boolean for the output of the paths {'h', 's', 'p', 'T'}
     '''
 
-    # getting air data 
-    global air
+    # getting air data -> the backend units are set only inside the unit context
+    gas = getGas(gas)
 
     # getting dimensions
-    global unit_energy, unit_mass, unit_pressure, unit_temperature
+    unit_energy, unit_mass, unit_pressure, unit_temperature = gas.unit('energy'), gas.unit('mass'), gas.unit('pressure'), gas.unit('temperature')
 
-    if pIn != 0 and pOut != 0:
-        # generating array of value for the pressure 
-        pVec = np.linspace(pIn, pOut, dim)
+    # pyromat computations -> backend units
+    with gas.unitContext() as air:
+        if nonZero(pIn, pOut):
+            # generating array of value for the pressure 
+            pVec = processPath(pIn, pOut, dim)
+            Tvec = processConstant(T, pVec)
 
-        # computing entropy values for the isothermal transformation
-        sVec = air.s(T=T,p=pVec)
+            # computing entropy values for the isothermal transformation
+            sVec = air.s(T=Tvec,p=pVec)
 
-        # computing enthalpy values for the isothermal transformation
-        hVec = air.h(T=T,p=pVec)
+            # computing enthalpy values for the isothermal transformation
+            hVec = air.h(T=Tvec,p=pVec)
     
-    else:
-        print('input error in:', name)
-
-    # initial values
-    hIn = hVec[0]
-    sIn = sVec[0]
-    pIn = pVec[0]
-    Tin = T
+        else:
+            print('input error in:', name)
 
-    # final values
-    hOut = hVec[-1]
-    sOut = sVec[-1]
-    pOut = pVec[-1]
-    Tout = T
+    # initial and final values
+    [hIn, sIn, pIn, Tin], [hOut, sOut, pOut, Tout] = processEnds(hVec, sVec, pVec, Tvec)
 
     # printing of useful values
-    print('+++++++++++++++++++++++++++++++++++++++++++')
-    print('Isothermal transformation: ', name)
-    print('-- Initial values:')
-    print('\ts = {0:>10.3f} {1:s}/{2:s}'.format(sIn, unit_energy, unit_mass))
-    print('\th = {0:>10.3f} {1:s}/{2:s}'.format(hIn, unit_energy, unit_mass))
-    print('\tp = {0:>10.3f} {1:s}'.format(pIn, unit_pressure))
-    print('\tT = {0:>10.3f} {1:s}'.format(Tin, unit_temperature))
-    print('-- Final values:')
-    print('\ts = {0:>10.3f} {1:s}/{2:s}'.format(sOut, unit_energy, unit_mass))
-    print('\th = {0:>10.3f} {1:s}/{2:s}'.format(hOut, unit_energy, unit_mass))
-    print('\tp = {0:>10.3f} {1:s}'.format(pOut, unit_pressure))
-    print('\tT = {0:>10.3f} {1:s}'.format(Tout, unit_temperature))
-    print('+++++++++++++++++++++++++++++++++++++++++++\n')
+    if printout:
+        printProcess('Isothermal', name, [hIn, sIn, pIn, Tin], [hOut, sOut, pOut, Tout], unit_energy, unit_mass, unit_pressure, unit_temperature)
 
     # plotting transformation
     if plot:
-        plt.plot(sVec, hVec, color=color, label=name)
+        plt.plot(np.transpose(sVec), np.transpose(hVec), color=color, label=name)
+
+    if path:
+        return [hIn, sIn, pIn, Tin], [hOut, sOut, pOut, Tout], {'h': hVec, 's': sVec, 'p': pVec, 'T': Tvec}
 
     return [hIn, sIn, pIn, Tin], [hOut, sOut, pOut, Tout]
 
-def isentropic(s=0,pIn=0,pOut=0,Tin=0,Tout=0,dim=100,name='isentropic',color='k',plot=True):
+def isentropic(s=0,pIn=0,pOut=0,Tin=0,Tout=0,dim=100,name='isentropic',color='k',plot=True,gas=None,printout=True,path=False):
     '''
     Isentropic transformation plot
+        -- many processes can be computed at once: the inputs are arrays [nProcesses] and the paths are [nProcesses, dim]
 
         function inputs:
             s       -- constant entropy during the process
@@ -171,78 +249,63 @@ def isentropic(s=0,pIn=0,pOut=0,Tin=0,Tout=0,dim=100,name='isentropic',color='k'
             name    -- transformation name
             color   -- plotting color
             plot    -- boolean for plotting
+            gas     -- pyromat gas backend (see gasBackend.pyromatGas) -> None: shared default backend
+            printout -- boolean for printing 
+            path    -- boolean for the output of the paths {'h', 's', 'p', 'T'}
     '''
 
-    # getting air data 
-    global air
+    # getting air data -> the backend units are set only inside the unit context
+    gas = getGas(gas)
 
     # getting dimensions
-    global unit_energy, unit_mass, unit_pressure, unit_temperature
+    unit_energy, unit_mass, unit_pressure, unit_temperature = gas.unit('energy'), gas.unit('mass'), gas.unit('pressure'), gas.unit('temperature')
 
     # generation of variables arrays
-    pVec = np.linspace(pIn, pOut, dim)
-    Tvec = np.linspace(Tin, Tout, dim)
-
-    # computing transformation with respect to the input data 
-    if pIn != 0 and pOut != 0:
-        # temperature vector allocation 
-        Tvec = np.zeros([dim])
-        # temperature computation
-        for ii, p in enumerate(pVec):
-            Tvec[ii] = air.T_s(s=s,p=p)
-
-        # enthalpy computation
-        hVec = air.h(T=Tvec, p=pVec)
-
-    elif Tin != 0 and Tout != 0:
-        # pressure vector allocation
-        pVec = np.zeros([dim])
-        # pressure computation
-        for ii, T in enumerate(Tvec):
-            pVec[ii] = air.p_s(s=s, T=T)
-        
-        # enthalpy computation
-        hVec = air.h(T=Tvec, p=pVec)
+    pVec = processPath(pIn, pOut, dim)
+    Tvec = processPath(Tin, Tout, dim)
+
+    # pyromat computations -> backend units
+    with gas.unitContext() as air:
+        # computing transformation with respect to the input data 
+        if nonZero(pIn, pOut):
+            # temperature computation
+            sVec = processConstant(s, pVec)
+            Tvec = air.T_s(s=sVec,p=pVec)
 
-    else:
-        print('input error in:', name)
+            # enthalpy computation
+            hVec = air.h(T=Tvec, p=pVec)
+
+        elif nonZero(Tin, Tout):
+            # pressure computation
+            sVec = processConstant(s, Tvec)
+            pVec = air.p_s(s=sVec, T=Tvec)
+        
+            # enthalpy computation
+            hVec = air.h(T=Tvec, p=pVec)
 
-    # initial values
-    hIn = hVec[0]
-    sIn = s
-    pIn = pVec[0]
-    Tin = Tvec[0]
+        else:
+            print('input error in:', name)
 
-    # final values
-    hOut = hVec[-1]
-    sOut = s
-    pOut = pVec[-1]
-    Tout = Tvec[-1]
+    # initial and final values
+    [hIn, sIn, pIn, Tin], [hOut, sOut, pOut, Tout] = processEnds(hVec, sVec, pVec, Tvec)
 
     # printing of useful values
-    print('+++++++++++++++++++++++++++++++++++++++++++')
-    print('Isentropic transformation: ', name)
-    print('-- Initial values:')
-    print('\ts = {0:>10.3f} {1:s}/{2:s}'.format(sIn, unit_energy, unit_mass))
-    print('\th = {0:>10.3f} {1:s}/{2:s}'.format(hIn, unit_energy, unit_mass))
-    print('\tp = {0:>10.3f} {1:s}'.format(pIn, unit_pressure))
-    print('\tT = {0:>10.3f} {1:s}'.format(Tin, unit_temperature))
-    print('-- Final values:')
-    print('\ts = {0:>10.3f} {1:s}/{2:s}'.format(sOut, unit_energy, unit_mass))
-    print('\th = {0:>10.3f} {1:s}/{2:s}'.format(hOut, unit_energy, unit_mass))
-    print('\tp = {0:>10.3f} {1:s}'.format(pOut, unit_pressure))
-    print('\tT = {0:>10.3f} {1:s}'.format(Tout, unit_temperature))
-    print('+++++++++++++++++++++++++++++++++++++++++++\n')
+    if printout:
+        printProcess('Isentropic', name, [hIn, sIn, pIn, Tin], [hOut, sOut, pOut, Tout], unit_energy, unit_mass, unit_pressure, unit_temperature)
 
     # plotting transformation
     if plot:
-        plt.plot(s*np.ones([dim]), hVec, color=color, label=name)
+        plt.plot(np.transpose(sVec), np.transpose(hVec), color=color, label=name)
+
+    if path:
+        return [hIn, sIn, pIn, Tin], [hOut, sOut, pOut, Tout], {'h': hVec, 's': sVec, 'p': pVec, 'T': Tvec}
 
     return [hIn, sIn, pIn, Tin], [hOut, sOut, pOut, Tout]
 
-def isobaric(p=0,Tin=0,Tout=0,dim=100,name='isobaric',color='k',plot=True):
+def isobaric(p=0,Tin=0,Tout=0,dim=100,name='isobaric',color='k',plot=True,gas=None,printout=True,path=False):
     '''
     Isobaric transformation plot
+        -- many processes can be computed at once: the inputs are arrays [nProcesses] and the paths are [nProcesses, dim]
 
         function inputs:
             p       -- constant pressure during the process
@@ -253,63 +316,51 @@ def isobaric(p=0,Tin=0,Tout=0,dim=100,name='isobaric',color='k',plot=True):
             name    -- transformation name
             color   -- plotting color
             plot    -- boolean for plotting
+            gas     -- pyromat gas backend (see gasBackend.pyromatGas) -> None: shared default backend
+            printout -- boolean for printing 
+            path    -- boolean for the output of the paths {'h', 's', 'p', 'T'}
     '''
 
-    # getting air data 
-    global air
-
-    if Tin != 0 and Tout != 0:
-        # array allocation 
-        sVec = np.zeros([dim])
-        hVec = np.zeros([dim])
-        
-        # temperature vector generation 
-        Tvec = np.linspace(Tin, Tout, dim)
+    # getting air data -> the backend units are set only inside the unit context
+    gas = getGas(gas)
 
-        # values computation
-        for ii, T in enumerate(Tvec):
-            sVec[ii] = air.s(T=T,p=p)
-            hVec[ii] = air.h(T=T,p=p)
+    # getting dimensions
+    unit_energy, unit_mass, unit_pressure, unit_temperature = gas.unit('energy'), gas.unit('mass'), gas.unit('pressure'), gas.unit('temperature')
+
+    # pyromat computations -> backend units
+    with gas.unitContext() as air:
+        if nonZero(Tin, Tout):
+            # temperature vector generation 
+            Tvec = processPath(Tin, Tout, dim)
+            pVec = processConstant(p, Tvec)
+
+            # values computation
+            sVec = air.s(T=Tvec,p=pVec)
+            hVec = air.h(T=Tvec,p=pVec)
     
-    else:
-        print('input error in: ', name)
+        else:
+            print('input error in: ', name)
     
-    # initial values
-    hIn = hVec[0]
-    sIn = sVec[0]
-    pIn = p
-    Tin = Tvec[0]
-
-    # final values
-    hOut = hVec[-1]
-    sOut = sVec[-1]
-    pOut = p
-    Tout = Tvec[-1]
+    # initial and final values
+    [hIn, sIn, pIn, Tin], [hOut, sOut, pOut, Tout] = processEnds(hVec, sVec, pVec, Tvec)
 
     # printing of useful values
-    print('+++++++++++++++++++++++++++++++++++++++++++')
-    print('Isobaric transformation: ', name)
-    print('-- Initial values:')
-    print('\ts = {0:>10.3f} {1:s}/{2:s}'.format(sIn, unit_energy, unit_mass))
-    print('\th = {0:>10.3f} {1:s}/{2:s}'.format(hIn, unit_energy, unit_mass))
-    print('\tp = {0:>10.3f} {1:s}'.format(pIn, unit_pressure))
-    print('\tT = {0:>10.3f} {1:s}'.format(Tin, unit_temperature))
-    print('-- Final values:')
-    print('\ts = {0:>10.3f} {1:s}/{2:s}'.format(sOut, unit_energy, unit_mass))
-    print('\th = {0:>10.3f} {1:s}/{2:s}'.format(hOut, unit_energy, unit_mass))
-    print('\tp = {0:>10.3f} {1:s}'.format(pOut, unit_pressure))
-    print('\tT = {0:>10.3f} {1:s}'.format(Tout, unit_temperature))
-    print('+++++++++++++++++++++++++++++++++++++++++++\n')
+    if printout:
+        printProcess('Isobaric', name, [hIn, sIn, pIn, Tin], [hOut, sOut, pOut, Tout], unit_energy, unit_mass, unit_pressure, unit_temperature)
 
     # plotting transformation
     if plot:
-        plt.plot(sVec, hVec, color=color, label=name)
+        plt.plot(np.transpose(sVec), np.transpose(hVec), color=color, label=name)
+
+    if path:
+        return [hIn, sIn, pIn, Tin], [hOut, sOut, pOut, Tout], {'h': hVec, 's': sVec, 'p': pVec, 'T': Tvec}
 
     return [hIn, sIn, pIn, Tin], [hOut, sOut, pOut, Tout]
 
-def polytropic(n=0,pIn=0,pOut=0,Tin=0,Tout=0,R=8.3145e-2,dim=100,name='polytropic',color='k',plot=True):
+def polytropic(n=0,pIn=0,pOut=0,Tin=0,Tout=0,R=8.3145e-2,dim=100,name='polytropic',color='k',plot=True,gas=None,printout=True,path=False):
     '''
     Isobaric transformation plot
+        -- many processes can be computed at once: the inputs are arrays [nProcesses] and the paths are [nProcesses, dim]
 
         function inputs:
             n       -- polytropic thermodynamics process index
@@ -324,115 +375,93 @@ def polytropic(n=0,pIn=0,pOut=0,Tin=0,Tout=0,R=8.3145e-2,dim=100,name='polytropi
             name    -- transformation name
             color   -- plotting color
             plot    -- boolean for plotting
+            gas     -- pyromat gas backend (see gasBackend.pyromatGas) -> None: shared default backend
+            printout -- boolean for printing 
+            path    -- boolean for the output of the paths {'h', 's', 'p', 'T'}
     '''
 
-    # getting air data 
-    global air
+    # getting air data -> the backend units are set only inside the unit context
+    gas = getGas(gas)
 
     # getting dimensions
-    global unit_energy, unit_mass, unit_pressure, unit_temperature
+    unit_energy, unit_mass, unit_pressure, unit_temperature = gas.unit('energy'), gas.unit('mass'), gas.unit('pressure'), gas.unit('temperature')
     
-    if n != 0 and pIn != 0 and pOut != 0:
-        # pressure vector generation 
-        pVec = np.linspace(pIn, pOut, dim)
-
-        # different cases with respect to the known flow properties
-        if Tin != 0:
-            dIn = air.d(T=Tin, p=pIn)
-            dVec = (pVec / pIn)**(1/n) * dIn
-        elif Tout != 0:
-            dOut = air.d(T=Tout, p=pOut)
-            dVec = (pVec / pOut)**(1/n) * dOut
-        else:
-            print('input error on temperature in: ', name)
+    # pyromat computations -> backend units
+    with gas.unitContext() as air:
+        if nonZero(n, pIn, pOut):
+            # pressure vector generation 
+            pVec = processPath(pIn, pOut, dim)
+            nVec = processConstant(n, pVec)
+
+            # different cases with respect to the known flow properties
+            # p / d**n = const 
+            if nonZero(Tin):
+                dIn = processConstant(air.d(T=Tin, p=pIn), pVec)
+                dVec = (pVec / processConstant(pIn, pVec))**(1/nVec) * dIn
+            elif nonZero(Tout):
+                dOut = processConstant(air.d(T=Tout, p=pOut), pVec)
+                dVec = (pVec / processConstant(pOut, pVec))**(1/nVec) * dOut
+            else:
+                print('input error on temperature in: ', name)
 
-        # temperature vector allocation 
-        Tvec = np.zeros([dim])
-        for ii in range(dim):
             # temperature computation
             # !!! PYroMat doesn't allow the inverse computation of T through the density 
             # !!! in order to solve this issue ideal gas relation has been used for the computation of T
-            Tvec[ii] = pVec[ii] / ( dVec[ii] * R / air.mw() )
-
-        # enthaply and entropy vector allocation
-        hVec = np.zeros([dim])
-        sVec = np.zeros([dim])
+            Tvec = pVec / ( dVec * R / air.mw() )
         
-        # enthalpy and entropy computation
-        for ii in range(dim):
-            hVec[ii] = air.h(T=Tvec[ii], p=pVec[ii])
-            sVec[ii] = air.s(T=Tvec[ii], p=pVec[ii])
-
-    elif n != 0 and Tin != 0 and Tout != 0:
-        # temperature vector generation 
-        Tvec = np.array(Tin, Tout, dim)
-
-        # different cases with respect to the known flow properties
-        if pIn != 0:
-            dIn = air.d(T=Tin, p=pIn)
-            dVec = (pVec / pIn)**(1/n) * dIn
-        elif pOut != 0:
-            dOut = air.d(T=Tout, p=pOut)
-            dVec = (pVec / pOut)**(1/n) * dOut
-
-        # pressure vector allocation 
-        pVec = np.zeros([dim])
-        for ii in range(dim):
+            # enthalpy and entropy computation
+            hVec = air.h(T=Tvec, p=pVec)
+            sVec = air.s(T=Tvec, p=pVec)
+
+        elif nonZero(n, Tin, Tout):
+            # temperature vector generation 
+            Tvec = processPath(Tin, Tout, dim)
+            nVec = processConstant(n, Tvec)
+
+            # different cases with respect to the known flow properties
+            # p / d**n = const & p = d * R * T -> d ~ T**(1/(n-1))
+            if nonZero(pIn):
+                dIn = processConstant(air.d(T=Tin, p=pIn), Tvec)
+                dVec = (Tvec / processConstant(Tin, Tvec))**(1/(nVec-1)) * dIn
+            elif nonZero(pOut):
+                dOut = processConstant(air.d(T=Tout, p=pOut), Tvec)
+                dVec = (Tvec / processConstant(Tout, Tvec))**(1/(nVec-1)) * dOut
+            else:
+                print('input error on pressure in: ', name)
+
             # pressure computation
             # !!! PYroMat does not allow the inverse computation of p through the density 
             # !!! in order to solve this issue ideal gas relation has been used for the computation of p
-            pVec[ii] = Tvec[ii] * (R / air.mw()) * dVec[ii] 
+            pVec = Tvec * (R / air.mw()) * dVec 
 
-        # enthaply and entropy vector allocation
-        hVec = np.zeros([dim])
-        sVec = np.zeros([dim])
-        
-        # enthalpy and entropy computation
-        for ii in range(dim):
-            hVec[ii] = air.h(T=Tvec[ii], p=pVec[ii])
-            sVec[ii] = air.s(T=Tvec[ii], p=pVec[ii])
+            # enthalpy and entropy computation
+            hVec = air.h(T=Tvec, p=pVec)
+            sVec = air.s(T=Tvec, p=pVec)
 
-    else:
-        print('input error in: ', name)
+        else:
+            print('input error in: ', name)
 
     # plotting transformation 
     if plot:
-        plt.plot(sVec, hVec, color=color, label=name)
+        plt.plot(np.transpose(sVec), np.transpose(hVec), color=color, label=name)
 
-    # initial values
-    hIn = hVec[0]
-    sIn = sVec[0]
-    pIn = pVec[0]
-    Tin = Tvec[0]
-
-    # final values
-    hOut = hVec[-1]
-    sOut = sVec[-1]
-    pOut = pVec[-1]
-    Tout = Tvec[-1]
+    # initial and final values
+    [hIn, sIn, pIn, Tin], [hOut, sOut, pOut, Tout] = processEnds(hVec, sVec, pVec, Tvec)
 
     # printing of useful values
-    print('+++++++++++++++++++++++++++++++++++++++++++')
-    print('Polytropic transformation: ', name)
-    print('-- n = {0}'.format(n))
-    print('-- R = {0:f}'.format(R))
-    print('-- Initial values:')
-    print('\ts = {0:>10.3f} {1:s}/{2:s}'.format(sIn, unit_energy, unit_mass))
-    print('\th = {0:>10.3f} {1:s}/{2:s}'.format(hIn, unit_energy, unit_mass))
-    print('\tp = {0:>10.3f} {1:s}'.format(pIn, unit_pressure))
-    print('\tT = {0:>10.3f} {1:s}'.format(Tin, unit_temperature))
-    print('-- Final values:')
-    print('\ts = {0:>10.3f} {1:s}/{2:s}'.format(sOut, unit_energy, unit_mass))
-    print('\th = {0:>10.3f} {1:s}/{2:s}'.format(hOut, unit_energy, unit_mass))
-    print('\tp = {0:>10.3f} {1:s}'.format(pOut, unit_pressure))
-    print('\tT = {0:>10.3f} {1:s}'.format(Tout, unit_temperature))
-    print('+++++++++++++++++++++++++++++++++++++++++++\n')
+    if printout:
+        printProcess('Polytropic', name, [hIn, sIn, pIn, Tin], [hOut, sOut, pOut, Tout], unit_energy, unit_mass, unit_pressure, unit_temperature, info={'n': n, 'R': R})
+
+    if path:
+        return [hIn, sIn, pIn, Tin], [hOut, sOut, pOut, Tout], {'h': hVec, 's': sVec, 'p': pVec, 'T': Tvec}
 
     return [hIn, sIn, pIn, Tin], [hOut, sOut, pOut, Tout]
 
-def adiabatic(eta=1,pIn=0,pOut=0,Tin=0,s=0,dim=100,name='adiabatic',color='k',plot=True):
+def adiabatic(eta=1,pIn=0,pOut=0,Tin=0,s=0,dim=100,name='adiabatic',color='k',plot=True,gas=None,printout=True,path=False):
     '''
     Adiabatic transformation plot
+        -- many processes can be computed at once: the inputs are arrays [nProcesses] and the paths are [nProcesses, dim]
+           (i.e. the rotor process of each blade section)
 
         function inputs:
             eta     -- transformation efficiency 
@@ -448,114 +477,71 @@ def adiabatic(eta=1,pIn=0,pOut=0,Tin=0,s=0,dim=100,name='adiabatic',color='k',pl
             name    -- transformation name
             color   -- plotting color
             plot    -- boolean for plotting
+            gas     -- pyromat gas backend (see gasBackend.pyromatGas) -> None: shared default backend
+            printout -- boolean for printing 
+            path    -- boolean for the output of the paths {'h', 's', 'p', 'T'}
     '''
 
-    # getting air data
-    global air 
+    # getting air data -> the backend units are set only inside the unit context
+    gas = getGas(gas)
 
     # getting dimensions
-    global unit_energy, unit_mass, unit_pressure, unit_temperature
+    unit_energy, unit_mass, unit_pressure, unit_temperature = gas.unit('energy'), gas.unit('mass'), gas.unit('pressure'), gas.unit('temperature')
 
     # checking if the transformation is for a compressor or a turbine
-    if pOut > pIn: 
-        # compressor
-        process = 'compression'
-    elif pOut < pIn:
-        # turbine 
-        process = 'expansion'
-    else:
+    process = np.where(np.greater(pOut, pIn), 'compression', 'expansion')
+    if np.any(np.equal(pOut, pIn)):
         print('input error in: ', name)
 
     # generation of pressure vector 
-    pVec = np.linspace(pIn, pOut, dim)
-
-    # enthalpy computation 
-    if Tin != 0 or s != 0:
-        if Tin !=0 :    
-            # entropy computation -- isentropic transformation 
-            s = air.s(T=Tin, p=pIn)
+    pVec = processPath(pIn, pOut, dim)
+
+    # pyromat computations -> backend units
+    with gas.unitContext() as air:
+        # enthalpy computation 
+        if nonZero(Tin) or nonZero(s):
+            if nonZero(Tin):    
+                # entropy computation -- isentropic transformation 
+                s = air.s(T=Tin, p=pIn)
         
-        # temperature vector allocation -- isentropic transformation
-        Tvec_is = np.zeros([dim])
-
-        # temperature computation -- isentropic transformation
-        for ii, p in enumerate(pVec):
-            Tvec_is[ii] = air.T_s(s=s, p=p)
-
-        # enthalpy vector allocation -- isentropic transformation
-        hVec_is = np.zeros([dim])
-
-        # enthalpy computation -- isentropic transformation
-        for ii in range(dim):
-            hVec_is[ii] = air.h(T=Tvec_is[ii], p=pVec[ii])
+            # temperature computation -- isentropic transformation
+            Tvec_is = air.T_s(s=processConstant(s, pVec), p=pVec)
 
-        # enthaply vector allocation -- real transformation 
-        hVec = np.zeros([dim])
+            # enthalpy computation -- isentropic transformation
+            hVec_is = air.h(T=Tvec_is, p=pVec)
 
-        # enthalpy computation -- real transformation 
-        if pOut < pIn:
+            # enthalpy computation -- real transformation 
             # if the trasformation is relative to a turbine
-            # eta = (h1 - h2) / (h1 - h2_is)
-            # h2 = eta * h2_is + (1 - eta) * h1
-            for ii in range(dim):
-                hVec[ii] = eta * hVec_is[ii] + (1 - eta) * hVec_is[0]
-        elif pIn < pOut: 
+            #   eta = (h1 - h2) / (h1 - h2_is)
+            #   h2 = eta * h2_is + (1 - eta) * h1
             # if the transformation is relative to a compressor
-            # eta = (h2_is - h1) / (h2 - h1)
-            # h2 = (h2_is - h1) / eta + h1
-            for ii in range(dim):
-                hVec[ii] = ( hVec_is[ii] - hVec_is[0] ) / eta + hVec_is[0]
-        else:
-            print('input error in: ', name)
-
-        # temperature vector allocation -- real transformation 
-        Tvec = np.zeros([dim])
+            #   eta = (h2_is - h1) / (h2 - h1)
+            #   h2 = (h2_is - h1) / eta + h1
+            etaVec = processConstant(eta, pVec)
+            hIs0 = hVec_is[...,:1]
+            hVec = np.where(processConstant(np.less(pOut, pIn), pVec), etaVec * hVec_is + (1 - etaVec) * hIs0, ( hVec_is - hIs0 ) / etaVec + hIs0)
 
-        # temperature computation -- real transformation 
-        for ii in range(dim):
-            Tvec[ii] = air.T_h(h=hVec[ii],p=pVec[ii])
+            # temperature computation -- real transformation 
+            Tvec = air.T_h(h=hVec,p=pVec)
 
-        # entropy vector allocation -- real transformation 
-        sVec = np.zeros([dim])
-
-        # entropy computation -- real transformation 
-        for ii in range(dim):
-            sVec[ii] = air.s(T=Tvec[ii], p=pVec[ii])
+            # entropy computation -- real transformation 
+            sVec = air.s(T=Tvec, p=pVec)
   
-    else:
-        print('input error in: ', name)
+        else:
+            print('input error in: ', name)
 
     # plotting transformation 
     if plot:
-        plt.plot(sVec, hVec, color=color, label=name)
+        plt.plot(np.transpose(sVec), np.transpose(hVec), color=color, label=name)
 
-    # initial values
-    hIn = hVec[0]
-    sIn = sVec[0]
-    pIn = pVec[0]
-    Tin = Tvec[0]
-
-    # final values
-    hOut = hVec[-1]
-    sOut = sVec[-1]
-    pOut = pVec[-1]
-    Tout = Tvec[-1]
+    # initial and final values
+    [hIn, sIn, pIn, Tin], [hOut, sOut, pOut, Tout] = processEnds(hVec, sVec, pVec, Tvec)
 
     # printing of useful values
-    print('+++++++++++++++++++++++++++++++++++++++++++')
-    print('Adiabatic transformation: ', name)
-    print('-- eta     = {0}'.format(eta))
-    print('-- process = {0:s}'.format(process))
-    print('-- Initial values:')
-    print('\ts = {0:>10.3f} {1:s}/{2:s}'.format(sIn, unit_energy, unit_mass))
-    print('\th = {0:>10.3f} {1:s}/{2:s}'.format(hIn, unit_energy, unit_mass))
-    print('\tp = {0:>10.3f} {1:s}'.format(pIn, unit_pressure))
-    print('\tT = {0:>10.3f} {1:s}'.format(Tin, unit_temperature))
-    print('-- Final values:')
-    print('\ts = {0:>10.3f} {1:s}/{2:s}'.format(sOut, unit_energy, unit_mass))
-    print('\th = {0:>10.3f} {1:s}/{2:s}'.format(hOut, unit_energy, unit_mass))
-    print('\tp = {0:>10.3f} {1:s}'.format(pOut, unit_pressure))
-    print('\tT = {0:>10.3f} {1:s}'.format(Tout, unit_temperature))
-    print('+++++++++++++++++++++++++++++++++++++++++++\n')
+    if printout:
+        printProcess('Adiabatic', name, [hIn, sIn, pIn, Tin], [hOut, sOut, pOut, Tout], unit_energy, unit_mass, unit_pressure, unit_temperature, info={'eta    ': eta, 'process': process})
+
+    if path:
+        return [hIn, sIn, pIn, Tin], [hOut, sOut, pOut, Tout], {'h': hVec, 's': sVec, 'p': pVec, 'T': Tvec}
 
     return [hIn, sIn, pIn, Tin], [hOut, sOut, pOut, Tout]
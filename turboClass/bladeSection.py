@@ -4,10 +4,15 @@
 # PROGRAM DESCRIPTION
 #   TURBOMACHINERY DESIGN CLASS:
 #       this script sets the rotor/stator class for the turbomachinery desing analisys 
+#       -- section      : single span section object
+#       -- SectionArray : span sections of a blade stored as float64 columns [nSection] (one array for each quantity)
+#                         -> SectionArray[ii] returns a sectionView of the ii-th section: SectionArray[ii].Va reads/writes the Va column 
+#                         -> the solvers can work directly on the columns (see SectionArray.column)
 #       
 
 # importing libraries
 import numpy as np 
+from thermoTransf.flowState import flowState, perfectGas
 
 class section:
     '''
@@ -66,26 +71,29 @@ class section:
         self.W    = np.sqrt(self.Wa**2 + self.Wt**2)
         self.beta = np.rad2deg(np.arctan(self.Wt/self.Wa))
 
-    def allocateThermodynamics(self, Tt, Pt, T, P, Ttr, Ptr, rho, rhot, rhotr, s, R=287.06, gamma=1.4):
+    def allocateThermodynamics(self, Tt, Pt, T, P, Ttr, Ptr, rho, rhot, rhotr, s, R=287.06, gamma=1.4, gas=None):
         '''
         This function computes the thermodynamic properties of a specific point in the blade.
             inputs:
                 Tt  -- total temperature
                 Pt  -- total pressure 
+                gas -- gas model -> None: perfectGas(R, gamma)
         '''
 
-        # cP computation
-        cP = gamma / (gamma - 1) * R
+        # flow state -> sound speed and mach numbers
+        if gas is None:
+            gas = perfectGas(R=R, gamma=gamma)
+        state = flowState(gas, T=T, Tt=Tt, V=self.V, W=self.W)
 
         # thermodynamic properties computation
         self.s     = s 
         self.T     = T 
-        self.Tr    = Tt - self.W**2/(2 * cP)
+        self.Tr    = gas.staticTemperature(Tt, self.W)
         self.Tt    = Tt
         self.Ttr   = Ttr
-        self.a     = np.sqrt(gamma * R * self.T)
-        self.M     = self.V / self.a  
-        self.Mr    = self.W / self.a 
+        self.a     = state.a
+        self.M     = state.M  
+        self.Mr    = state.Mr 
         self.P     = P 
         self.Pt    = Pt 
         self.Ptr   = Ptr
@@ -126,4 +134,186 @@ class section:
         # mass flux computation
         massFlux = np.pi * (self.tip**2 - self.bottom**2) * self.rho * self.Va
 
-        return massFlux 
\ No newline at end of file
+        return massFlux 
+
+class sectionView(section):
+    '''
+    Section object of a SectionArray: the quantities are read from and written into the SectionArray columns.
+    '''
+
+    __slots__ = ('store', 'index')
+
+    def __init__(self, store, index):
+        '''
+        Section view declaration:
+            variables:
+                store   -- SectionArray object
+                index   -- section index
+        '''
+
+        object.__setattr__(self, 'store', store)
+        object.__setattr__(self, 'index', index)
+
+    def __getattr__(self, name):
+        # section quantity from the store columns
+        columns = object.__getattribute__(self, 'store').columns
+        if name in columns.keys():
+            return columns[name][object.__getattribute__(self, 'index')]
+
+        raise AttributeError('section object has no attribute {0}'.format(name))
+
+    def __setattr__(self, name, value):
+        # section quantity into the store columns
+        self.store.setValue(name, self.index, value)
+
+class SectionArray:
+    '''
+    Blade span sections stored as columns, it is used instead of a list of section objects.
+        AIM:
+            --- each quantity is a contiguous float64 array [nSection] -> small memory footprint and vectorized solvers 
+            --- SectionArray[ii].name works as for the section object (see sectionView)
+    '''
+
+    def __init__(self, midpoint, bottom, tip, height, pitch, solidity=1, tbc=0.1):
+        '''
+        Section array declaration: 
+            variables:
+                midpoint    -- sections midpoint [nSection]
+                bottom      -- sections lowest point [nSection]
+                tip         -- sections highest point [nSection]
+                height      -- sections height -> float or [nSection]
+                pitch       -- sections pitch -> float or [nSection]
+                solidity    -- sections solidity -> float or [nSection]
+                tbc         -- sections thickness / chord -> float or [nSection]
+        '''
+
+        self.nSection = np.size(midpoint)
+        self.columns  = {}
+
+        # position 
+        self.setColumn('midpoint', midpoint)
+        self.setColumn('bottom',   bottom)
+        self.setColumn('tip',      tip)
+        self.setColumn('height',   height)
+        self.setColumn('pitch',    pitch)
+        self.setColumn('solidity', solidity)
+        self.setColumn('tbc',      tbc)
+        self.setColumn('Cl',       0.0)
+        self.setColumn('s',        0.0)
+        self.setColumn('rD',       0.0)
+        self.setColumn('theta',    0)
+        self.setColumn('i',        0)
+
+    def __len__(self):
+        return self.nSection
+
+    def __getitem__(self, index):
+        # list of sections 
+        if isinstance(index, slice):
+            return [sectionView(self, ii) for ii in range(*index.indices(self.nSection))]
+
+        # single section
+        if index < 0:
+            index = index + self.nSection
+        if index < 0 or index >= self.nSection:
+            raise IndexError('section index out of range.')
+
+        return sectionView(self, int(index))
+
+    def __iter__(self):
+        for ii in range(self.nSection):
+            yield sectionView(self, ii)
+
+    def column(self, name):
+        '''
+        This function returns the column of a quantity -> the array is not copied: the changes are stored in the sections.
+        '''
+
+        if name not in self.columns.keys():
+            raise AttributeError('section object has no attribute {0}'.format(name))
+
+        return self.columns[name]
+
+    def setColumn(self, name, values):
+        '''
+        This function sets the column of a quantity.
+            inputs:
+                name    -- quantity name 
+                values  -- float or [nSection] array 
+        '''
+
+        self.columns[name] = np.array(np.broadcast_to(np.asarray(values, dtype=float), (self.nSection,)))
+
+    def setValue(self, name, index, value):
+        '''
+        This function sets the quantity of a single section -> the missing columns are allocated with NaN values.
+        '''
+
+        if name not in self.columns.keys():
+            self.columns[name] = np.full(self.nSection, np.nan)
+
+        self.columns[name][index] = value
+
+    def allocateKinetics(self, Va, Vt, U):
+        '''
+        This function allocates the velocity vectors of all the sections (see section.allocateKinetics).
+            inputs:
+                Va  -- axial flow [nSection]
+                Vt  -- tangential flow [nSection]
+                U   -- rotation speed [nSection]
+        '''
+
+        # rotation speed 
+        self.setColumn('U', U)
+
+        # absolute quantities
+        self.setColumn('Va',    Va)
+        self.setColumn('Vt',    Vt)
+        self.setColumn('V',     np.sqrt(self.columns['Va']**2 + self.columns['Vt']**2))
+        self.setColumn('alpha', np.rad2deg(np.arctan(self.columns['Vt']/self.columns['Va'])))
+
+        # relative quantities 
+        self.setColumn('Wa',   self.columns['Va'])
+        self.setColumn('Wt',   self.columns['Vt'] - self.columns['U'])
+        self.setColumn('W',    np.sqrt(self.columns['Wa']**2 + self.columns['Wt']**2))
+        self.setColumn('beta', np.rad2deg(np.arctan(self.columns['Wt']/self.columns['Wa'])))
+
+    def allocateThermodynamics(self, Tt, Pt, T, P, Ttr, Ptr, rho, rhot, rhotr, s, R=287.06, gamma=1.4, gas=None):
+        '''
+        This function computes the thermodynamic properties of all the sections (see section.allocateThermodynamics).
+            inputs:
+                Tt  -- total temperature [nSection]
+                Pt  -- total pressure [nSection]
+                gas -- gas model -> None: perfectGas(R, gamma)
+        '''
+
+        # flow state -> sound speed and mach numbers
+        if gas is None:
+            gas = perfectGas(R=R, gamma=gamma)
+        state = flowState(gas, T=T, Tt=Tt, V=self.columns['V'], W=self.columns['W'])
+
+        # thermodynamic properties computation
+        self.setColumn('s',     s)
+        self.setColumn('T',     T)
+        self.setColumn('Tr',    gas.staticTemperature(Tt, self.columns['W']))
+        self.setColumn('Tt',    Tt)
+        self.setColumn('Ttr',   Ttr)
+        self.setColumn('a',     state.a)
+        self.setColumn('M',     state.M)
+        self.setColumn('Mr',    state.Mr)
+        self.setColumn('P',     P)
+        self.setColumn('Pt',    Pt)
+        self.setColumn('Ptr',   Ptr)
+        self.setColumn('rho',   rho)
+        self.setColumn('rhot',  rhot)
+        self.setColumn('rhotr', rhotr)
+
+    def mFlux(self):
+        '''
+        This function computes the mass flux in the stream tubes [nSection] (see section.mFlux).
+        '''
+
+        # mass flux computation
+        massFlux = np.pi * (self.columns['tip']**2 - self.columns['bottom']**2) * self.columns['rho'] * self.columns['Va']
+
+        return massFlux
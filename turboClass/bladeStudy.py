@@ -34,6 +34,7 @@ def bladeStudy(rIn, rOut, omega, rMean, VaMean, VtMeanIn, VtMeanOut, Leu, Tt0, T
             printout    -- boolean value for the printing of the computed quantities 
             gamma       -- specific heat ratio
             R           -- gas constant
+        the inputs can be arrays with the same shape -> the outputs have the shape of the inputs
     '''
 
     # cP computation
@@ -47,16 +48,12 @@ def bladeStudy(rIn, rOut, omega, rMean, VaMean, VtMeanIn, VtMeanOut, Leu, Tt0, T
     U0 = omega * rIn
 
     # phi computation 
-    if U0 != 0:
-        phi = Va0 / U0
-    else: 
-        phi = 0
+    with np.errstate(invalid='ignore', divide='ignore'):
+        phi = np.where(U0 != 0, Va0 / U0, 0)[()]
 
     # psi computation 
-    if Leu != 0:
-        psi = Leu / U0**2 
-    else: 
-        psi = 0 
+    with np.errstate(invalid='ignore', divide='ignore'):
+        psi = np.where(Leu != 0, Leu / U0**2, 0)[()]
 
     # lam computation 
     lam = psi * 2 
@@ -165,10 +162,8 @@ def bladeStudy(rIn, rOut, omega, rMean, VaMean, VtMeanIn, VtMeanOut, Leu, Tt0, T
     rhot1 = Pt1 / (R * Tt1)
 
     # reaction degree computation 
-    if Leu != 0:
-        rD = cP * (T1 - T0) / Leu 
-    else: 
-        rD = 0
+    with np.errstate(invalid='ignore', divide='ignore'):
+        rD = np.where(Leu != 0, cP * (T1 - T0) / Leu, 0)[()]
 
     if printout:
         printLength = 54
@@ -0,0 +1,596 @@
+# TURBOMACHINERY -- DESIGN SPACE EXPLORATION
+# AUTHOR: antonio pucciarelli
+#
+# PROGRAM DESCRIPTION
+#   DESIGN OF EXPERIMENTS LIBRARY:
+#       this script runs the compressor stage design chain (compressorDesign.py) over a set of design points
+#           -- design points generation: full factorial grid or latin hypercube sampling
+#           -- design chain: mean line (meanLine) -> rotor NISRE -> stator NISRE (stageBlades) -> stage efficiency -> shared with compressorDesign.py
+#           -- the design points are split into chunks that are computed by a process pool
+#           -- each chunk is stored as .npz file in the results folder -> an interrupted run resumes from the missing chunks
+#
+
+# importing libraries
+import os
+import glob
+import contextlib
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+# repository root -> the design chain reads the airfoil data with relative paths
+rootPath = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# design variables
+designDtype = np.dtype([('rD',            float),  # mean line reaction degree
+                        ('rMean',         float),  # stage mean radius
+                        ('Vt0Umean',      float),  # rotor inlet Vt0/Umean
+                        ('nRotorBlades',  int),    # rotor # of blades
+                        ('nStatorBlades', int),    # stator # of blades
+                        ('ARrotor',       float),  # rotor aspect ratio
+                        ('ARstator',      float),  # stator aspect ratio
+                        ('nSection',      int)])   # # of blade sections
+
+# design results
+resultNames = ['etaStage', 'etaMean', 'etaRotor', 'etaStator', 'omega', 'rpm', 'b0', 'hubRadius', 'rTip', 'rotorLoss', 'statorLoss']
+
+class meanLineError(ValueError):
+    '''
+    Error raised when the mean line of a design point cannot be computed.
+    '''
+    pass
+
+# design status codes
+designStatus = {0: 'ok',
+                1: 'mean line not computed',
+                2: 'blade design failure'}
+
+def meanLine(rD, rMean, Vt0Umean, mFlux=100, betaP=1.45, Pt0=1e+5, Tt0=300, omegaFactor=1.05, etaRotor=0.82, printout=False, save=False):
+    '''
+    This function computes the mean line quantities used by the rotor/stator design chain.
+        inputs:
+            rD          -- reaction degree
+            rMean       -- stage mean radius -> radius @ inlet blade midspan
+            Vt0Umean    -- rotor inlet Vt0/Umean
+            mFlux       -- mass flux
+            betaP       -- total pressure ratio
+            Pt0         -- inlet total pressure
+            Tt0         -- inlet total temperature
+            omegaFactor -- rotor angular velocity correction factor with respect to the mean line value
+            etaRotor    -- rotor efficiency used for the rotor outlet tangential velocity
+            printout    -- boolean value for the similarity.stageProperties printout
+            save        -- boolean value for the similarity.stageProperties figures saving
+                        -- the stage cache (similarity.stageMemo) is used when printout and save are False
+        output:
+            mean        -- dictionary of the mean line quantities used by stageBlades
+    '''
+
+    # importing libraries
+    from turboCoeff import similarity
+
+    # Vt0 = (1 - rD - lam/4) * Umean -> lam = 4 * (1 - rD - Vt0/Umean)
+    # psi = lam / 2
+    lam = (1 - rD - Vt0Umean) * 4
+    psiTarget = lam / 2
+
+    # generation of mean line properties
+    adimVec, bladeVec, rotationVec, V0vec, V1vec, V2vec, _, _, _, _, _, _, work = similarity.stageProperties(rD, psiTarget, rMean, mFlux, Tt0, Pt0, betaP, T1real=True, printout=printout, save=save, cache=True)
+
+    # mean line check
+    if not np.all(np.isfinite(adimVec + bladeVec + rotationVec + V0vec + V1vec + V2vec + work)):
+        raise meanLineError('The mean line of the stage cannot be computed.')
+
+    # values allocation
+    Lis       = work[1]
+    # rotation -> the rotor angular velocity is changed slightly in order to have better rotor outlet velocity distribution
+    omega     = rotationVec[1] * omegaFactor
+    # blade dimension
+    b0        = bladeVec[0]
+    hubRadius = rMean - b0/2
+    # rotor outlet tangential velocity -> the eta computed by similarity.stageProperties doesn't fit the actual efficiency of the stage
+    rotorVtMeanOutlet = Lis/etaRotor / (rMean * omega) + V0vec[1]
+
+    # computing mixed vortex design parameter
+    WtTarget = 0
+    bVal = (WtTarget + omega * hubRadius - rotorVtMeanOutlet * rMean/hubRadius)/(hubRadius - rMean**2/hubRadius)
+
+    # mean line quantities allocation
+    mean = {'rMean'             : rMean,
+            'eta'               : adimVec[2],
+            'omega'             : omega,
+            'b0'                : b0,
+            'hubRadius'         : hubRadius,
+            'rotorVaMeanInlet'  : V0vec[0],
+            'rotorVtMeanInlet'  : V0vec[1],
+            'rotorVaMeanOutlet' : V1vec[0],
+            'rotorVtMeanOutlet' : rotorVtMeanOutlet,
+            'statorVaMeanOutlet': V2vec[0],
+            'statorVtMeanOutlet': V2vec[1],
+            'bVal'              : bVal}
+
+    return mean
+
+def stageBlades(mean, nRotorBlades, nStatorBlades, ARrotor, ARstator, nSection, mFlux=100, Pt0=1e+5, Tt0=300, VtTarget=30, STL=False, figures=False):
+    '''
+    This function computes the rotor and stator blades of a stage from its mean line -> rotor NISRE -> stator NISRE.
+        inputs:
+            mean            -- dictionary of the mean line quantities -> meanLine output
+            nRotorBlades    -- rotor # of blades
+            nStatorBlades   -- stator # of blades
+            ARrotor         -- rotor aspect ratio
+            ARstator        -- stator aspect ratio
+            nSection        -- # of blade sections
+            mFlux           -- mass flux
+            Pt0             -- inlet total pressure
+            Tt0             -- inlet total temperature
+            VtTarget        -- stator outlet tangential velocity at the hub
+            STL             -- boolean value for the rotor.stl/stator.stl generation
+            figures         -- boolean value for the meridional flow and velocity triangles figures saving
+        output:
+            rotorBlade      -- rotor blade object
+            statorBlade     -- stator blade object
+            rotorLossVec    -- rotor loss vector
+            statorLossVec   -- stator loss vector
+            etaRotorBlade   -- rotor efficiency
+            etaStatorBlade  -- stator efficiency
+    '''
+
+    # importing libraries
+    from turboClass import turboBlade
+
+    # mean line values allocation
+    rMean     = mean['rMean']
+    omega     = mean['omega']
+    b0        = mean['b0']
+    hubRadius = mean['hubRadius']
+
+    # rotor study
+    # rotor object generation
+    print('\n\n-- ROTOR STUDY -- # blades {0:d}'.format(nRotorBlades))
+    rotorBlade = turboBlade.blade(ID=1, turboType='rotor', nSection=nSection, inletBladeHeight=b0, outletBladeHeight=b0, inletHubRadius=hubRadius, outletHubRadius=hubRadius, omega=omega, nBlade=nRotorBlades)
+    # allocate blade shape
+    rotorBlade.allocateShape(bladeHeight=b0, AR=ARrotor, nBlade=nRotorBlades)
+    # blade dimensions allocation -> kinetics inlet
+    rotorBlade.allocateKinetics(rMean=rMean, VtMean=mean['rotorVtMeanInlet'], VaMean=mean['rotorVaMeanInlet'], omega=omega, section='inlet', kind='FV')
+    # blade dimensions allocation -> kinetics outlet
+    rotorBlade.allocateKinetics(rMean2=rMean, Vt2=mean['rotorVtMeanOutlet'], VaMean=mean['rotorVaMeanOutlet'], omega=omega, section='outlet', kind='MVD', b=mean['bVal'])
+    # blade dimensions allocation -> thermodynamics inlet/outlet
+    rotorBlade.allocateThermodynamics(Tt0=Tt0, Pt0=Pt0, eta=mean['eta'])
+    # rotor blade geometry allocation
+    rotorSTL = 'rotor' if STL else None
+    rotorBlade.generateGeometry(pos='data/airfoils/naca65.txt', STLname=rotorSTL, plot=False, printout=False)
+    # computing the best shape
+    rotorLossVec = rotorBlade.bladeGenerator(mFlux, clearance=1e-3, NISRE=True, STLname=rotorSTL, plot=False, nMaxShape=1)
+    if figures:
+        # plotting meridional flow
+        rotorBlade.printMeridional(save=True, position0='latex/figures/rotorEntropyFlow.pdf', position1='latex/figures/rotorBetaThermo.pdf')
+        # plotting velocity triangles
+        rotorBlade.velocityTriangles(sectionNumber=[0, int(nSection/2-1), nSection-1], save=True, position='latex/figures/rotorVelocityTriangle.pdf')
+    # computing efficiency
+    etaRotorBlade = rotorBlade.computeBladeEfficiency(Va=mean['rotorVaMeanOutlet'], lossVec=rotorLossVec)
+
+    # stator study
+    # stator object generation
+    print('\n\n-- STATOR STUDY -- # blades {0:d}'.format(nStatorBlades))
+    statorBlade = turboBlade.blade(ID=2, turboType='stator', nSection=nSection, inletBladeHeight=b0, outletBladeHeight=b0, inletHubRadius=hubRadius, outletHubRadius=hubRadius, omega=0, nBlade=nStatorBlades)
+    # allocate blade shape
+    statorBlade.allocateShape(bladeHeight=b0, AR=ARstator, nBlade=nStatorBlades)
+    # blade dimensions allocation
+    # copying data from rotor blade outlet into stator blade inlet
+    statorBlade.copySection(blade=rotorBlade, fromSection='outlet', toSection='inlet')
+    statorBlade.copySection(blade=rotorBlade, fromSection='outlet', toSection='outlet')
+
+    # setting up velocity distribution at the stator outlet
+    def func(r):
+        '''
+        This is the velocity distribution function.
+            VtTarget sets the hub constraint                | -> a second order function is defined
+            statorVtMean = 0 sets the mean line constraint  | ->
+
+        '''
+        a = 4 * VtTarget / b0**2
+        Vtnew = a * (r - rMean)**2
+
+        return Vtnew
+
+    # setting up stator outlet kinematics
+    statorBlade.allocateKinetics(rMean=rMean, VtMean=mean['statorVtMeanOutlet'], VaMean=mean['statorVaMeanOutlet'], omega=0, section='outlet', kind='eqn', func=func)
+    # stator blade geometry allocation
+    statorSTL = 'stator' if STL else None
+    statorBlade.generateGeometry(pos='data/airfoils/naca65.txt', STLname=statorSTL, plot=False, printout=False)
+    # computing the best shape
+    statorLossVec = statorBlade.bladeGenerator(mFlux, clearance=0, NISRE=True, STLname=statorSTL, plot=False, nMaxShape=1, nMaxFlux=100, nMaxS=1)
+    if figures:
+        # plotting meridional quantities
+        statorBlade.printMeridional(save=True, position0='latex/figures/statorEntropyFlow.pdf', position1='latex/figures/statorBetaThermo.pdf')
+        # plotting velocity triangle
+        statorBlade.velocityTriangles(sectionNumber=[0, int(nSection/2-1), nSection-1], save=True, position='latex/figures/statorVelocityTriangle.pdf')
+    # computing efficiency
+    etaStatorBlade = statorBlade.computeBladeEfficiency(Va=mean['statorVaMeanOutlet'], lossVec=statorLossVec)
+
+    return rotorBlade, statorBlade, rotorLossVec, statorLossVec, etaRotorBlade, etaStatorBlade
+
+def stageDesign(design, mFlux=100, betaP=1.45, Pt0=1e+5, Tt0=300, omegaFactor=1.05, etaRotor=0.82, VtTarget=30):
+    '''
+    This function computes a compressor stage following the compressorDesign.py procedure without generating files.
+        inputs:
+            design      -- design point -> designDtype element or dictionary with the designDtype names
+            mFlux       -- mass flux
+            betaP       -- total pressure ratio
+            Pt0         -- inlet total pressure
+            Tt0         -- inlet total temperature
+            omegaFactor -- rotor angular velocity correction factor with respect to the mean line value
+            etaRotor    -- rotor efficiency used for the rotor outlet tangential velocity
+            VtTarget    -- stator outlet tangential velocity at the hub
+        output:
+            result      -- dictionary of the design results (see resultNames)
+    '''
+
+    # importing libraries
+    from turboCoeff import coeff
+
+    # mean line computation
+    mean = meanLine(float(design['rD']), float(design['rMean']), float(design['Vt0Umean']), mFlux=mFlux, betaP=betaP, Pt0=Pt0, Tt0=Tt0, omegaFactor=omegaFactor, etaRotor=etaRotor)
+
+    # rotor and stator study
+    rotorBlade, statorBlade, rotorLossVec, statorLossVec, etaRotorBlade, etaStatorBlade = stageBlades(mean, int(design['nRotorBlades']), int(design['nStatorBlades']), float(design['ARrotor']), float(design['ARstator']), int(design['nSection']), mFlux=mFlux, Pt0=Pt0, Tt0=Tt0, VtTarget=VtTarget)
+
+    # computing stage efficiency
+    etaStage = coeff.stageEfficiency(rotorBlade, statorBlade)
+
+    # results allocation
+    result = {'etaStage'  : etaStage,
+              'etaMean'   : mean['eta'],
+              'etaRotor'  : etaRotorBlade,
+              'etaStator' : etaStatorBlade,
+              'omega'     : mean['omega'],
+              'rpm'       : mean['omega'] * 60 / (2 * np.pi),
+              'b0'        : mean['b0'],
+              'hubRadius' : mean['hubRadius'],
+              'rTip'      : mean['hubRadius'] + mean['b0'],
+              'rotorLoss' : np.mean(rotorLossVec),
+              'statorLoss': np.mean(statorLossVec)}
+
+    return result
+
+def designChunk(samples, index, constants=None, logFile=os.devnull):
+    '''
+    This function computes a chunk of design points.
+        inputs:
+            samples     -- design points -> designDtype array
+            index       -- design points index in the design space
+            constants   -- dictionary of the stageDesign constant inputs (mFlux, betaP, Pt0, Tt0, ...) -> None: stageDesign default values
+            logFile     -- file where the design chain printouts are redirected
+        output:
+            data        -- dictionary of arrays: 'index', 'status', 'message' + one array for each resultNames
+    '''
+
+    # constant inputs
+    if constants is None:
+        constants = {}
+
+    # data allocation
+    nSamples = len(samples)
+    data = {'index': np.asarray(index), 'status': np.zeros(nSamples, dtype=np.uint8), 'message': np.full(nSamples, '', dtype=object)}
+    for name in resultNames:
+        data[name] = np.full(nSamples, np.nan)
+
+    with open(logFile, 'a') as file:
+        with contextlib.redirect_stdout(file):
+            for ii in range(nSamples):
+                print('\n\n-- DESIGN POINT {0:d}'.format(int(data['index'][ii])))
+                try:
+                    result = stageDesign(samples[ii], **constants)
+                    for name in resultNames:
+                        data[name][ii] = result[name]
+                except meanLineError as error:
+                    data['status'][ii]  = 1
+                    data['message'][ii] = str(error)
+                except Exception as error:
+                    # the NISRE loops can fail for not feasible blades -> the design point is stored as failed
+                    data['status'][ii]  = 2
+                    data['message'][ii] = '{0}: {1}'.format(type(error).__name__, error)
+
+    # message array conversion -> unicode array for the .npz storage
+    data['message'] = data['message'].astype(str)
+
+    return data
+
+def designGrid(grid):
+    '''
+    This function generates the full factorial design points.
+        inputs:
+            grid        -- dictionary of the design variables values {name: 1D array} -> all the designDtype names are needed
+        output:
+            samples     -- design points -> designDtype array
+    '''
+
+    # grid check
+    for name in designDtype.names:
+        if name not in grid.keys():
+            raise ValueError('Missing design variable: {0}.'.format(name))
+
+    # full factorial grid
+    mesh = np.meshgrid(*[np.atleast_1d(grid[name]) for name in designDtype.names], indexing='ij')
+
+    # design points allocation
+    samples = np.zeros(mesh[0].size, dtype=designDtype)
+    for ii, name in enumerate(designDtype.names):
+        samples[name] = mesh[ii].ravel()
+
+    return samples
+
+def designSampling(bounds, nSamples, seed=None):
+    '''
+    This function generates the design points with the latin hypercube sampling.
+        inputs:
+            bounds      -- dictionary of the design variables bounds {name: [min, max]} -> all the designDtype names are needed
+                        -- integer variables are rounded
+            nSamples    -- # of design points
+            seed        -- random generator seed
+        output:
+            samples     -- design points -> designDtype array
+    '''
+
+    # importing libraries
+    from scipy.stats import qmc
+
+    # bounds check
+    for name in designDtype.names:
+        if name not in bounds.keys():
+            raise ValueError('Missing design variable: {0}.'.format(name))
+
+    # unit hypercube sampling
+    unitSamples = qmc.LatinHypercube(d=len(designDtype.names), seed=seed).random(nSamples)
+
+    # design points allocation
+    samples = np.zeros(nSamples, dtype=designDtype)
+    for ii, name in enumerate(designDtype.names):
+        values = bounds[name][0] + unitSamples[:,ii] * (bounds[name][1] - bounds[name][0])
+        if samples.dtype[name].kind == 'i':
+            values = np.round(values)
+        samples[name] = values
+
+    return samples
+
+def chunkPath(folder, ii):
+    '''
+    This function returns the path of the ii-th chunk file.
+    '''
+
+    return os.path.join(folder, 'chunk_{0:06d}.npz'.format(ii))
+
+def designRunner(samples, folder='doe/', constants=None, chunkSize=8, nWorkers=None, log=False, printout=True):
+    '''
+    This function computes the design points with a process pool.
+    The results are stored in folder as chunks of design points: an interrupted run resumes computing only the missing chunks.
+        inputs:
+            samples     -- design points -> designDtype array
+            folder      -- results folder
+            constants   -- dictionary of the stageDesign constant inputs (mFlux, betaP, Pt0, Tt0, ...) -> None: stageDesign default values
+            chunkSize   -- # of design points for each chunk
+            nWorkers    -- # of processes -> None uses all the local cores
+            log         -- boolean value for the saving of the design chain printouts as chunk_<ii>.log
+            printout    -- boolean value for the printing of the run progress
+        output:
+            data        -- dictionary of arrays with the computed design points (see designLoading)
+    '''
+
+    # results folder generation
+    os.makedirs(folder, exist_ok=True)
+
+    # design points check -> the folder has to store the same design space
+    samplesPath = os.path.join(folder, 'samples.npy')
+    if os.path.exists(samplesPath):
+        if not np.array_equal(np.load(samplesPath), samples):
+            raise ValueError('The folder {0} stores the results of different design points.'.format(folder))
+    else:
+        np.save(samplesPath, samples)
+
+    # missing chunks
+    nChunks = int(np.ceil(len(samples) / chunkSize))
+    missing = [ii for ii in range(nChunks) if not os.path.exists(chunkPath(folder, ii))]
+
+    if printout:
+        starDim = 40
+        titleDim = int((starDim - len(' DESIGN RUNNER '))/2)
+        print('*' * titleDim + ' DESIGN RUNNER ' + '*' * titleDim)
+        print('-- # design points  = {0:>9d}'.format(len(samples)))
+        print('-- # chunks         = {0:>9d}'.format(nChunks))
+        print('-- # missing chunks = {0:>9d}'.format(len(missing)))
+
+    if len(missing) > 0:
+        # the workers run in the repository root -> relative data paths
+        with ProcessPoolExecutor(max_workers=nWorkers, initializer=os.chdir, initargs=(rootPath,)) as pool:
+            # chunks submission
+            futures = {}
+            for ii in missing:
+                index   = np.arange(ii * chunkSize, min((ii + 1) * chunkSize, len(samples)))
+                logFile = os.path.abspath(chunkPath(folder, ii).replace('.npz', '.log')) if log else os.devnull
+                futures[pool.submit(designChunk, samples[index], index, constants, logFile)] = ii
+
+            # chunks saving -> temporary file + renaming, an interrupted writing does not leave broken chunks
+            for counter, future in enumerate(as_completed(futures)):
+                ii = futures[future]
+                data = future.result()
+                with open(chunkPath(folder, ii) + '.tmp', 'wb') as file:
+                    np.savez(file, **data)
+                os.replace(chunkPath(folder, ii) + '.tmp', chunkPath(folder, ii))
+
+                if printout:
+                    print('-- chunk {0:>6d} done -- {1:>6d}/{2:d}'.format(ii, counter + 1, len(missing)))
+
+    if printout:
+        print('*' * starDim + '\n')
+
+    return designLoading(folder)
+
+def designLoading(folder='doe/'):
+    '''
+    This function loads the design points computed by designRunner.
+        inputs:
+            folder      -- results folder
+        output:
+            data        -- dictionary of arrays sorted by design point index:
+                            -- 'samples' : computed design points -> designDtype array
+                            -- 'index'   : design point index
+                            -- 'status'  : design status code (see designStatus)
+                            -- 'message' : error message of the failed design points
+                            -- one array for each resultNames
+    '''
+
+    # chunk files
+    files = sorted(glob.glob(os.path.join(folder, 'chunk_*.npz')))
+
+    # data concatenation
+    names = ['index', 'status', 'message'] + resultNames
+    data  = {name: [] for name in names}
+    for file in files:
+        with np.load(file) as chunk:
+            for name in names:
+                data[name].append(chunk[name])
+
+    if len(files) > 0:
+        data = {name: np.concatenate(data[name]) for name in names}
+    else:
+        data = {name: np.array([]) for name in names}
+        data['index'] = data['index'].astype(int)
+
+    # sorting by design point index
+    order = np.argsort(data['index'])
+    data  = {name: data[name][order] for name in names}
+
+    # design points
+    data['samples'] = np.load(os.path.join(folder, 'samples.npy'))[data['index']]
+
+    return data
+
+# mean line screening limits
+screenLimits = {'rTip'        : 0.45,   # maximum tip radius                        [m]
+                'b0'          : 0.05,   # minimum rotor inlet blade height          [m]
+                'eta'         : 0.85,   # minimum mean line efficiency              [--]
+                'MrTip'       : 1.2,    # maximum rotor inlet relative Mach @ tip   [--]
+                'M1hub'       : 1.0,    # maximum stator inlet Mach @ hub           [--]
+                'deHaller'    : 0.7,    # minimum rotor W1/W0 @ hub, mean, tip      [--]
+                'rDhub'       : 0.0,    # minimum reaction degree @ hub             [--]
+                'deltaBetaHub': 70.0}   # maximum rotor flow deflection @ hub       [deg]
+
+def designScreening(samples, constants=None, limits=None, printout=False):
+    '''
+    This function screens the design points with the mean line properties and the free vortex hub/tip sections.
+    The screening is vectorized over the design points and does not run the NISRE.
+        inputs:
+            samples     -- design points -> designDtype array
+            constants   -- dictionary of the stageDesign constant inputs -> mFlux, betaP, Pt0, Tt0 are used, None: stageDesign default values
+            limits      -- dictionary of the screening limits that replace the screenLimits values -> None: screenLimits values
+            printout    -- boolean value for the printing of the screening results
+        output:
+            screen      -- dictionary of arrays [nSamples]:
+                            -- 'meanLine' : the mean line can be computed (psi reachable with the stagePerf limits)
+                            -- one boolean array for each screenLimits check
+                            -- 'feasible' : the design point passes all the checks
+                            -- 'etaMean'  : mean line efficiency -> screening score
+    '''
+
+    # importing libraries
+    from turboCoeff import similarity
+
+    # constant inputs and limits
+    if constants is None:
+        constants = {}
+    if limits is None:
+        limits = {}
+
+    # limits allocation
+    for name in limits.keys():
+        if name not in screenLimits.keys():
+            raise ValueError('Unknown screening limit: {0}. Allowed limits: {1}.'.format(name, ', '.join(screenLimits.keys())))
+    limits = dict(screenLimits, **limits)
+
+    # mean line constants -> stageDesign default values
+    meanConstants = {'mFlux': 100, 'betaP': 1.45, 'Pt0': 1e+5, 'Tt0': 300}
+    for name in meanConstants.keys():
+        if name in constants.keys():
+            meanConstants[name] = constants[name]
+
+    # mean line and hub/tip sections computation -> the design points are a single sweep axis
+    sweep = similarity.stageSweep({'rD': samples['rD']}, dict({'rMean': samples['rMean'], 'Vt0Umean': samples['Vt0Umean']}, **meanConstants), sections=True, T1real=True, cache=True)
+    hub   = sweep['hub']
+    tip   = sweep['tip']
+
+    with np.errstate(invalid='ignore'):
+        # checks -> not computed quantities are NaN and do not pass the checks
+        screen = {'meanLine'    : sweep['reason'] != 1,
+                  'rTip'        : sweep['rTip'] <= limits['rTip'],
+                  'b0'          : sweep['b0'] >= limits['b0'],
+                  'eta'         : sweep['eta'] >= limits['eta'],
+                  'MrTip'       : tip['Mr0'] <= limits['MrTip'],
+                  'M1hub'       : hub['M1'] <= limits['M1hub'],
+                  'deHaller'    : (np.sqrt(sweep['Wa1']**2 + sweep['Wt1']**2) / np.sqrt(sweep['Wa0']**2 + sweep['Wt0']**2) >= limits['deHaller']) & (hub['W1'] / hub['W0'] >= limits['deHaller']) & (tip['W1'] / tip['W0'] >= limits['deHaller']),
+                  'rDhub'       : hub['rD'] >= limits['rDhub'],
+                  'deltaBetaHub': np.abs(hub['beta1'] - hub['beta0']) <= limits['deltaBetaHub']}
+
+    # feasible design points
+    feasible = sweep['valid']
+    for name in screenLimits.keys():
+        feasible = feasible & screen[name]
+    screen['feasible'] = feasible & screen['meanLine']
+    screen['etaMean']  = sweep['eta']
+
+    if printout:
+        starDim = 40
+        titleDim = int((starDim - len(' DESIGN SCREENING '))/2)
+        print('*' * titleDim + ' DESIGN SCREENING ' + '*' * titleDim)
+        print('-- # design points  = {0:>9d}'.format(len(samples)))
+        print('-- mean line        = {0:>9d}'.format(int(np.sum(screen['meanLine']))))
+        for name in screenLimits.keys():
+            print('-- {0:<16} = {1:>9d} -- limit = {2:.3f}'.format(name, int(np.sum(screen[name])), limits[name]))
+        print('-- feasible         = {0:>9d}'.format(int(np.sum(screen['feasible']))))
+        print('*' * (2 * titleDim + len(' DESIGN SCREENING ')) + '\n')
+
+    return screen
+
+def screenedRunner(samples, folder='doe/', constants=None, limits=None, survivorFraction=0.1, chunkSize=8, nWorkers=None, log=False, printout=True):
+    '''
+    This function computes the design points with a multi fidelity approach:
+        1. mean line screening of all the design points (see designScreening)
+        2. the feasible design points are ranked by the mean line efficiency 
+        3. only the best survivorFraction of the design points goes through the design chain (see designRunner)
+        inputs:
+            samples             -- design points -> designDtype array
+            folder              -- results folder
+            constants           -- dictionary of the stageDesign constant inputs (mFlux, betaP, Pt0, Tt0, ...) -> None: stageDesign default values
+            limits              -- dictionary of the screening limits that replace the screenLimits values -> None: screenLimits values
+            survivorFraction    -- maximum fraction of the design points computed by the design chain
+            chunkSize           -- # of design points for each chunk
+            nWorkers            -- # of processes -> None uses all the local cores
+            log                 -- boolean value for the saving of the design chain printouts
+            printout            -- boolean value for the printing of the screening and run progress
+        output:
+            data                -- dictionary of arrays with the computed design points (see designLoading)
+                                    -- 'sampleIndex' : index of the computed design points in samples
+            screen              -- dictionary of the screening results (see designScreening)
+                                    -- 'survivor' : the design point goes through the design chain
+    '''
+
+    # mean line screening
+    screen = designScreening(samples, constants=constants, limits=limits, printout=printout)
+
+    # ranking of the feasible design points -> higher mean line efficiency first
+    feasibleIndex = np.flatnonzero(screen['feasible'])
+    order         = np.argsort(- screen['etaMean'][feasibleIndex], kind='stable')
+    nSurvivors    = min(len(feasibleIndex), int(np.ceil(survivorFraction * len(samples))))
+    sampleIndex   = np.sort(feasibleIndex[order[:nSurvivors]])
+
+    # survivors allocation
+    screen['survivor'] = np.zeros(len(samples), dtype=bool)
+    screen['survivor'][sampleIndex] = True
+
+    # screening results saving
+    os.makedirs(folder, exist_ok=True)
+    np.savez(os.path.join(folder, 'screening.npz'), samples=samples, **screen)
+
+    # design chain of the survivors
+    data = designRunner(samples[sampleIndex], folder=folder, constants=constants, chunkSize=chunkSize, nWorkers=nWorkers, log=log, printout=printout)
+    data['sampleIndex'] = sampleIndex[data['index']]
+
+    return data, screen
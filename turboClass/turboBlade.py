@@ -12,7 +12,7 @@ import matplotlib.pyplot     as plt
 from scipy                   import integrate, interpolate
 from scipy.misc              import derivative
 from turboCoeff              import lieblein, losses
-from turboClass.bladeSection import section
+from turboClass.bladeSection import SectionArray
 
 class blade:
     '''
@@ -376,24 +376,25 @@ class blade:
         '''
 
         # computing main quantities 
-        sectionVec = []
         height     = bladeHeight/nSection
+        ii         = np.arange(nSection)
+
+        # sections generation -> all the sections are computed at once
+        if hubRadius != 0:
+            midpoint = hubRadius + ii * height + height / 2 
+            bottom   = hubRadius + ii * height
+            tip      = hubRadius + (ii+1) * height
+            pitch    = 2 * np.pi * midpoint / self.nBlade
+        elif tipRadius != 0:
+            midpoint = tipRadius - ii * height - height/2
+            bottom   = tipRadius - (ii+1) * height
+            tip      = tipRadius - ii * height 
+            pitch    = 2 * np.pi * midpoint / self.nBlade
+        else:
+            raise ValueError('Input error: hubRadius or tipRadius must be set.')
 
-        # loop generation for the section generation
-        for ii in range(nSection):
-            if hubRadius != 0:
-                midpoint = hubRadius + ii * height + height / 2 
-                bottom   = hubRadius + ii * height
-                tip      = hubRadius + (ii+1) * height
-                pitch    = 2 * np.pi * midpoint / self.nBlade
-            elif tipRadius != 0:
-                midpoint = tipRadius - ii * height - height/2
-                bottom   = tipRadius - (ii+1) * height
-                tip      = tipRadius - ii * height 
-                pitch    = 2 * np.pi * midpoint / self.nBlade
-
-            # appending section object to the vector 
-            sectionVec.append(section(midpoint, bottom, tip, height, pitch))
+        # section array allocation -> sectionVec[ii] works as a section object
+        sectionVec = SectionArray(midpoint, bottom, tip, height, pitch)
 
         if plot:
             fig = plt.figure(figsize=(8,8))
@@ -538,89 +539,64 @@ class blade:
         #        print('alpha   = ', self.outletSection[ii].beta)
         #        print('Vt      = ', self.outletSection[ii].Vt)
 
-    def allocateThermodynamics(self, Tt0=0, Pt0=0, eta=1, R=287.06, gamma=1.4):
+    def allocateThermodynamics(self, Tt0=0, Pt0=0, eta=1, R=287.06, gamma=1.4, gas=None):
         '''
         This function allocates the thermodynamic properties to each section.
             inputs:
-                Tt0     -- inlet total temperature 
+                Tt0     -- inlet total temperature -> Tt0 = Pt0 = 0: the inlet section total quantities are used 
                 Pt0     -- inlet total pressure 
                 Leu     -- real euler work  
                 eta     -- stage efficiency   
+                gas     -- gas model (see thermoTransf.flowState.perfectGas, thermoTransf.gasTable.tabulatedGas) -> None: perfectGas(R, gamma)
         '''
 
-        # cP computation
-        cP = gamma / (gamma - 1) * R
-
-        for ii in range(self.nSection):
-            # check if the thermodynamics properites are not already computed for the inlet section
-            if Tt0 == 0 and Pt0 == 0:
-                Tt0 = self.inletSection[ii].Tt
-                Pt0 = self.inletSection[ii].Pt
+        # importing libraries 
+        from turboCoeff import reductions
+        from thermoTransf.flowState import flowState, perfectGas
 
-            # temperature computation 
-            T0 = Tt0 - self.inletSection[ii].V**2 / (2 * cP)
+        # gas model 
+        if gas is None:
+            gas = perfectGas(R=R, gamma=gamma)
 
-            # pressure computation
-            P0 = Pt0 * (T0/Tt0)**(gamma/(gamma-1))
+        # check if the thermodynamics properites are not already computed for the inlet section
+        if Tt0 == 0 and Pt0 == 0:
+            Tt0 = reductions.sectionArray(self.inletSection, 'Tt')
+            Pt0 = reductions.sectionArray(self.inletSection, 'Pt')
 
-            # density computation 
-            rho0 = P0 / (R * T0)
+        # section kinetics
+        V0 = reductions.sectionArray(self.inletSection, 'V')
+        W0 = reductions.sectionArray(self.inletSection, 'W')
+        V1 = reductions.sectionArray(self.outletSection, 'V')
+        W1 = reductions.sectionArray(self.outletSection, 'W')
 
-            # total density computation
-            rhot0 = Pt0 / (R * Tt0)
+        # inlet flow state -> static, total and relative total quantities 
+        inlet = flowState(gas, Tt=Tt0 + np.zeros(self.nSection), Pt=Pt0 + np.zeros(self.nSection), V=V0, W=W0)
 
-            # Tt0r computation
-            Tt0r = Tt0 - self.inletSection[ii].V**2 / (2 * cP) + self.inletSection[ii].W**2 / (2 * cP)
-
-            # relative total pressure computation
-            Pt0r = Pt0 * (Tt0r / Tt0)**(gamma/(gamma-1))
-
-            # computing total relative density 
-            rhot0r = Pt0r / (R * Tt0r)
-
-            # euler work computation 
-            if self.turboType == 'stator':
-                Leu = 0.0
-            else: 
-                Leu = self.outletSection[ii].U * self.outletSection[ii].Vt - self.inletSection[ii].U * self.inletSection[ii].Vt
-
-            # total temperature computation
-            Tt1 = Leu / cP + Tt0
-
-            # ideal temperature computation if the process is completely 
-            # isentropic without losses but the work produced is related 
-            # to a process that takes into account losses in the stage  
-            T1 = Tt1 - self.outletSection[ii].V**2 / (2 * cP)
-
-            # T1/Tt1 isentropic computation 
-            #   this correction activates only if eta != 1
-            T1iso = T0 + eta * (T1 - T0)
-            Tt1iso = Tt0 + eta * (Tt1 - Tt0)
-
-            # pressure computation
-            P1 = Pt0 * (T1iso/Tt0)**(gamma/(gamma-1))
-
-            # total pressure computation
-            Pt1 = Pt0 * (Tt1iso/Tt0)**(gamma/(gamma-1))
-
-            # Ttr1 computation
-            Tt1r = Tt1 - self.outletSection[ii].V**2 / (2 * cP) + self.outletSection[ii].W**2 / (2 * cP)
+        # euler work computation 
+        if self.turboType == 'stator':
+            Leu = np.zeros(self.nSection)
+        else: 
+            Leu = reductions.sectionArray(self.outletSection, 'U') * reductions.sectionArray(self.outletSection, 'Vt') - reductions.sectionArray(self.inletSection, 'U') * reductions.sectionArray(self.inletSection, 'Vt')
 
-            # relative total pressure computation
-            Pt1r = Pt1 * (Tt1r / Tt1)**(gamma/(gamma-1))
+        # total temperature computation
+        Tt1 = gas.temperatureChange(inlet.Tt, Leu)
 
-            # density computation 
-            rho1 = P1 / (R * T1)
+        # ideal temperature computation if the process is completely 
+        # isentropic without losses but the work produced is related 
+        # to a process that takes into account losses in the stage  
+        T1 = gas.staticTemperature(Tt1, V1)
 
-            # total density computation
-            rhot1 = Pt1 / (R * Tt1)
+        # T1/Tt1 isentropic computation 
+        #   this correction activates only if eta != 1
+        T1iso = gas.temperatureChange(inlet.T, eta * gas.enthalpyChange(inlet.T, T1))
+        Tt1iso = gas.temperatureChange(inlet.Tt, eta * gas.enthalpyChange(inlet.Tt, Tt1))
 
-            # computing total relative density 
-            rhot1r = Pt1r / (R * Tt1r)
+        # outlet flow state -> static and total pressure from the isentropic temperatures 
+        outlet = flowState(gas, Tt=Tt1, T=T1, P=gas.isentropicPressure(inlet.Pt, inlet.Tt, T1iso), Pt=gas.isentropicPressure(inlet.Pt, inlet.Tt, Tt1iso), V=V1, W=W1)
 
-            # variable allocation in section objects            
-            self.inletSection[ii].allocateThermodynamics(Tt=Tt0, Pt=Pt0, T=T0, P=P0, Ttr=Tt0r, Ptr=Pt0r, rho=rho0, rhot=rhot0, rhotr=rhot0r, s=self.inletSection[ii].s)
-            self.outletSection[ii].allocateThermodynamics(Tt=Tt1, Pt=Pt1, T=T1, P=P1, Ttr=Tt1r, Ptr=Pt1r, rho=rho1, rhot=rhot1, rhotr=rhot1r, s=self.outletSection[ii].s)
+        # variable allocation in the section columns            
+        self.inletSection.allocateThermodynamics(Tt=inlet.Tt, Pt=inlet.Pt, T=inlet.T, P=inlet.P, Ttr=inlet.Ttr, Ptr=inlet.Ptr, rho=inlet.rho, rhot=inlet.rhot, rhotr=inlet.rhotr, s=self.inletSection.column('s'), R=R, gamma=gamma, gas=gas)
+        self.outletSection.allocateThermodynamics(Tt=outlet.Tt, Pt=outlet.Pt, T=outlet.T, P=outlet.P, Ttr=outlet.Ttr, Ptr=outlet.Ptr, rho=outlet.rho, rhot=outlet.rhot, rhotr=outlet.rhotr, s=self.outletSection.column('s'), R=R, gamma=gamma, gas=gas)
 
     def allocateShape(self, bladeHeight, AR, nBlade):
         '''
@@ -660,7 +636,7 @@ class blade:
                 self.outletSection[ii].pitch    = pitch 
                 self.outletSection[ii].solidity = solidity
 
-    def radialEquilibrium(self, mFlux, clearance, nMaxS=100, nMaxFlux=100, tolS=0.2, tolFlux=1e-2, NISRE=True, plot=False, save=False, position0='entropyFlow.pgf', position1='betaThermo.pgf', R=287.06, gamma=1.4):
+    def radialEquilibrium(self, mFlux, clearance, nMaxS=100, nMaxFlux=100, tolS=0.2, tolFlux=1e-2, NISRE=True, plot=False, save=False, position0='entropyFlow.pgf', position1='betaThermo.pgf', R=287.06, gamma=1.4, gas=None):
         '''
         This function computes the radial equilibrium of the section taking into account losses. 
             inputs:
@@ -677,6 +653,7 @@ class blade:
                 position1   -- saving path for the last figure 
                 R           -- gas constant 
                 gamma       -- specific heat ratio 
+                gas         -- gas model (see thermoTransf.flowState.perfectGas, thermoTransf.gasTable.tabulatedGas) -> None: perfectGas(R, gamma)
             
             function steps:
                 1. setting up variables
@@ -700,8 +677,16 @@ class blade:
                     2.4. computing new flow thermodynamic properties 
         '''         
     
+        # importing libraries 
+        from turboCoeff import reductions
+        from thermoTransf.flowState import flowState, perfectGas
+
+        # gas model 
+        if gas is None:
+            gas = perfectGas(R=R, gamma=gamma)
+
         # cP computation
-        cP = gamma / (gamma - 1) * R
+        cP = gas.cP
 
         # omega 
         omega = self.omega 
@@ -803,8 +788,11 @@ class blade:
                 # ds2 / dr
                 ds2 = derivative(s2, t, dx=dx, n=1, order=3)
 
+                # outlet static temperature -> h(T2) = h(Tt1) + omega * (rVt2 - rVt1) - (Va2**2 + Vt2**2) / 2
+                T2 = gas.temperatureChange(Tt1(t), omega * (rVt2(t) - rVt1(t)) - (y + Vt2(t)**2) / 2)
+
                 # y derivative computation
-                dydt = 2 * (y / (2 * cP) * ds2 - Tt1(t) * ds2 - omega * rVt2(t) / cP * ds2  + omega * rVt1(t) / cP * ds2 + Vt2(t)**2 / (2 * cP) * ds2 - Vt2(t) / t * drVt2 +  dTt1 + omega * drVt2 - omega * drVt1)
+                dydt = 2 * (- T2 * ds2 - Vt2(t) / t * drVt2 +  dTt1 + omega * drVt2 - omega * drVt1)
 
                 return dydt 
             
@@ -902,11 +890,11 @@ class blade:
                 if self.turboType == 'rotor':
                     self.outletSection[ii].Ptr = self.inletSection[ii].Ptr - lossVec[ii] * (self.inletSection[ii].Ptr - self.inletSection[ii].P)
                     # entropy computation
-                    self.outletSection[ii].s = self.inletSection[ii].s - R * np.log(self.outletSection[ii].Ptr / self.inletSection[ii].Ptr) 
+                    self.outletSection[ii].s = self.inletSection[ii].s - gas.R * np.log(self.outletSection[ii].Ptr / self.inletSection[ii].Ptr) 
                 elif self.turboType == 'stator':
                     self.outletSection[ii].Pt = self.inletSection[ii].Pt - lossVec[ii] * (self.inletSection[ii].Pt - self.inletSection[ii].P)
                     # entropy computation
-                    self.outletSection[ii].s = self.inletSection[ii].s - R * np.log(self.outletSection[ii].Pt / self.inletSection[ii].Pt) 
+                    self.outletSection[ii].s = self.inletSection[ii].s - gas.R * np.log(self.outletSection[ii].Pt / self.inletSection[ii].Pt) 
 
             # storing new s2 
             s2new = [self.outletSection[ii].s for ii in range(self.nSection)]
@@ -945,56 +933,31 @@ class blade:
                     Va2[ii] = np.sqrt(Va2_squared[ii])
 
                 # outlet section dynamics allocation
-                for ii in range(self.nSection):
-                    self.outletSection[ii].allocateKinetics(Va2[ii], self.outletSection[ii].Vt, self.outletSection[ii].U)
+                self.outletSection.allocateKinetics(Va2, self.outletSection.column('Vt'), self.outletSection.column('U'))
 
                 # computing all the new thermodynamic quantities after the radial equilibrium is satisfied
-                # computing change in total pressure due to losses 
-                for ii in range(self.nSection): 
-                    # static temperature computation
-                    self.outletSection[ii].T = self.outletSection[ii].Tt - self.outletSection[ii].V**2 / (2 * cP)
-
-                    # rotor and stator work with different total pressures
-                    # rotor -> total relative pressure
-                    # stator -> total pressure 
-                    if self.turboType == 'rotor':
-                        # total relative temperature computation
-                        #print(self.outletSection[ii].V**2 - self.outletSection[ii].W**2)
-                        self.outletSection[ii].Ttr = self.outletSection[ii].Tt - (self.outletSection[ii].V**2 - self.outletSection[ii].W**2) / (2 * cP)
-                        # total pressure computation 
-                        self.outletSection[ii].Pt = self.outletSection[ii].Ptr * (self.outletSection[ii].Tt/self.outletSection[ii].Ttr)**(gamma/(gamma-1))
-                        # static pressure computation
-                        self.outletSection[ii].P = self.outletSection[ii].Pt * (self.outletSection[ii].T/self.outletSection[ii].Tt)**(gamma/(gamma-1))
-                        # static density computation
-                        self.outletSection[ii].rho = self.outletSection[ii].P / (R * self.outletSection[ii].T)
-                        # total density computation
-                        self.outletSection[ii].rhot = self.outletSection[ii].Pt / (R * self.outletSection[ii].Tt)
-                        # total relative density computation 
-                        self.outletSection[ii].rhotr = self.outletSection[ii].Ptr / (R * self.outletSection[ii].Ttr)
-                        # sound speed computation 
-                        self.outletSection[ii].a = np.sqrt(gamma * R * self.outletSection[ii].T)
-                        # mach number computation
-                        self.outletSection[ii].M = self.outletSection[ii].V / self.outletSection[ii].a
-                        # relative mach number computation
-                        self.outletSection[ii].Mr = self.outletSection[ii].W / self.outletSection[ii].a
-                    elif self.turboType == 'stator':
-                        # static pressure computation
-                        self.outletSection[ii].P = self.outletSection[ii].Pt * (self.outletSection[ii].T/self.outletSection[ii].Tt)**(gamma/(gamma-1))
-                        # static density computation
-                        self.outletSection[ii].rho = self.outletSection[ii].P / (R * self.outletSection[ii].T)
-                        # total density computation
-                        self.outletSection[ii].rhot = self.outletSection[ii].Pt / (R * self.outletSection[ii].Tt)
-                        # sound speed computation 
-                        self.outletSection[ii].a = np.sqrt(gamma * R * self.outletSection[ii].T)
-                        # mach number computation
-                        self.outletSection[ii].M = self.outletSection[ii].V / self.outletSection[ii].a
-
-                        # printing
+                # rotor and stator work with different total pressures
+                # rotor -> total relative pressure
+                # stator -> total pressure 
+                V = reductions.sectionArray(self.outletSection, 'V')
+                Tt = reductions.sectionArray(self.outletSection, 'Tt')
+                if self.turboType == 'rotor':
+                    # outlet flow state from the relative total pressure 
+                    W = reductions.sectionArray(self.outletSection, 'W')
+                    state = flowState(gas, Tt=Tt, Ptr=reductions.sectionArray(self.outletSection, 'Ptr'), V=V, W=W)
+                    names = ['T', 'Ttr', 'Pt', 'P', 'rho', 'rhot', 'rhotr', 'a', 'M', 'Mr']
+                elif self.turboType == 'stator':
+                    # outlet flow state from the total pressure
+                    state = flowState(gas, Tt=Tt, Pt=reductions.sectionArray(self.outletSection, 'Pt'), V=V)
+                    names = ['T', 'P', 'rho', 'rhot', 'a', 'M']
+
+                # section allocation 
+                values = state.fields(names)
+                for name, value in zip(names, values):
+                    self.outletSection.setColumn(name, value)
 
                 # check mass flux 
-                newFlux = 0
-                for ii in range(self.nSection):
-                    newFlux = newFlux + self.outletSection[ii].mFlux()
+                newFlux = np.sum(self.outletSection.mFlux())
 
                 # relative mass flux error
                 relErrorFlux = np.abs(newFlux - mFlux) / mFlux
@@ -1039,13 +1002,17 @@ class blade:
 
         return lossVec
 
-    def generateGeometry(self, pos='/data/airfoils/naca65.txt', STLname='cad', plot=False, printout=False):
+    def generateGeometry(self, pos='/data/airfoils/naca65.txt', STLname='cad', plot=False, printout=False, indexedMesh=None, checkMesh=False, lodLevels=()):
         '''
         This function generates the blade shape given already computed flow angles.
             * the geometry sections will be the midsections relative to the streamtubes. 
             * the only exception made is relative to the hub and tip streamtubes; in this case
                 the section considered are no more the midsections but the tip section (tip streamtube)
                 and the bottom section (hub streamtube).
+            * indexedMesh = ply/obj also saves the blade as indexed mesh next to the .stl file.
+            * checkMesh = True checks the blade mesh; the check report is stored in self.meshReport.
+            * lodLevels = (1, 2) also saves the decimated blade meshes (1/4 and 1/16 of the triangles) as <STLname>_lod<level>.stl.
+            * STLname = None does not save any mesh file (e.g. design space exploration).
         '''
 
         # importing libraries
@@ -1242,8 +1209,11 @@ class blade:
             plt.title('Blade')
             plt.show()
 
-        # STL file generation 
-        bladeGenerator.STLsaving(self.blade, STLname=STLname, kind=self.turboType)
+        # STL file generation -> STLname = None skips the file generation
+        if STLname is not None:
+            self.meshReport = bladeGenerator.STLsaving(self.blade, STLname=STLname, kind=self.turboType, indexedMesh=indexedMesh, check=checkMesh, lodLevels=lodLevels)
+        else:
+            self.meshReport = None
 
     def computeLosses(self, mFlux, clearance=3e-3, variableSpeed=False):
         '''
@@ -1350,12 +1320,15 @@ class blade:
 
         return lossVec
 
-    def bladeGenerator(self, mFlux, clearance=3e-3, NISRE=True, STLname='cad', relTolShape=1e-3, nMaxShape=100, nMaxFlux=100, nMaxS=10, plot=False):
+    def bladeGenerator(self, mFlux, clearance=3e-3, NISRE=True, STLname='cad', relTolShape=1e-3, nMaxShape=100, nMaxFlux=100, nMaxS=10, plot=False, indexedMesh=None, gas=None):
         '''
         This function computes the final shape of a blade given blade number and total inlet quantites.
             inputs:
                 mFlu        -- mass flux
                 clearance   -- rotor tip clearance 
+                STLname     -- blade .stl file name -> None for no file generation
+                indexedMesh -- None/ply/obj => the blade is also saved as indexed mesh
+                gas         -- gas model of the radial equilibrium (see radialEquilibrium) -> None: perfect gas
 
             function steps:
                 1. setting up loop tolerances and storing variables for the error check
@@ -1387,10 +1360,10 @@ class blade:
             print('-' * geometryDim + ' SHAPE ITERATION {0:d} '.format(counterShape) + '-' * geometryDim)
 
             # blade design through iterative process on radial equilibrium 
-            lossVec = self.radialEquilibrium(mFlux=mFlux, clearance=clearance, NISRE=NISRE, plot=plot, nMaxFlux=nMaxFlux, nMaxS=nMaxS)
+            lossVec = self.radialEquilibrium(mFlux=mFlux, clearance=clearance, NISRE=NISRE, plot=plot, nMaxFlux=nMaxFlux, nMaxS=nMaxS, gas=gas)
 
             # rotor blade geometry allocation
-            self.generateGeometry(pos='data/airfoils/naca65.txt', STLname=STLname, plot=False, printout=False)
+            self.generateGeometry(pos='data/airfoils/naca65.txt', STLname=STLname, plot=False, printout=False, indexedMesh=indexedMesh)
 
             # allocating Cl vector 
             for ii in range(self.nSection):
@@ -1465,10 +1438,14 @@ class blade:
         print('-- minimum rho*            = {0:>8.3f} kg/m3 -- minimum W*          = {1:>8.3f} m/s'.format(np.min(rhotrVec), np.min(WrVec)))
         print('*' * starDim)
 
-    def copySection(self, blade, fromSection='outlet', toSection='inlet'):
+    def copySection(self, blade, fromSection='outlet', toSection='inlet', resample=None, R=287.06, gamma=1.4, gas=None):
         '''
         This function copies the properties of blade another section. 
-        The blades must have the same number of sections. The interpolation of data is not available (till now).
+            -- same sections (nSection, hub and tip radii): the section columns are copied at once 
+            -- different sections: the stream tubes are resampled conserving the mass flow rate (see reductions.sectionRemap)
+                -- Tt, Pt, s, gamma and r*Vt are mass averaged on the new stream tubes 
+                -- Va is computed from the mass flow rate of each new stream tube -> the static quantities are computed again with the gas model
+                -- the relative quantities are computed with the source blade speed (blade.omega) 
             input:
                 blade       -- blade source data
                             -- turboBlade object
@@ -1476,143 +1453,91 @@ class blade:
                             -- inlet/outlet
                 toSection   -- name of the section where to store data
                             -- inlet/outlet
+                resample    -- boolean value for the stream tubes resampling 
+                            -- None: the sections are resampled only if they are different
+                gas         -- gas model for the resampling (see thermoTransf.flowState.perfectGas, thermoTransf.gasTable.tabulatedGas) -> None: perfectGas(R, gamma)
         '''
 
-        if fromSection == 'outlet':
-            if toSection == 'inlet':
-                for ii in range(self.nSection):
-                    # kinetics allocation 
-                    Va    = blade.outletSection[ii].Va
-                    Vt    = blade.outletSection[ii].Vt
-                    V     = blade.outletSection[ii].V
-                    alpha = blade.outletSection[ii].alpha
-                    Wa    = blade.outletSection[ii].Wa
-                    Wt    = blade.outletSection[ii].Wt
-                    W     = blade.outletSection[ii].W
-                    beta  = blade.outletSection[ii].beta
-                    # kinetics data allocation
-                    self.inletSection[ii].Va    = Va
-                    self.inletSection[ii].Vt    = Vt
-                    self.inletSection[ii].V     = V
-                    self.inletSection[ii].alpha = alpha
-                    self.inletSection[ii].Wa    = Wa
-                    self.inletSection[ii].Wt    = Wt
-                    self.inletSection[ii].W     = W
-                    self.inletSection[ii].beta  = beta
-                    # thermodynamics allocation 
-                    P     = blade.outletSection[ii].P
-                    T     = blade.outletSection[ii].T
-                    rho   = blade.outletSection[ii].rho
-                    Pt    = blade.outletSection[ii].Pt
-                    Tt    = blade.outletSection[ii].Tt
-                    rhot  = blade.outletSection[ii].rhot
-                    Ptr   = blade.outletSection[ii].Ptr
-                    Ttr   = blade.outletSection[ii].Ttr
-                    rhotr = blade.outletSection[ii].rhotr
-                    a     = blade.outletSection[ii].a
-                    M     = blade.outletSection[ii].M
-                    Mr    = blade.outletSection[ii].Mr
-                    s     = blade.outletSection[ii].s
-                    # thermodynamics data allocation
-                    self.inletSection[ii].P     = P
-                    self.inletSection[ii].T     = T
-                    self.inletSection[ii].rho   = rho
-                    self.inletSection[ii].Pt    = Pt
-                    self.inletSection[ii].Tt    = Tt
-                    self.inletSection[ii].rhot  = rhot
-                    self.inletSection[ii].Ptr   = Ptr
-                    self.inletSection[ii].Ttr   = Ttr
-                    self.inletSection[ii].rhotr = rhotr
-                    self.inletSection[ii].a     = a
-                    self.inletSection[ii].M     = M
-                    self.inletSection[ii].Mr    = Mr
-                    self.inletSection[ii].s     = s
-                    # section shape properties 
-                    gamma = blade.outletSection[ii].gamma
-                    self.inletSection[ii].gamma = gamma
-
-            elif toSection == 'outlet':
-                for ii in range(self.nSection):
-                    # kinetics allocation 
-                    self.outletSection[ii].Va    = blade.outletSection[ii].Va
-                    self.outletSection[ii].Vt    = blade.outletSection[ii].Vt
-                    self.outletSection[ii].V     = blade.outletSection[ii].V
-                    self.outletSection[ii].alpha = blade.outletSection[ii].alpha
-                    self.outletSection[ii].Wa    = blade.outletSection[ii].Wa
-                    self.outletSection[ii].Wt    = blade.outletSection[ii].Wt
-                    self.outletSection[ii].W     = blade.outletSection[ii].W
-                    self.outletSection[ii].beta  = blade.outletSection[ii].beta
-                    # thermodynamics allocation 
-                    self.outletSection[ii].P     = blade.outletSection[ii].P
-                    self.outletSection[ii].T     = blade.outletSection[ii].T
-                    self.outletSection[ii].rho   = blade.outletSection[ii].rho
-                    self.outletSection[ii].Pt    = blade.outletSection[ii].Pt
-                    self.outletSection[ii].Tt    = blade.outletSection[ii].Tt
-                    self.outletSection[ii].rhot  = blade.outletSection[ii].rhot
-                    self.outletSection[ii].Ptr   = blade.outletSection[ii].Ptr
-                    self.outletSection[ii].Ttr   = blade.outletSection[ii].Ttr
-                    self.outletSection[ii].rhotr = blade.outletSection[ii].rhotr
-                    self.outletSection[ii].a     = blade.outletSection[ii].a
-                    self.outletSection[ii].M     = blade.outletSection[ii].M
-                    self.outletSection[ii].Mr    = blade.outletSection[ii].Mr
-                    self.outletSection[ii].s     = blade.outletSection[ii].s
-                    # section shape properties 
-                    self.outletSection[ii].gamma = blade.outletSection[ii].gamma
-        elif fromSection == 'inlet':
-            if toSection == 'inlet':
-                for ii in range(self.nSection):
-                    # kinetics allocation 
-                    self.inletSection[ii].Va    = blade.inletSection[ii].Va
-                    self.inletSection[ii].Vt    = blade.inletSection[ii].Vt
-                    self.inletSection[ii].V     = blade.inletSection[ii].V
-                    self.inletSection[ii].alpha = blade.inletSection[ii].alpha
-                    self.inletSection[ii].Wa    = blade.inletSection[ii].Wa
-                    self.inletSection[ii].Wt    = blade.inletSection[ii].Wt
-                    self.inletSection[ii].W     = blade.inletSection[ii].W
-                    self.inletSection[ii].beta  = blade.inletSection[ii].beta
-                    # thermodynamics allocation 
-                    self.inletSection[ii].P     = blade.inletSection[ii].P
-                    self.inletSection[ii].T     = blade.inletSection[ii].T
-                    self.inletSection[ii].rho   = blade.inletSection[ii].rho
-                    self.inletSection[ii].Pt    = blade.inletSection[ii].Pt
-                    self.inletSection[ii].Tt    = blade.inletSection[ii].Tt
-                    self.inletSection[ii].rhot  = blade.inletSection[ii].rhot
-                    self.inletSection[ii].Ptr   = blade.inletSection[ii].Ptr
-                    self.inletSection[ii].Ttr   = blade.inletSection[ii].Ttr
-                    self.inletSection[ii].rhotr = blade.inletSection[ii].rhotr
-                    self.inletSection[ii].a     = blade.inletSection[ii].a
-                    self.inletSection[ii].M     = blade.inletSection[ii].M
-                    self.inletSection[ii].Mr    = blade.inletSection[ii].Mr
-                    self.inletSection[ii].s     = blade.inletSection[ii].s
-                    # section shape properties 
-                    self.inletSection[ii].gamma = blade.inletSection[ii].gamma
-            elif toSection == 'outlet':
-                for ii in range(self.nSection):
-                    # kinetics allocation 
-                    self.outletSection[ii].Va    = blade.inletSection[ii].Va
-                    self.outletSection[ii].Vt    = blade.inletSection[ii].Vt
-                    self.outletSection[ii].V     = blade.inletSection[ii].V
-                    self.outletSection[ii].alpha = blade.inletSection[ii].alpha
-                    self.outletSection[ii].Wa    = blade.inletSection[ii].Wa
-                    self.outletSection[ii].Wt    = blade.inletSection[ii].Wt
-                    self.outletSection[ii].W     = blade.inletSection[ii].W
-                    self.outletSection[ii].beta  = blade.inletSection[ii].beta
-                    # thermodynamics allocation 
-                    self.outletSection[ii].P     = blade.inletSection[ii].P
-                    self.outletSection[ii].T     = blade.inletSection[ii].T
-                    self.outletSection[ii].rho   = blade.inletSection[ii].rho
-                    self.outletSection[ii].Pt    = blade.inletSection[ii].Pt
-                    self.outletSection[ii].Tt    = blade.inletSection[ii].Tt
-                    self.outletSection[ii].rhot  = blade.inletSection[ii].rhot
-                    self.outletSection[ii].Ptr   = blade.inletSection[ii].Ptr
-                    self.outletSection[ii].Ttr   = blade.inletSection[ii].Ttr
-                    self.outletSection[ii].rhotr = blade.inletSection[ii].rhotr
-                    self.outletSection[ii].a     = blade.inletSection[ii].a
-                    self.outletSection[ii].M     = blade.inletSection[ii].M
-                    self.outletSection[ii].Mr    = blade.inletSection[ii].Mr
-                    self.outletSection[ii].s     = blade.inletSection[ii].s
-                    # section shape properties 
-                    self.outletSection[ii].gamma = blade.inletSection[ii].gamma
+        # importing libraries 
+        import warnings
+        from turboCoeff import reductions
+        from thermoTransf.flowState import flowState, perfectGas
+
+        # sections selection
+        if fromSection not in ['inlet', 'outlet'] or toSection not in ['inlet', 'outlet']:
+            raise ValueError('Input error: fromSection and toSection must be inlet or outlet.')
+        source = getattr(blade, fromSection + 'Section')
+        target = getattr(self, toSection + 'Section')
+
+        # copied quantities 
+        #   kinetics, thermodynamics and section shape properties
+        kinetics       = ['Va', 'Vt', 'V', 'alpha', 'Wa', 'Wt', 'W', 'beta']
+        thermodynamics = ['P', 'T', 'rho', 'Pt', 'Tt', 'rhot', 'Ptr', 'Ttr', 'rhotr', 'a', 'M', 'Mr', 's']
+        shape          = ['gamma']
+
+        # checking sections 
+        if resample is None:
+            resample = not reductions.sameSections(source.column('bottom'), source.column('tip'), target.column('bottom'), target.column('tip'))
+
+        if not resample:
+            # bulk copy of the section columns
+            for name in kinetics + thermodynamics + shape:
+                target.setColumn(name, source.column(name))
+        else:
+            # gas model 
+            if gas is None:
+                gas = perfectGas(R=R, gamma=gamma)
+
+            # stream tubes remap -> mass averaged quantities 
+            values = {name: source.column(name) for name in ['Tt', 'Pt', 's', 'gamma', 'rho']}
+            values['rVt'] = source.column('midpoint') * source.column('Vt')
+            mFlux, values = reductions.sectionRemap(source.column('bottom'), source.column('tip'), values, source.mFlux(), target.column('bottom'), target.column('tip'))
+
+            # new stream tubes geometry 
+            r    = target.column('midpoint')
+            area = np.pi * (target.column('tip')**2 - target.column('bottom')**2)
+
+            # tangential velocity from the angular momentum and source blade speed 
+            Vt = values['rVt'] / r
+            U  = blade.omega * r
+
+            # axial velocity from the mass flow rate -> the density depends on the static temperature (fixed point iterations)
+            rho = values['rho']
+            tolRho = 1e-12
+            nMaxRho = 100
+            counter = 0
+            relError = 1.0
+            while relError > tolRho and counter < nMaxRho:
+                # updating counter
+                counter = counter + 1
+
+                # flow state with the new axial velocity 
+                Va = mFlux / (area * rho)
+                state = flowState(gas, Tt=values['Tt'], Pt=values['Pt'], V=np.sqrt(Va**2 + Vt**2))
+
+                # density error 
+                relError = np.max(np.abs(state.rho - rho) / state.rho)
+                rho = state.rho
+
+            # not converged density -> the last iteration values are used
+            if not relError <= tolRho:
+                warnings.warn('copySection: the stream tubes density did not converge in {0:d} iterations (rel. error = {1:.3e}).'.format(counter, relError), RuntimeWarning, stacklevel=2)
+
+            # kinetics allocation 
+            Va = mFlux / (area * rho)
+            Wt = Vt - U
+            kineticsValues = [Va, Vt, np.sqrt(Va**2 + Vt**2), np.rad2deg(np.arctan(Vt/Va)), Va, Wt, np.sqrt(Va**2 + Wt**2), np.rad2deg(np.arctan(Wt/Va))]
+            for name, value in zip(kinetics, kineticsValues):
+                target.setColumn(name, value)
+
+            # thermodynamics allocation 
+            state = flowState(gas, Tt=values['Tt'], Pt=values['Pt'], V=target.column('V'), W=target.column('W'))
+            for name in thermodynamics[:-1]:
+                target.setColumn(name, getattr(state, name))
+            target.setColumn('s', values['s'])
+
+            # section shape properties 
+            target.setColumn('gamma', values['gamma'])
 
     def velocityTriangles(self, sectionNumber, save=False, position='velocityTriangle.pgf'):
         '''
@@ -1690,94 +1615,104 @@ class blade:
         else:
             plt.show()
 
-    def computeBladeEfficiency(self, Va, lossVec, R=287.06, gamma=1.4):
+    def computeBladeEfficiency(self, Va, lossVec, R=287.06, gamma=1.4, weighting='mass'):
         '''
         This function computes the efficiency of the blade.
             inputs:
-                VaOut   -- isentropic axial outlet speed
+                VaOut     -- isentropic axial outlet speed
+                weighting -- span/area/mass -> ratio between the outlet span averages of the isentropic and the real kinetic energy change (see reductions.sectionRatio)
+                          -- None -> sections mean value of the efficiency
+            output:
+                etaBlade -- blade efficiency 
         '''
 
+        # importing libraries 
+        from turboCoeff import reductions
+
         # cP computation
         cP = gamma / (gamma - 1) * R
 
-        # allocating vector 
-        eta = np.zeros(self.nSection)
+        # section arrays allocation
+        def inlet(name):
+            return reductions.sectionArray(self.inletSection, name)
+        def outlet(name):
+            return reductions.sectionArray(self.outletSection, name)
+        lossVec = np.asarray(lossVec, dtype=float)
 
+        # computing entropy generation through losses -> all the sections at once
+        # new outlet pressure computation -> using losses
         if self.turboType == 'rotor':
             # allocate outlet velocity 
-            VaVec = [self.outletSection[ii].Va for ii in range(self.nSection)]
-            Va = np.max(VaVec)
+            Va = np.max(outlet('Va'))
+
+            # data allocation 
+            T1    = inlet('T')
+            W1    = inlet('W')
+            U1    = inlet('U')
+            W2iso = np.sqrt(outlet('Wt')**2 + Va**2)
+            U2    = outlet('U')
+            Ptr1  = inlet('Ptr')
+            P1    = inlet('P')
+            
+            # rothalpy computation
+            rothalpy = cP * T1 + W1**2 / 2 - U1**2 / 2
 
-        # computing entropy generation through losses 
-        for ii in range(self.nSection):    
-            # new outlet pressure computation -> using losses
-            if self.turboType == 'rotor':
+            # T2 computation
+            T2iso = (rothalpy - W2iso**2/2 + U2**2/2) / cP
 
-                # data allocation 
-                T1    = self.inletSection[ii].T
-                W1    = self.inletSection[ii].W
-                U1    = self.inletSection[ii].U
-                W2iso = np.sqrt(self.outletSection[ii].Wt**2 + Va**2)
-                U2    = self.outletSection[ii].U
-                Ptr1  = self.inletSection[ii].Ptr
-                P1    = self.inletSection[ii].P
-                Ttr   = self.inletSection[ii].Ttr
-                P2    = self.outletSection[ii].P
-                
-                # rothalpy computation
-                R = cP * T1 + W1**2 / 2 - U1**2 / 2
+            # Ttr 
+            Ttr = T1 + W1**2/(2 * cP)
 
-                # T2 computation
-                T2iso = (R - W2iso**2/2 + U2**2/2) / cP
+            # P2 computation
+            P2 = Ptr1 * (T2iso/Ttr)**(gamma/(gamma-1))
 
-                # Ttr 
-                Ttr = T1 + W1**2/(2 * cP)
+            # Ptr2 computation
+            Ptr2 = Ptr1 - lossVec * (Ptr1 - P1)
 
-                # P2 computation
-                P2 = Ptr1 * (T2iso/Ttr)**(gamma/(gamma-1))
+            # T2 computation
+            T2 = Ttr * (P2/Ptr2)**((gamma-1)/gamma)
 
-                # Ptr2 computation
-                Ptr2 = Ptr1 - lossVec[ii] * (Ptr1 - P1)
+            # W2 computation
+            W2 = np.sqrt(2 * cP * (Ttr - T2))
 
-                # T2 computation
-                T2 = Ttr * (P2/Ptr2)**((gamma-1)/gamma)
+            # kinetic energy change -> isentropic and real 
+            deltaIso  = W1**2 - W2iso**2
+            deltaReal = W1**2 - W2**2
 
-                # W2 computation
-                W2 = np.sqrt(2 * cP * (Ttr - T2))
+        elif self.turboType == 'stator':
+            # data allocation 
+            Pt1   = inlet('Pt')
+            Tt1   = inlet('Tt')
+            Tt2   = Tt1
+            P1    = inlet('P')
+            V1    = np.sqrt(Va**2 + inlet('Vt')**2)
+            T1    = inlet('T')
+            V2iso = np.sqrt(Va**2 + outlet('Vt')**2)
 
-                # computing efficiency
-                eta[ii] = (W1**2 - W2iso**2) / (W1**2 - W2**2)   
+            # due to losses there is a reduction in the relative total pressure
+            Pt2 = Pt1 - lossVec * (Pt1 - P1)
 
-            elif self.turboType == 'stator':
-                # data allocation 
-                Pt1   = self.inletSection[ii].Pt
-                Tt1   = self.inletSection[ii].Tt
-                Tt2   = Tt1
-                P1    = self.inletSection[ii].P
-                V1    = np.sqrt(Va**2 + self.inletSection[ii].Vt**2)
-                T1    = self.inletSection[ii].T
-                V2iso = np.sqrt(Va**2 + self.outletSection[ii].Vt**2)
+            # computing T2iso 
+            T2iso = T1 + V1**2/(2*cP) - V2iso**2/(2*cP)
 
-                # due to losses there is a reduction in the relative total pressure
-                Pt2 = Pt1 - lossVec[ii] * (Pt1 - P1)
+            # computing exit pressure 
+            P2 = Pt1 * (T2iso/Tt1)**(gamma/(gamma - 1))
 
-                # computing T2iso 
-                T2iso = T1 + V1**2/(2*cP) - V2iso**2/(2*cP)
+            # computing T2 real 
+            T2 = Tt2 * (P2/Pt2)**((gamma - 1)/gamma)
 
-                # computing exit pressure 
-                P2 = Pt1 * (T2iso/Tt1)**(gamma/(gamma - 1))
+            # computing V2 
+            V2 = np.sqrt((T1 - T2)*2*cP + V1**2) 
 
-                # computing T2 real 
-                T2 = Tt2 * (P2/Pt2)**((gamma - 1)/gamma)
+            # kinetic energy change -> isentropic and real 
+            deltaIso  = V1**2 - V2iso**2
+            deltaReal = V1**2 - V2**2
 
-                # computing V2 
-                V2 = np.sqrt((T1 - T2)*2*cP + V1**2) 
+        # sections efficiency
+        eta = deltaIso / deltaReal
 
-                # computing efficiency
-                eta[ii] = (V1**2 - V2iso**2) / (V1**2 - V2**2)   
-                
-        # efficiency
-        etaBlade = np.sum(eta) / self.nSection
+        # blade efficiency -> kinetic energy change ratio over the outlet span
+        etaBlade = reductions.sectionRatio(self.outletSection, deltaIso, deltaReal, weighting)
 
         # printing results
         starDim = 82
@@ -1788,31 +1723,36 @@ class blade:
         print('-- maximum efficiency = {0:>4.3f} -- maximum efficiency position = {1:d}'.format(np.max(eta), np.argmax(eta)))
         print('*' * starDim)
 
-    def computeMeanPressure(self, kind='total'):
+        return etaBlade
+
+    def computeMeanPressure(self, kind='total', weighting='span'):
         '''
         This function computes the mean pressure static/total of the outlet section of a blade
             inputs:
-                kind    -- static/total
+                kind        -- static/total
+                weighting   -- span/area/mass -> exact average of the piecewise linear pressure profile (see reductions.spanAverage)
         '''          
 
+        # importing libraries 
+        from turboCoeff import reductions
+
         # field points allocation 
         if kind == 'total':
             # vector allocation 
-            PVec = [self.outletSection[ii].Pt for ii in range(self.nSection)]
+            PVec = reductions.sectionArray(self.outletSection, 'Pt')
         elif kind == 'static':
             # vector allocation 
-            PVec = [self.outletSection[ii].P for ii in range(self.nSection)]
+            PVec = reductions.sectionArray(self.outletSection, 'P')
         
-        # field interpolation 
-        outletMidpoint = [self.outletSection[ii].midpoint for ii in range(self.nSection)]
-        PressureFunc   = interpolate.interp1d(outletMidpoint, PVec, kind='linear', bounds_error=False, fill_value='extrapolate')
+        # field points 
+        outletMidpoint = reductions.sectionArray(self.outletSection, 'midpoint')
 
         # setting up integration extremes 
         hub = self.outletSection[0].bottom
         tip = self.outletSection[-1].tip
 
-        # computing mean pressure 
-        Pmean = integrate.quad(PressureFunc, hub, tip, epsrel=1e-3)[0]/(tip - hub)
+        # computing mean pressure -> the profile is linearly extrapolated up to hub and tip 
+        Pmean = reductions.spanAverage(outletMidpoint, PVec, weighting, reductions.sectionArray(self.outletSection, 'rho'), reductions.sectionArray(self.outletSection, 'Va'), hub, tip)
 
         # printing results
         starDim = 82
@@ -4,10 +4,190 @@
 # PROGRAM DESCRIPTION
 #   TURBOMACHINERY: compressor/turbine
 #   CONTENT: engineering coefficient functions for the computation of turbomachinery performace
+#       -- array functions: inputs are broadcast together, the computation mode is explicit and the under specified inputs raise ValueError
+#       -- L_is, L_poly, L_adR, ise_eff, poly_eff, reHeat_factor: keyword interface (0 -> not given), see the array functions
 #  
 
+# importing libraries
+import numpy as np
+
+# turbomachinery types
+kinds = ('compressor', 'turbine')
+# isentropic efficiency computation modes
+iseModes = ('enthalpy', 'temperature', 'pressure', 'work')
+# polytropic efficiency computation modes
+polyModes = ('work', 'index')
+
+def legacyInput(x):
+    '''
+    This function converts the keyword interface inputs (0 -> not given) into the array functions inputs (None -> not given).
+    '''
+
+    if x is None or np.all(np.asarray(x) == 0):
+        return None
+
+    return x
+
+def computationMode(mode, modes, inputs):
+    '''
+    This function checks the computation mode with respect to the given inputs.
+        function inputs:
+            mode        -- computation mode -> None: the mode is chosen with respect to the given inputs
+            modes       -- allowed modes
+            inputs      -- dictionary {mode: dictionary {name: value}} -> None values are not given
+        output:
+            mode        -- computation mode
+    '''
+
+    # modes with all the inputs
+    available = [key for key in modes if all([value is not None for value in inputs[key].values()])]
+
+    if mode is None:
+        if len(available) == 0:
+            raise ValueError('The inputs are under specified. Needed inputs: {0}.'.format(' or '.join(['(' + ', '.join(inputs[key].keys()) + ')' for key in modes])))
+        elif len(available) > 1:
+            raise ValueError('The inputs are ambiguous: more than one mode can be used ({0}), choose the mode.'.format(', '.join(available)))
+        mode = available[0]
+    elif mode not in modes:
+        raise ValueError('Unknown mode: {0}. Allowed modes: {1}.'.format(mode, ', '.join(modes)))
+    elif mode not in available:
+        missing = [name for name, value in inputs[mode].items() if value is None]
+        raise ValueError('The inputs are under specified for the {0} mode: {1} missing.'.format(mode, ', '.join(missing)))
+
+    return mode
+
+def checkKind(kind):
+    '''
+    This function checks the turbomachinery type.
+    '''
+
+    if kind not in kinds:
+        raise ValueError('Unknown turbomachinery type: {0}. Allowed types: {1}.'.format(kind, ', '.join(kinds)))
+
+def pressureRatio(beta=None, Pin=None, Pout=None, kind='compressor'):
+    '''
+    This function computes the pressure ratio (>= 1 for both compressor and turbine) from beta or from the pressures.
+        function inputs:
+            beta        [--]        -- pressure ratio 
+            Pin         [Pa]        -- initial pressure
+            Pout        [Pa]        -- final pressure 
+            kind                    -- turbomachinery type -> see kinds
+        output:
+            beta        [--]        -- pressure ratio array
+    '''
+
+    # turbomachinery type check
+    checkKind(kind)
+
+    # pressures check 
+    if (Pin is None) != (Pout is None):
+        raise ValueError('Both Pin and Pout are needed for the pressure ratio computation.')
+
+    if Pin is not None:
+        if beta is not None:
+            raise ValueError('The pressure ratio is over specified: give beta or Pin and Pout.')
+        # pressure ratio computation
+        if kind == 'compressor':
+            beta = np.asarray(Pout, dtype=float) / np.asarray(Pin, dtype=float)
+        else:
+            beta = np.asarray(Pin, dtype=float) / np.asarray(Pout, dtype=float)
+    elif beta is None:
+        raise ValueError('The pressure ratio is not specified: give beta or Pin and Pout.')
+
+    return np.asarray(beta, dtype=float)
+
 # WORK COMPUTATION 
 
+def isentropicWork(Tin, beta=None, Pin=None, Pout=None, kind='compressor', gamma=1.4, R=287.06):
+    '''
+    Work computation -> array function (see L_is)
+        working conditions: isentropic transformation
+
+        function inputs:
+            Tin         [K]         -- initial temperature 
+            beta        [--]        -- pressure ratio -> or Pin and Pout
+            Pin         [Pa]        -- initial pressure
+            Pout        [Pa]        -- final pressure 
+            kind                    -- turbomachinery type -> see kinds
+            gamma       [--]        -- gas heat capacity ratio
+            R = 287.06  [J/kg K]    -- air gas constant Ru/Mair 
+        output:
+            Lis         [J/kg]      -- isentropic work with the inputs broadcast shape
+    '''
+
+    # pressure ratio computation 
+    beta = pressureRatio(beta, Pin, Pout, kind)
+    Tin = np.asarray(Tin, dtype=float)
+
+    # work computation
+    if kind == 'compressor':
+        Lis = (gamma * R)/(gamma - 1) * Tin * (beta**((gamma - 1)/gamma) - 1)
+    else:
+        Lis = (gamma * R)/(gamma - 1) * Tin * (1 - beta**((1 - gamma)/gamma))
+
+    return Lis[()]
+
+def polytropicWork(Tin, n, beta=None, Pin=None, Pout=None, kind='compressor', R=287.06):
+    '''
+    Work computation -> array function (see L_poly)
+        working conditions: polytropic transformation
+
+        function inputs:
+            Tin         [K]         -- initial temperature 
+            n           [--]        -- gas polytropic index
+            beta        [--]        -- pressure ratio -> or Pin and Pout
+            Pin         [Pa]        -- initial pressure
+            Pout        [Pa]        -- final pressure 
+            kind                    -- turbomachinery type -> see kinds
+            R = 287.06  [J/kg K]    -- air gas constant Ru/Mair 
+        output:
+            Lpoly       [J/kg]      -- polytropic work with the inputs broadcast shape
+    '''
+
+    # pressure ratio computation 
+    beta = pressureRatio(beta, Pin, Pout, kind)
+    Tin = np.asarray(Tin, dtype=float)
+    n = np.asarray(n, dtype=float)
+
+    # work computation
+    if kind == 'compressor':
+        Lpoly = (n * R * Tin)/(n - 1) * (beta**((n - 1)/n) - 1) 
+    else:
+        Lpoly = (n * R * Tin)/(n - 1) * (1 - beta**((1 - n)/n))
+
+    return Lpoly[()]
+
+def adiabaticWork(Tin, n, beta=None, Pin=None, Pout=None, kind='compressor', gamma=1.4, R=287.06):
+    '''
+    Work computation -> array function (see L_adR)
+        working conditions: real adiabatic transformation described by a polytropic index
+
+        function inputs:
+            Tin         [K]         -- initial temperature 
+            n           [--]        -- polytropic index
+            beta        [--]        -- pressure ratio -> or Pin and Pout
+            Pin         [Pa]        -- initial pressure
+            Pout        [Pa]        -- final pressure 
+            kind                    -- turbomachinery type -> see kinds
+            gamma       [--]        -- gas heat capacity ratio 
+            R = 287.06  [J/kg K]    -- air gas constant Ru/Mair 
+        output:
+            LadR        [J/kg]      -- real adiabatic work with the inputs broadcast shape
+    '''
+
+    # pressure ratio computation 
+    beta = pressureRatio(beta, Pin, Pout, kind)
+    Tin = np.asarray(Tin, dtype=float)
+    n = np.asarray(n, dtype=float)
+
+    # work computation
+    if kind == 'compressor':
+        LadR = (gamma * R * Tin)/(gamma - 1) * (beta**((n - 1)/n) - 1)
+    else:
+        LadR = (gamma * R * Tin)/(gamma - 1) * (1 - beta**((1 - n)/n))
+
+    return LadR[()]
+
 def L_is(Tin=0, Pin=0, Pout=0, beta=0, kind='', gamma=1.4, R=287.06):
     '''
     Compressor work computation
@@ -26,22 +206,11 @@ def L_is(Tin=0, Pin=0, Pout=0, beta=0, kind='', gamma=1.4, R=287.06):
             R = 287.06  [J/kg K]    -- air gas constant Ru/Mair 
     '''
 
-    # there are 2 ways for L computation
-    # 1. using directly beta
-    # 2. computing directly beta from Pin and Pout 
-    if Pin != 0 and Pout !=0: 
-        if kind == 'compressor':
-            beta = Pout/Pin
-        elif kind == 'turbine':
-            beta = Pin/Pout 
+    # keyword interface: 0 -> not given
+    if legacyInput(Pin) is not None and legacyInput(Pout) is not None:
+        return isentropicWork(Tin, Pin=Pin, Pout=Pout, kind=kind, gamma=gamma, R=R)
 
-    # work computation
-    if kind == 'compressor':
-        Lis = (gamma * R)/(gamma - 1) * Tin * (beta**((gamma - 1)/gamma) - 1)
-    elif kind == 'turbine':
-        Lis = (gamma * R)/(gamma - 1) * Tin * (1 - beta**((1 - gamma)/gamma))
-
-    return Lis
+    return isentropicWork(Tin, beta=beta, kind=kind, gamma=gamma, R=R)
 
 def L_poly(Tin=0, Pin=0, Pout=0, beta=0, kind='', n=0, R=287.06):
     '''
@@ -61,22 +230,11 @@ def L_poly(Tin=0, Pin=0, Pout=0, beta=0, kind='', n=0, R=287.06):
             R = 287.06  [J/kg K]    -- air gas constant Ru/Mair 
     '''
 
-    # there are 2 ways for L computation
-    # 1. using directly beta
-    # 2. computing directly beta from Pin and Pout 
-    if Pin != 0 and Pout !=0: 
-        if kind == 'compressor':
-            beta = Pout/Pin
-        elif kind == 'turbine':
-            beta = Pin/Pout 
+    # keyword interface: 0 -> not given
+    if legacyInput(Pin) is not None and legacyInput(Pout) is not None:
+        return polytropicWork(Tin, n, Pin=Pin, Pout=Pout, kind=kind, R=R)
 
-    # work computation
-    if kind == 'compressor':
-        Lpoly = (n * R * Tin)/(n - 1) * (beta**((n - 1)/n) - 1) 
-    elif kind == 'turbine':
-        Lpoly = (n * R * Tin)/(n - 1) * (1 - beta**((1 - n)/n))
-    
-    return Lpoly
+    return polytropicWork(Tin, n, beta=beta, kind=kind, R=R)
 
 def L_adR(Tin=0, Pin=0, Pout=0, n=0, beta=0, kind='', gamma=1.4, R=287.06):
     '''
@@ -97,70 +255,182 @@ def L_adR(Tin=0, Pin=0, Pout=0, n=0, beta=0, kind='', gamma=1.4, R=287.06):
             R = 287.06  -- air gas constant Ru/Mair 
     '''
 
-    # there are 2 ways for L computation
-    # 1. using directly beta
-    # 2. computing directly beta from Pin and Pout 
-    if Pin != 0 and Pout !=0: 
-        if kind == 'compressor':
-            beta = Pout/Pin
-        elif kind == 'turbine':
-            beta = Pin/Pout 
+    # keyword interface: 0 -> not given
+    if legacyInput(Pin) is not None and legacyInput(Pout) is not None:
+        return adiabaticWork(Tin, n, Pin=Pin, Pout=Pout, kind=kind, gamma=gamma, R=R)
 
-    # work computation
-    if kind == 'compressor':
-        LadR = (gamma * R * Tin)/(gamma - 1) * (beta**((n - 1)/n) - 1)
-    elif kind == 'turbine':
-        LadR = (gamma * R * Tin)/(gamma - 1) * (1 - beta**((1 - n)/n))
-    
-    return LadR
+    return adiabaticWork(Tin, n, beta=beta, kind=kind, gamma=gamma, R=R)
 
 # EFFICIENCY COMPUTATION
 
-def stageEfficiency(rotorBlade, statorBlade, R=287.06, gamma=1.4):
+def stageEfficiency(rotorBlade, statorBlade, R=287.06, gamma=1.4, weighting='mass'):
     '''
     This function computes the efficiency of a compressor stage.
         inputs:
             rotorBlade  -- turboBlade object of rotor type
             statroBlade -- turboBlade object of stator type 
-
+            weighting   -- span/area/mass -> ratio between the rotor inlet span averages of the isentropic and the euler work (see reductions.sectionRatio)
+                        -- None -> sections mean value of the efficiency
     '''
 
-    # compute stage efficiency 
-    etaStage = 0 
+    # importing libraries 
+    from turboCoeff import reductions
 
     # cP computation 
     cP = gamma / (gamma - 1) * R 
 
-    for ii in range(rotorBlade.nSection):
-        # allocating total pressure 
-        Pt1 = rotorBlade.inletSection[ii].Pt
-        Pt2 = statorBlade.outletSection[ii].Pt 
-        
-        # allocation total temperature 
-        Tt1 = rotorBlade.inletSection[ii].Tt
-        
-        # computing total temperature if the transformation Pt1 -> Pt2 were isentropic 
-        Tt2 = Tt1 * (Pt2/Pt1)**((gamma-1)/gamma)
-        
-        # computing work if the transformation were isentropic 
-        Lis = cP * (Tt2 - Tt1)
-        
-        # euler work computation 
-        Leu = cP * (rotorBlade.outletSection[ii].Tt - rotorBlade.inletSection[ii].Tt)
-        
-        # etaSection 
-        etaSection = Lis / Leu
-        
-        # etaStage 
-        etaStage = etaStage + etaSection
+    # section arrays allocation 
+    Pt1 = reductions.sectionArray(rotorBlade.inletSection, 'Pt')
+    Pt2 = reductions.sectionArray(statorBlade.outletSection, 'Pt')
+    Tt1 = reductions.sectionArray(rotorBlade.inletSection, 'Tt')
+
+    # stator with different sections -> the stator outlet total pressure is mass averaged on the rotor inlet stream tubes (see reductions.sectionRemap)
+    rotorBottom, rotorTip   = reductions.sectionArray(rotorBlade.inletSection, 'bottom'), reductions.sectionArray(rotorBlade.inletSection, 'tip')
+    statorBottom, statorTip = reductions.sectionArray(statorBlade.outletSection, 'bottom'), reductions.sectionArray(statorBlade.outletSection, 'tip')
+    if not reductions.sameSections(statorBottom, statorTip, rotorBottom, rotorTip):
+        statorFlux = np.pi * (statorTip**2 - statorBottom**2) * reductions.sectionArray(statorBlade.outletSection, 'rho') * reductions.sectionArray(statorBlade.outletSection, 'Va')
+        _, values = reductions.sectionRemap(statorBottom, statorTip, {'Pt': Pt2}, statorFlux, rotorBottom, rotorTip)
+        Pt2 = values['Pt']
+    
+    # computing total temperature if the transformation Pt1 -> Pt2 were isentropic 
+    Tt2 = Tt1 * (Pt2/Pt1)**((gamma-1)/gamma)
+    
+    # computing work if the transformation were isentropic 
+    Lis = cP * (Tt2 - Tt1)
+    
+    # euler work computation 
+    Leu = cP * (reductions.sectionArray(rotorBlade.outletSection, 'Tt') - Tt1)
 
-    # computing total stage efficiency
-    etaStage = etaStage / rotorBlade.nSection
+    # computing total stage efficiency -> work ratio over the rotor inlet span
+    etaStage = reductions.sectionRatio(rotorBlade.inletSection, Lis, Leu, weighting)
 
     print('\n-- STAGE EFFICIENCY: etaStage = {0:>4.4f}'.format(etaStage))
 
     return etaStage
 
+def isentropicEfficiency(kind='compressor', mode=None, houtIs=None, hin=None, hout=None, ToutIs=None, Tin=None, Tout=None, beta=None, gamma=None, n=None, Lis=None, LadR=None):
+    '''
+    Isentropic efficiency computation -> array function (see ise_eff)
+        function inputs:
+            kind        -- turbomachinery type -> see kinds
+            mode        -- computation mode -> see iseModes, None: the mode is chosen with respect to the given inputs
+                            -- enthalpy     : houtIs, hin, hout 
+                            -- temperature  : ToutIs, Tin, Tout 
+                            -- pressure     : beta, gamma, n 
+                            -- work         : Lis, LadR
+            houtIs      -- final enthalpy for an isentropic transformation
+            hin         -- initial enthaply 
+            hout        -- final enthalpy for the real transformation
+            ToutIs      -- final temperature for an isentropic transformation
+            Tin         -- initial temperature
+            Tout        -- final temperature for the real transformation
+            beta        -- pressure ratio
+            gamma       -- gas heat capacity ratio
+            n           -- polytropic index
+            Lis         -- isentropic work
+            LadR        -- adiabatic real work 
+        output:
+            eta         -- isentropic efficiency with the inputs broadcast shape
+    '''
+
+    # turbomachinery type check
+    checkKind(kind)
+
+    # computation mode 
+    inputs = {'enthalpy'   : {'houtIs': houtIs, 'hin': hin, 'hout': hout},
+              'temperature': {'ToutIs': ToutIs, 'Tin': Tin, 'Tout': Tout},
+              'pressure'   : {'beta': beta, 'gamma': gamma, 'n': n},
+              'work'       : {'Lis': Lis, 'LadR': LadR}}
+    mode = computationMode(mode, iseModes, inputs)
+    values = [np.asarray(value, dtype=float) for value in inputs[mode].values()]
+
+    # efficiency computation
+    if mode == 'enthalpy' or mode == 'temperature':
+        outIs, start, out = values
+        if kind == 'compressor':
+            eta = (outIs - start) / (out - start)
+        else:
+            eta = (out - start) / (outIs - start)
+    elif mode == 'pressure':
+        beta, gamma, n = values
+        if kind == 'compressor':
+            eta = (beta**((gamma - 1)/gamma) - 1) / (beta**((n - 1)/n) - 1)
+        else:
+            eta = (1 - beta**((1 - n)/n)) / (1 - beta**((1 - gamma)/gamma))
+    else:
+        Lis, LadR = values
+        if kind == 'compressor':
+            eta = Lis / LadR
+        else:
+            eta = LadR / Lis
+
+    return eta[()]
+
+def polytropicEfficiency(kind='compressor', mode=None, gamma=None, n=None, Lp=None, LadR=None):
+    '''
+    Polytropic efficiency computation -> array function (see poly_eff)
+        function inputs:
+            kind        -- turbomachinery type -> see kinds
+            mode        -- computation mode -> see polyModes, None: the mode is chosen with respect to the given inputs
+                            -- work         : Lp, LadR
+                            -- index        : gamma, n
+            gamma       -- gas heat capacity ratio
+            n           -- polytropic index
+            Lp          -- polytropic transformation work
+            LadR        -- adiabatic real work 
+        output:
+            eta         -- polytropic efficiency with the inputs broadcast shape
+    '''
+
+    # turbomachinery type check
+    checkKind(kind)
+
+    # computation mode 
+    inputs = {'work' : {'Lp': Lp, 'LadR': LadR},
+              'index': {'gamma': gamma, 'n': n}}
+    mode = computationMode(mode, polyModes, inputs)
+    values = [np.asarray(value, dtype=float) for value in inputs[mode].values()]
+
+    # efficiency computation
+    if mode == 'work':
+        Lp, LadR = values
+        if kind == 'compressor':
+            eta = Lp / LadR
+        else:
+            eta = LadR / Lp
+    else:
+        gamma, n = values
+        if kind == 'compressor':
+            eta = (n * (gamma - 1)) / (gamma * (n - 1))
+        else:
+            eta = (gamma * (n - 1)) / (n * (gamma - 1))
+
+    return eta[()]
+
+def reHeatFactor(etaPoly, etaIs, kind='compressor'):
+    '''
+    Re-heat factor computation -> array function (see reHeat_factor)
+        function inputs:
+            etaPoly     -- polytropic transformation efficiency
+            etaIs       -- insentropic transformation efficiency
+            kind        -- turbomachinery type -> see kinds
+        output:
+            reHeat      -- re-heat factor with the inputs broadcast shape
+    '''
+
+    # turbomachinery type check
+    checkKind(kind)
+
+    etaPoly = np.asarray(etaPoly, dtype=float)
+    etaIs = np.asarray(etaIs, dtype=float)
+
+    if kind == 'compressor':
+        reHeat = etaPoly / etaIs - 1
+    else:
+        reHeat = etaIs / etaPoly - 1
+
+    return reHeat[()]
+
 def ise_eff(hout_is=0, hin=0, hout=0, Tout_is=0, Tin=0, Tout=0, beta=0, kind='', gamma=0, n=0, L_is=0, L_adR=0):
     '''
     Isentropic efficiency computation
@@ -188,41 +458,17 @@ def ise_eff(hout_is=0, hin=0, hout=0, Tout_is=0, Tin=0, Tout=0, beta=0, kind='',
             work based
     '''
 
-    if kind == 'compressor':
-        # enthalpy based computation
-        if hout_is != 0 and hin != 0 and hout != 0:
-            eta = (hout_is - hin) / (hout - hin)
-
-        # temperature based 
-        if Tout_is != 0 and Tin != 0 and Tout != 0:
-            eta = (Tout_is - Tin) / (Tout - Tin)
-
-        # pressure ratio based 
-        if beta != 0 and gamma != 0 and n != 0: 
-            eta = (beta**((gamma - 1)/gamma) - 1) / (beta**((n - 1)/n) - 1)
-
-        # work based 
-        if L_is != 0 and L_adR != 0:
-            eta = L_is / L_adR 
-   
-    elif kind == 'turbine':
-        # enthalpy based computation
-        if hout_is != 0 and hin != 0 and hout != 0:
-            eta = (hout - hin) / (hout_is - hin)
-
-        # temperature based 
-        if Tout_is != 0 and Tin != 0 and Tout != 0:
-            eta = (Tout - Tin) / (Tout_is - Tin)
-
-        # pressure ratio based 
-        if beta != 0 and gamma != 0 and n != 0: 
-            eta = (1 - beta**((1 - n)/n)) / (1 - beta**((1 - gamma)/gamma))
-
-        # work based 
-        if L_is != 0 and L_adR != 0:
-            eta = L_adR / L_is 
+    # keyword interface: 0 -> not given, the last complete mode is used (work > pressure > temperature > enthalpy)
+    inputs = {'enthalpy'   : [hout_is, hin, hout],
+              'temperature': [Tout_is, Tin, Tout],
+              'pressure'   : [beta, gamma, n],
+              'work'       : [L_is, L_adR]}
+    mode = None
+    for key in iseModes:
+        if all([legacyInput(value) is not None for value in inputs[key]]):
+            mode = key
 
-    return eta    
+    return isentropicEfficiency(kind=kind, mode=mode, houtIs=legacyInput(hout_is), hin=legacyInput(hin), hout=legacyInput(hout), ToutIs=legacyInput(Tout_is), Tin=legacyInput(Tin), Tout=legacyInput(Tout), beta=legacyInput(beta), gamma=legacyInput(gamma), n=legacyInput(n), Lis=legacyInput(L_is), LadR=legacyInput(L_adR))
 
 def poly_eff(gamma=0, n=0, L_p=0, L_adR=0, kind=''):
     '''
@@ -242,24 +488,14 @@ def poly_eff(gamma=0, n=0, L_p=0, L_adR=0, kind=''):
             transformation factor based 
     '''
 
-    if kind == 'compressor':
-        # work based 
-        if L_p != 0 and L_adR != 0:
-            eta = L_p / L_adR 
-
-        # transformation factor based
-        if gamma != 0 and n != 0:
-            eta = (n * (gamma - 1)) / (gamma * (n - 1))
-    elif kind == 'turbine':
-        # work based 
-        if L_p != 0 and L_adR != 0:
-            eta = L_adR / L_p
-
-        # transformation factor based
-        if gamma != 0 and n != 0:
-            eta = (gamma * (n - 1)) / (n * (gamma - 1))
+    # keyword interface: 0 -> not given, the transformation factor has the priority
+    mode = None
+    if legacyInput(L_p) is not None and legacyInput(L_adR) is not None:
+        mode = 'work'
+    if legacyInput(gamma) is not None and legacyInput(n) is not None:
+        mode = 'index'
 
-    return eta    
+    return polytropicEfficiency(kind=kind, mode=mode, gamma=legacyInput(gamma), n=legacyInput(n), Lp=legacyInput(L_p), LadR=legacyInput(L_adR))
 
 def reHeat_factor(eta_poly, eta_is, kind=''):
     '''
@@ -273,9 +509,4 @@ def reHeat_factor(eta_poly, eta_is, kind=''):
                             -- turbine 
     '''
 
-    if kind == 'compressor':
-        reHeatFactor = eta_poly / eta_is - 1
-    elif kind == 'turbine':
-        reHeatFactor = eta_is / eta_poly - 1
-    
-    return reHeatFactor
\ No newline at end of file
+    return reHeatFactor(eta_poly, eta_is, kind)
@@ -0,0 +1,248 @@
+# TURBOMACHINERY -- MULTISTAGE MEAN LINE DESIGN LIBRARY
+# AUTHOR: antonio pucciarelli
+#
+# PROGRAM DESCRIPTION
+#   TURBOMACHINERY: compressor
+#   CONTENT: multistage mean line design
+#       -- the overall pressure ratio is split between the stages: betaP_k = betaP**w_k, sum(w_k) = 1
+#       -- each stage has its own reaction degree and inlet swirl -> psi_k = 2 * (1 - rD_k - Vt0Umean_k) (see similarity.stageSweep)
+#       -- the stages are marched one after the other, all the candidate splits at once (see similarity.stagePropertiesArray):
+#           -- stage k inlet: Tt0_k = Tt2_(k-1), Pt0_k = Pt0_(k-1) * betaP_(k-1)
+#           -- all the stages are on the same shaft: the first stage fixes omega, the other stages mean radius is rMean_k = Umean_k / omega
+#       -- the best split for each # of stages maximizes the overall efficiency among the candidates that pass the limits
+#
+
+# importing libraries
+import numpy as np
+from turboCoeff import coeff
+from turboCoeff import similarity
+
+# multistage candidate limits
+multiStageLimits = {'deHaller'  : 0.7,  # minimum mean line rotor W1/W0
+                    'Mr0'       : 1.2,  # maximum mean line rotor inlet relative Mach
+                    'rMeanRatio': 1.5,  # maximum ratio between the maximum and the minimum stage mean radius
+                    'rHubMin'   : 0.0}  # minimum hub radius of the stage blade rows -> rMean - b/2
+
+def stageSplit(nStages, nCandidates, rDbounds=[0.5, 0.75], Vt0UmeanBounds=[0, 0.25], seed=None):
+    '''
+    This function generates random candidate splits.
+        inputs:
+            nStages         -- # of stages
+            nCandidates     -- # of candidates
+            rDbounds        -- reaction degree bounds [min, max]
+            Vt0UmeanBounds  -- Vt0/Umean bounds [min, max]
+            seed            -- random generator seed
+        output:
+            weights         -- pressure ratio split weights [nCandidates, nStages] -> uniform on the simplex
+            rD              -- stage reaction degree [nCandidates, nStages]
+            Vt0Umean        -- stage Vt0/Umean [nCandidates, nStages]
+    '''
+
+    # random generator
+    rng = np.random.default_rng(seed)
+
+    # weights -> Dirichlet(1, ..., 1) is uniform on the simplex
+    weights = rng.dirichlet(np.ones(nStages), size=nCandidates)
+
+    # reaction degree and inlet swirl
+    rD = rng.uniform(rDbounds[0], rDbounds[1], size=(nCandidates, nStages))
+    Vt0Umean = rng.uniform(Vt0UmeanBounds[0], Vt0UmeanBounds[1], size=(nCandidates, nStages))
+
+    return weights, rD, Vt0Umean
+
+def multiStageMarching(betaP, weights, rD, Vt0Umean, rMean, mFlux, Tt0, Pt0, limits=None, T1real=True, R=287.06, gamma=1.4, continuityCorrect=False, etaModel='circle'):
+    '''
+    This function computes the multistage mean line for many candidate splits at once.
+    The stages are marched one after the other, each stage is computed for all the candidates with stagePropertiesArray.
+        inputs:
+            betaP               -- overall total pressure ratio
+            weights             -- pressure ratio split weights [nCandidates, nStages] -> each row sums to 1
+            rD                  -- stage reaction degree [nCandidates, nStages]
+            Vt0Umean            -- stage Vt0/Umean [nCandidates, nStages]
+            rMean               -- first stage mean radius
+            mFlux               -- mass flux
+            Tt0                 -- compressor inlet total temperature
+            Pt0                 -- compressor inlet total pressure
+            limits              -- dictionary of the limits that replace the multiStageLimits values -> None: multiStageLimits values
+            T1real, R, gamma, continuityCorrect, etaModel -- see similarity.stagePropertiesArray
+        output:
+            march               -- dictionary:
+                                    -- 'stages'   : structured array (similarity.stageDtype) [nCandidates, nStages]
+                                    -- 'betaP'    : stage pressure ratio [nCandidates, nStages]
+                                    -- 'rMean'    : stage mean radius [nCandidates, nStages]
+                                    -- 'omega'    : shaft angular speed [nCandidates]
+                                    -- 'eta'      : overall isentropic efficiency [nCandidates]
+                                    -- 'L'        : overall work [nCandidates]
+                                    -- 'valid'    : all the stages can be computed [nCandidates]
+                                    -- 'feasible' : valid candidates that pass the limits [nCandidates]
+    '''
+
+    # limits allocation
+    if limits is None:
+        limits = {}
+    for name in limits.keys():
+        if name not in multiStageLimits.keys():
+            raise ValueError('Unknown multistage limit: {0}. Allowed limits: {1}.'.format(name, ', '.join(multiStageLimits.keys())))
+    limits = dict(multiStageLimits, **limits)
+
+    # inputs allocation
+    weights, rD, Vt0Umean = np.broadcast_arrays(*[np.atleast_2d(np.asarray(x, dtype=float)) for x in [weights, rD, Vt0Umean]])
+    nCandidates, nStages = weights.shape
+    if np.any(np.abs(np.sum(weights, axis=1) - 1) > 1e-9):
+        raise ValueError('The pressure ratio split weights have to sum to 1.')
+
+    # stage pressure ratio
+    betaStage = betaP**weights
+    # work coefficient
+    psi = 2 * (1 - rD - Vt0Umean)
+
+    # results allocation
+    stages = np.zeros((nCandidates, nStages), dtype=similarity.stageDtype)
+    rMeanStage = np.zeros((nCandidates, nStages))
+
+    # compressor inlet
+    Tt0stage = np.full(nCandidates, float(Tt0))
+    Pt0stage = np.full(nCandidates, float(Pt0))
+
+    for kk in range(nStages):
+        # stage computation -> the stage solution depends on rMean only through the blade heights (~ 1/rMean) and the angular speed
+        stage = similarity.stagePropertiesArray(rD[:,kk], psi[:,kk], rMean, mFlux, Tt0stage, Pt0stage, betaStage[:,kk], T1real=T1real, R=R, gamma=gamma, continuityCorrect=continuityCorrect, etaModel=etaModel)
+
+        if kk == 0:
+            # shaft angular speed
+            omega = stage['rotationVec'][:,1]
+
+        # same shaft -> stage mean radius and blade heights scaling
+        with np.errstate(invalid='ignore', divide='ignore'):
+            rMeanStage[:,kk] = stage['rotationVec'][:,0] / omega
+            stage['bladeVec'] = stage['bladeVec'] * (rMean / rMeanStage[:,kk])[:,np.newaxis]
+        stage['rotationVec'][:,1] = omega
+        stage['rotationVec'][:,2] = omega * 60 / (2 * np.pi)
+        stages[:,kk] = stage
+
+        # next stage inlet
+        Tt0stage = stage['thermo2'][:,3]
+        Pt0stage = Pt0stage * betaStage[:,kk]
+
+    # overall performance
+    L = np.sum(stages['work'][...,0], axis=1)
+    Lis = coeff.isentropicWork(Tt0, beta=betaP, kind='compressor', gamma=gamma, R=R)
+    eta = Lis / L
+
+    # candidates checks
+    valid = np.all(stages['valid'], axis=1)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        W0 = np.sqrt(stages['W0vec'][...,0]**2 + stages['W0vec'][...,1]**2)
+        W1 = np.sqrt(stages['W1vec'][...,0]**2 + stages['W1vec'][...,1]**2)
+        deHaller = np.all(W1 / W0 >= limits['deHaller'], axis=1)
+        Mr0 = np.all(stages['thermo0'][...,7] <= limits['Mr0'], axis=1)
+        rMeanRatio = np.max(rMeanStage, axis=1) / np.min(rMeanStage, axis=1) <= limits['rMeanRatio']
+        # hub radius of the rotor inlet, rotor outlet and stator outlet sections
+        rHub = np.all(rMeanStage[...,np.newaxis] - stages['bladeVec'] / 2 > limits['rHubMin'], axis=(1,2))
+
+    march = {'stages'   : stages,
+             'betaP'    : betaStage,
+             'rD'       : rD,
+             'psi'      : psi,
+             'rMean'    : rMeanStage,
+             'omega'    : omega,
+             'eta'      : np.where(valid, eta, np.nan),
+             'L'        : np.where(valid, L, np.nan),
+             'valid'    : valid,
+             'feasible' : valid & deHaller & Mr0 & rMeanRatio & rHub}
+
+    return march
+
+def multiStageDesign(betaP, nStagesMin, nStagesMax, rMean, mFlux, Tt0=300, Pt0=1e+5, nCandidates=2000, nRounds=3, rDbounds=[0.5, 0.75], Vt0UmeanBounds=[0, 0.25], limits=None, T1real=True, R=287.06, gamma=1.4, continuityCorrect=False, etaModel='circle', seed=None, printout=False):
+    '''
+    This function computes the best multistage mean line design for each # of stages.
+    The search starts from random splits (see stageSplit); then, for nRounds, the candidates are perturbations of the best feasible split
+    with a halving perturbation amplitude.
+        inputs:
+            betaP               -- overall total pressure ratio
+            nStagesMin          -- minimum # of stages
+            nStagesMax          -- maximum # of stages
+            rMean               -- first stage mean radius
+            mFlux               -- mass flux
+            Tt0                 -- compressor inlet total temperature
+            Pt0                 -- compressor inlet total pressure
+            nCandidates         -- # of candidates for each round
+            nRounds             -- # of refinement rounds
+            rDbounds            -- reaction degree bounds [min, max]
+            Vt0UmeanBounds      -- Vt0/Umean bounds [min, max]
+            limits              -- dictionary of the limits that replace the multiStageLimits values -> None: multiStageLimits values
+            T1real, R, gamma, continuityCorrect, etaModel -- see similarity.stagePropertiesArray
+            seed                -- random generator seed
+            printout            -- boolean value for the printing of the best designs
+        output:
+            designs             -- dictionary {nStages: design}, design is None if no candidate is feasible, otherwise a dictionary:
+                                    -- 'stages'   : structured array (similarity.stageDtype) [nStages] -> blade row solvers inputs
+                                    -- 'betaP', 'weights', 'rD', 'Vt0Umean', 'psi', 'rMean' : stage arrays [nStages]
+                                    -- 'omega', 'eta', 'L' : shaft angular speed, overall efficiency and work
+                                    -- 'nFeasible' : # of feasible candidates
+    '''
+
+    # random generator
+    rng = np.random.default_rng(seed)
+
+    # results allocation
+    designs = {}
+
+    for nStages in range(nStagesMin, nStagesMax + 1):
+        # random candidates
+        weights, rD, Vt0Umean = stageSplit(nStages, nCandidates, rDbounds, Vt0UmeanBounds, seed=rng)
+        best = None
+        nFeasible = 0
+        amplitude = 0.5
+
+        for ii in range(nRounds + 1):
+            if ii > 0 and best is not None:
+                # perturbations of the best split -> the weights are perturbed in log space and normalized
+                weights = best['weights'] * np.exp(amplitude * rng.normal(size=(nCandidates, nStages)))
+                weights = weights / np.sum(weights, axis=1)[:,np.newaxis]
+                rD = np.clip(best['rD'] + amplitude * (rDbounds[1] - rDbounds[0]) * rng.normal(size=(nCandidates, nStages)), rDbounds[0], rDbounds[1])
+                Vt0Umean = np.clip(best['Vt0Umean'] + amplitude * (Vt0UmeanBounds[1] - Vt0UmeanBounds[0]) * rng.normal(size=(nCandidates, nStages)), Vt0UmeanBounds[0], Vt0UmeanBounds[1])
+                amplitude = amplitude / 2
+
+            # candidates marching
+            march = multiStageMarching(betaP, weights, rD, Vt0Umean, rMean, mFlux, Tt0, Pt0, limits=limits, T1real=T1real, R=R, gamma=gamma, continuityCorrect=continuityCorrect, etaModel=etaModel)
+            nFeasible = nFeasible + int(np.sum(march['feasible']))
+
+            if not np.any(march['feasible']):
+                continue
+
+            # best feasible candidate
+            index = np.nanargmax(np.where(march['feasible'], march['eta'], np.nan))
+            if best is None or march['eta'][index] > best['eta']:
+                best = {'stages'   : march['stages'][index].copy(),
+                        'betaP'    : march['betaP'][index],
+                        'weights'  : weights[index],
+                        'rD'       : rD[index],
+                        'Vt0Umean' : Vt0Umean[index],
+                        'psi'      : march['psi'][index],
+                        'rMean'    : march['rMean'][index],
+                        'omega'    : march['omega'][index],
+                        'eta'      : march['eta'][index],
+                        'L'        : march['L'][index]}
+
+        if best is not None:
+            best['nFeasible'] = nFeasible
+        designs[nStages] = best
+
+        if printout:
+            starDim = 40
+            title = ' MULTISTAGE -- {0:d} STAGES '.format(nStages)
+            titleDim = int((starDim - len(title))/2)
+            print('*' * titleDim + title + '*' * titleDim)
+            if best is None:
+                print('-- no feasible candidate')
+            else:
+                print('-- eta       = {0:>9.4f}'.format(best['eta']))
+                print('-- L         = {0:>9.3f} kJ/kg'.format(best['L']/1e+3))
+                print('-- rpm       = {0:>9.2f}'.format(best['omega'] * 60 / (2 * np.pi)))
+                print('-- feasible  = {0:>9d}'.format(nFeasible))
+                for kk in range(nStages):
+                    print('-- stage {0:>2d}: betaP = {1:>6.4f} -- rD = {2:>6.4f} -- psi = {3:>6.4f} -- eta = {4:>6.4f} -- rMean = {5:>6.4f} m'.format(kk+1, best['betaP'][kk], best['rD'][kk], best['psi'][kk], best['stages']['adimVec'][kk,2], best['rMean'][kk]))
+            print('*' * (2 * titleDim + len(title)) + '\n')
+
+    return designs
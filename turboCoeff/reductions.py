@@ -0,0 +1,281 @@
+# TURBOMACHINERY -- SPAN REDUCTIONS LIBRARY
+# AUTHOR: antonio pucciarelli
+#
+# PROGRAM DESCRIPTION
+#   TURBOMACHINERY: compressor/turbine
+#   CONTENT: span averages of the blade section quantities
+#       -- the span profiles are piecewise linear between the section midpoints (linear extrapolation up to hub and tip)
+#       -- span average : int(f dr)             / int(dr)
+#       -- area average : int(f r dr)           / int(r dr)
+#       -- mass average : int(f rho Va r dr)    / int(rho Va r dr) -> rho Va is piecewise linear
+#       -- each segment integrand is at most a cubic polynomial -> Simpson rule on each segment is exact
+#       -- the section arrays can have leading dimensions (many designs at once): the span is the last axis
+#       -- ratio average: average(f) / average(g) -> efficiencies as work ratios over the span
+#   CONTENT: stream tubes remap between two span discretizations
+#       -- the stream tubes are matched with the normalized span coordinate (hub -> hub, tip -> tip)
+#       -- the mass flux is uniform on the annulus area of each stream tube -> the total mass flow rate is conserved
+#       -- the quantities of the new stream tubes are mass averages of the overlapping stream tubes
+#
+
+# importing libraries
+import numpy as np
+
+# span weighting types
+weightings = ('span', 'area', 'mass')
+
+def spanExtension(r, values, hub=None, tip=None):
+    '''
+    This function extends the section values up to the hub and the tip radius with linear extrapolation.
+        inputs:
+            r           -- section radial position [..., nSection]
+            values      -- section values [..., nSection]
+            hub         -- hub radius -> None: no extension
+            tip         -- tip radius -> None: no extension
+        output:
+            r           -- extended radial position [..., nSection + 2]
+            values      -- extended values [..., nSection + 2]
+    '''
+
+    # broadcasting
+    r, values = np.broadcast_arrays(np.asarray(r, dtype=float), np.asarray(values, dtype=float))
+
+    if r.shape[-1] == 1:
+        # single section -> constant profile
+        slopeHub = np.zeros(r.shape[:-1])
+        slopeTip = np.zeros(r.shape[:-1])
+    else:
+        slopeHub = (values[...,1] - values[...,0]) / (r[...,1] - r[...,0])
+        slopeTip = (values[...,-1] - values[...,-2]) / (r[...,-1] - r[...,-2])
+
+    if hub is not None:
+        hub = np.broadcast_to(np.asarray(hub, dtype=float), r.shape[:-1])
+        values = np.concatenate(((values[...,0] + slopeHub * (hub - r[...,0]))[...,np.newaxis], values), axis=-1)
+        r = np.concatenate((hub[...,np.newaxis], r), axis=-1)
+
+    if tip is not None:
+        tip = np.broadcast_to(np.asarray(tip, dtype=float), r.shape[:-1])
+        values = np.concatenate((values, (values[...,-1] + slopeTip * (tip - r[...,-1]))[...,np.newaxis]), axis=-1)
+        r = np.concatenate((r, tip[...,np.newaxis]), axis=-1)
+
+    return r, values
+
+def spanIntegral(r, values, weights=None, hub=None, tip=None, area=True):
+    '''
+    This function computes the exact integral of a piecewise linear span profile.
+        inputs:
+            r           -- section radial position [..., nSection]
+            values      -- section values [..., nSection]
+            weights     -- section weights (piecewise linear, i.e. rho * Va) [..., nSection] -> None: no weights
+            hub         -- hub radius -> None: the integral starts from the first section
+            tip         -- tip radius -> None: the integral ends at the last section
+            area        -- boolean value: True -> int(f w 2 pi r dr), False -> int(f w dr)
+        output:
+            integral    -- span integral [...]
+    '''
+
+    # weights allocation
+    if weights is None:
+        weights = np.ones(np.shape(r))
+    r, values, weights = np.broadcast_arrays(np.asarray(r, dtype=float), np.asarray(values, dtype=float), np.asarray(weights, dtype=float))
+
+    # hub and tip extension
+    rExt, values  = spanExtension(r, values, hub, tip)
+    _,    weights = spanExtension(r, weights, hub, tip)
+    r = rExt
+
+    # radial factor
+    if area:
+        radial = 2 * np.pi * r
+    else:
+        radial = np.ones(r.shape)
+
+    # segment ends and midpoint integrand -> f * w * radial is at most cubic on each segment
+    gEnd = values * weights * radial
+    gMid = (values[...,1:] + values[...,:-1]) / 2 * (weights[...,1:] + weights[...,:-1]) / 2 * (radial[...,1:] + radial[...,:-1]) / 2
+
+    # Simpson rule on each segment
+    integral = np.sum((r[...,1:] - r[...,:-1]) / 6 * (gEnd[...,:-1] + 4 * gMid + gEnd[...,1:]), axis=-1)
+
+    return integral[()]
+
+def spanAverage(r, values, weighting='span', rho=None, Va=None, hub=None, tip=None):
+    '''
+    This function computes the span average of a section quantity.
+        inputs:
+            r           -- section radial position [..., nSection]
+            values      -- section values [..., nSection]
+            weighting   -- span/area/mass (see weightings)
+            rho         -- section density [..., nSection] -> mass weighting
+            Va          -- section axial speed [..., nSection] -> mass weighting
+            hub         -- hub radius -> None: the average starts from the first section
+            tip         -- tip radius -> None: the average ends at the last section
+        output:
+            average     -- span average [...]
+    '''
+
+    # weights allocation
+    if weighting not in weightings:
+        raise ValueError('Unknown weighting: {0}. Allowed weightings: {1}.'.format(weighting, ', '.join(weightings)))
+    if weighting == 'mass':
+        if rho is None or Va is None:
+            raise ValueError('The mass weighting needs the section density and axial speed.')
+        weights = np.asarray(rho, dtype=float) * np.asarray(Va, dtype=float)
+    else:
+        weights = None
+
+    # average computation
+    area = weighting != 'span'
+    average = spanIntegral(r, values, weights, hub, tip, area) / spanIntegral(r, np.ones(np.shape(r)), weights, hub, tip, area)
+
+    return average
+
+def spanReduction(r, fields, rho, Va, hub=None, tip=None):
+    '''
+    This function computes the area and mass averages of many section quantities in a single pass.
+        inputs:
+            r           -- section radial position [..., nSection]
+            fields      -- dictionary of the section quantities {name: [..., nSection]} -> i.e. Pt, Tt, eta, loss, s
+            rho         -- section density [..., nSection]
+            Va          -- section axial speed [..., nSection]
+            hub         -- hub radius
+            tip         -- tip radius
+        output:
+            reduction   -- dictionary {'area': {name: average}, 'mass': {name: average}, 'mFlux': mass flow rate, 'annulus': annulus area}
+    '''
+
+    # fields stacking -> [nFields, ..., nSection], the last field is used for the normalization
+    names  = list(fields.keys())
+    values = np.stack(np.broadcast_arrays(*[np.asarray(fields[name], dtype=float) for name in names] + [np.ones(np.shape(r))]), axis=0)
+    mass   = np.asarray(rho, dtype=float) * np.asarray(Va, dtype=float)
+
+    # integrals computation
+    areaIntegral = spanIntegral(r, values, None, hub, tip, area=True)
+    massIntegral = spanIntegral(r, values, mass, hub, tip, area=True)
+
+    # reduction allocation
+    reduction = {'area'     : {name: areaIntegral[ii] / areaIntegral[-1] for ii, name in enumerate(names)},
+                 'mass'     : {name: massIntegral[ii] / massIntegral[-1] for ii, name in enumerate(names)},
+                 'mFlux'    : massIntegral[-1],
+                 'annulus'  : areaIntegral[-1]}
+
+    return reduction
+
+def sectionArray(sections, name):
+    '''
+    This function collects a quantity from a list of section objects (see turboClass.bladeSection).
+        inputs:
+            sections    -- list of section objects or SectionArray object
+            name        -- attribute name
+        output:
+            values      -- section values [nSection] -> copy of the SectionArray column
+    '''
+
+    # section array -> the quantity is already stored as a column
+    if hasattr(sections, 'columns'):
+        return np.array(sections.column(name), dtype=float)
+
+    return np.array([getattr(section, name) for section in sections], dtype=float)
+
+def sectionReduction(sections, names=['Pt', 'Tt', 's'], extra={}):
+    '''
+    This function computes the area and mass averages of the quantities of a list of section objects (see spanReduction).
+        inputs:
+            sections    -- list of section objects or SectionArray object -> the sections go from the hub to the tip
+            names       -- section attributes to average
+            extra       -- dictionary of other section quantities {name: [nSection]} -> i.e. eta, loss
+        output:
+            reduction   -- see spanReduction
+    '''
+
+    # section arrays
+    r = sectionArray(sections, 'midpoint')
+    fields = {name: sectionArray(sections, name) for name in names}
+    fields.update(extra)
+
+    return spanReduction(r, fields, sectionArray(sections, 'rho'), sectionArray(sections, 'Va'), hub=sections[0].bottom, tip=sections[-1].tip)
+
+def sectionRatio(sections, numerator, denominator, weighting='mass'):
+    '''
+    This function computes the ratio between the span averages of two section quantities -> i.e. isentropic work / euler work.
+        inputs:
+            sections    -- list of section objects or SectionArray object -> the sections go from the hub to the tip
+            numerator   -- section values of the numerator [nSection]
+            denominator -- section values of the denominator [nSection]
+            weighting   -- span/area/mass (see weightings) -> area and mass use sectionReduction
+                        -- None -> sections mean value of the ratio
+        output:
+            ratio       -- ratio between the span averages
+    '''
+
+    # sections mean value 
+    if weighting is None:
+        return np.mean(np.asarray(numerator, dtype=float) / np.asarray(denominator, dtype=float))
+
+    if weighting not in weightings:
+        raise ValueError('Unknown weighting: {0}. Allowed weightings: {1}.'.format(weighting, ', '.join(weightings)))
+
+    if weighting == 'span':
+        r = sectionArray(sections, 'midpoint')
+        hub, tip = sections[0].bottom, sections[-1].tip
+        return spanAverage(r, numerator, 'span', hub=hub, tip=tip) / spanAverage(r, denominator, 'span', hub=hub, tip=tip)
+
+    # area and mass averages in a single pass
+    reduction = sectionReduction(sections, names=[], extra={'numerator': numerator, 'denominator': denominator})
+
+    return reduction[weighting]['numerator'] / reduction[weighting]['denominator']
+
+def sameSections(bottom, tip, newBottom, newTip):
+    '''
+    This function checks if two span discretizations have the same stream tubes.
+        inputs:
+            bottom      -- stream tubes lowest point [nSection]
+            tip         -- stream tubes highest point [nSection]
+            newBottom   -- new stream tubes lowest point [nNew]
+            newTip      -- new stream tubes highest point [nNew]
+        output:
+            same        -- boolean value 
+    '''
+
+    if np.size(bottom) != np.size(newBottom):
+        return False
+
+    return np.allclose(bottom, newBottom, rtol=1e-12, atol=0) and np.allclose(tip, newTip, rtol=1e-12, atol=0)
+
+def sectionRemap(bottom, tip, values, mFlux, newBottom, newTip):
+    '''
+    This function remaps the stream tubes quantities on a new span discretization conserving the mass flow rate.
+        inputs:
+            bottom      -- stream tubes lowest point [nSection]
+            tip         -- stream tubes highest point [nSection]
+            values      -- dictionary of the stream tubes quantities {name: [nSection]}
+            mFlux       -- stream tubes mass flow rate [nSection]
+            newBottom   -- new stream tubes lowest point [nNew]
+            newTip      -- new stream tubes highest point [nNew]
+        output:
+            newFlux     -- new stream tubes mass flow rate [nNew] -> sum(newFlux) = sum(mFlux)
+            newValues   -- dictionary of the new stream tubes mass averaged quantities {name: [nNew]}
+    '''
+
+    # arrays allocation
+    bottom, tip, mFlux, newBottom, newTip = [np.asarray(x, dtype=float) for x in [bottom, tip, mFlux, newBottom, newTip]]
+
+    # hub and tip radii of the annulus
+    hub,    shroud    = np.min(bottom),    np.max(tip)
+    newHub, newShroud = np.min(newBottom), np.max(newTip)
+
+    # normalized span coordinate of the new stream tubes [nNew, 1]
+    lower = ((newBottom - newHub) / (newShroud - newHub))[:,np.newaxis]
+    upper = ((newTip - newHub) / (newShroud - newHub))[:,np.newaxis]
+
+    # overlap of the stream tubes in the source radii [nNew, nSection]
+    rLow  = np.clip(hub + lower * (shroud - hub), bottom, tip)
+    rHigh = np.clip(hub + upper * (shroud - hub), bottom, tip)
+
+    # mass flow rate of each overlap -> uniform mass flux on the annulus area of the source stream tube
+    overlap = mFlux * (rHigh**2 - rLow**2) / (tip**2 - bottom**2)
+
+    # new stream tubes mass flow rate and mass averages
+    newFlux   = np.sum(overlap, axis=1)
+    newValues = {name: np.sum(overlap * np.asarray(value, dtype=float), axis=1) / newFlux for name, value in values.items()}
+
+    return newFlux, newValues
@@ -7,64 +7,193 @@
 #  
 
 # importing libraries
+import os
 import numpy as np 
 import matplotlib.pyplot as plt 
 from scipy import interpolate
 
-def efficiency(phi=0, rD=0, plot=False, save=False, position='latex/figures/efficiency.pdf'):
+# Lieblein chart circle model
+# circle origin vector 
+originVec = np.array([[0.48, 0.5], [0.5, 0.5],[0.567, 0.5],[0.627, 0.5], [0.75, 0.5], [0.87, 0.5]])
+# circle radius vector
+radiusVec = np.array([0, 0.2, 0.337, 0.44, 0.609, 0.76])
+# circle efficiency vector 
+etaVec = np.array([0.926, 0.92, 0.91, 0.90, 0.88, 0.86])
+# radius vs Xorigin interpolation 
+origin2radius = interpolate.interp1d(originVec[:,0], radiusVec, kind='linear', fill_value='extrapolate', bounds_error=False)
+# radius vs efficiency intepolation
+radius2eta = interpolate.interp1d(radiusVec, etaVec, kind='linear', fill_value='extrapolate', bounds_error=False)
+
+def circleEfficiency(phi, rD, dim=1000, chunkSize=1000):
     '''
-    This function describes the adimensional parameters for the turbomachinery design.
-        inputs: 
-            phi         -- flow coefficient
-            rD          -- reaction degree
-            plot        -- boolean value for the plotting of the Leiblein efficiency chart
-            save        -- boolean value for the saving of the charts in vectorial format
-            position    -- path where to save the vectorial image (if save == True)
+    This function computes the efficiency with the circle model of the Lieblein chart.
+    Each point lays on a circle whose origin moves on the rD = 0.5 line between 0.48 and phi; the circle radius is linked to the efficiency.
+        inputs:
+            phi         -- flow coefficient -> array
+            rD          -- reaction degree -> array
+            dim         -- # of circle origins studied for each point
+            chunkSize   -- # of points computed at the same time
         output:
-            eta         -- efficiency with respect Leiblein chart
+            eta         -- efficiency -> array
+            origin      -- circle origin x coordinate -> array
+            radius      -- circle radius -> array
     '''
 
-    # origin vector 
-    originVec = np.array([[0.48, 0.5], [0.5, 0.5],[0.567, 0.5],[0.627, 0.5], [0.75, 0.5], [0.87, 0.5]])
-
-    # radius vector
-    radiusVec = np.array([0, 0.2, 0.337, 0.44, 0.609, 0.76])
-
-    # efficiency vector 
-    etaVec = np.array([0.926, 0.92, 0.91, 0.90, 0.88, 0.86])
+    # input allocation 
+    phi, rD = np.broadcast_arrays(np.asarray(phi, dtype=float), np.asarray(rD, dtype=float))
+    shape = phi.shape
+    phi = phi.flatten()
+    rD  = rD.flatten()
 
-    # radius vs Xorigin interpolation 
-    origin2radius = interpolate.interp1d(originVec[:,0], radiusVec, kind='linear', fill_value='extrapolate', bounds_error=False)
+    # output allocation 
+    origin = np.zeros(phi.shape)
+    radius = np.zeros(phi.shape)
 
-    # radius vs efficiency intepolation
-    radius2eta = interpolate.interp1d(radiusVec, etaVec, kind='linear', fill_value='extrapolate', bounds_error=False)
+    # origin position parameter 
+    t = np.linspace(0, 1, dim)
 
-    # computing efficiency from input data 
-    if rD != 0 and phi != 0:
-        # setting up vector dimension 
-        dim = 1000 
+    for ii in range(0, phi.shape[0], chunkSize):
+        # chunk data 
+        phiChunk = phi[ii:ii+chunkSize, np.newaxis]
+        rDchunk  = rD[ii:ii+chunkSize, np.newaxis]
 
         # computing possible point distance from circle center
-        deltaX = np.linspace(phi - 0.48, 0, dim)
-        deltaY = rD - 0.5 
-        
+        deltaX = (phiChunk - 0.48) * (1 - t)
+        deltaY = rDchunk - 0.5
+
         # computing center position 
-        XoriginVec = 0.48 + np.linspace(0, phi - 0.48, dim)
-        
+        XoriginVec = 0.48 + (phiChunk - 0.48) * t
+
         # computing all possible radius 
         deltaRadius = np.sqrt(deltaX**2 + deltaY**2)
-        
+
         # computing radius related to eta circles
         etaRadius = origin2radius(XoriginVec)
-        
+
         # finding minimum error position
-        r = np.abs(etaRadius - deltaRadius)
-        ii = np.where(r == r.min())
+        index = np.argmin(np.abs(etaRadius - deltaRadius), axis=1)
+
+        # computing origin and circle radius 
+        origin[ii:ii+chunkSize] = np.take_along_axis(XoriginVec, index[:,np.newaxis], axis=1)[:,0]
+        radius[ii:ii+chunkSize] = np.take_along_axis(etaRadius, index[:,np.newaxis], axis=1)[:,0]
+
+    # computing efficiency
+    eta = radius2eta(radius)
+
+    return eta.reshape(shape), origin.reshape(shape), radius.reshape(shape)
+
+class efficiencyMap:
+    def __init__(self, folder=os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data', 'perfCoeff', 'liebleinEta')):
+        '''
+        Lieblein efficiency map object, it is built from the digitized chart contours stored in data/perfCoeff/liebleinEta.
+            * each axialEfficiency0xx.txt file stores [phi, rD] points of the eta = 0.xx contour 
+            * the chart maximum efficiency point (eta = 0.926 @ phi = 0.48, rD = 0.5) is added to the contours
+            * eta(phi, rD) is computed with a linear interpolation over the Delaunay triangulation of the contour points
+            * outside the chart contours the circle model is used 
+        '''
+
+        # importing libraries 
+        import glob
+
+        # data allocation 
+        self.folder   = folder
+        self.contours = {}
+
+        # reading contours 
+        for file in sorted(glob.glob(os.path.join(folder, 'axialEfficiency*.txt'))):
+            # efficiency from file name
+            eta = int(os.path.basename(file)[len('axialEfficiency'):-len('.txt')]) / 100
+            # contour points
+            self.contours[eta] = np.loadtxt(file, comments='#', delimiter=',')
+
+        if len(self.contours) == 0:
+            raise ValueError('No efficiency contour file found in {0}'.format(folder))
+
+        # scattered data allocation -> [phi, rD] and eta 
+        points = np.concatenate([self.contours[eta] for eta in self.contours] + [originVec[0:1]], axis=0)
+        values = np.concatenate([eta * np.ones(self.contours[eta].shape[0]) for eta in self.contours] + [etaVec[0:1]])
+
+        # interpolant generation 
+        self.interpolant = interpolate.LinearNDInterpolator(points, values)
+
+    def __call__(self, phi, rD):
+        '''
+        This function computes the efficiency from the Lieblein chart contours.
+            inputs:
+                phi         -- flow coefficient -> float or array
+                rD          -- reaction degree -> float or array
+            output:
+                eta         -- efficiency -> float or array
+        '''
+
+        # input allocation 
+        phi, rD = np.broadcast_arrays(np.asarray(phi, dtype=float), np.asarray(rD, dtype=float))
+
+        # efficiency interpolation 
+        eta = self.interpolant(phi, rD)
+
+        # points outside the chart contours -> circle model 
+        outside = np.isnan(eta)
+        if np.any(outside):
+            eta[outside] = circleEfficiency(phi[outside], rD[outside])[0]
 
-        # computing origin, circle radius and efficiency
-        origin = np.array([XoriginVec[ii].item(), 0.5])
-        radius = etaRadius[ii].item()
-        eta = radius2eta(radius)
+        # returning float for scalar inputs
+        if eta.ndim == 0:
+            eta = eta.item()
+
+        return eta
+
+# efficiency map cache -> the contour files are read only once for each folder
+efficiencyMaps = {}
+
+def getEfficiencyMap(folder=None):
+    '''
+    This function returns the cached efficiency map object related to a contour folder.
+        inputs:
+            folder      -- folder that stores the axialEfficiency0xx.txt files -> None for data/perfCoeff/liebleinEta
+        output:
+            etaMap      -- efficiencyMap object
+    '''
+
+    # map generation 
+    if folder not in efficiencyMaps:
+        if folder is None:
+            efficiencyMaps[folder] = efficiencyMap()
+        else:
+            efficiencyMaps[folder] = efficiencyMap(folder)
+
+    return efficiencyMaps[folder]
+
+def efficiency(phi=0, rD=0, plot=False, save=False, position='latex/figures/efficiency.pdf', model='circle'):
+    '''
+    This function describes the adimensional parameters for the turbomachinery design.
+        inputs: 
+            phi         -- flow coefficient -> float or array
+            rD          -- reaction degree -> float or array
+            plot        -- boolean value for the plotting of the Leiblein efficiency chart
+            save        -- boolean value for the saving of the charts in vectorial format
+            position    -- path where to save the vectorial image (if save == True)
+            model       -- circle/map => efficiency model
+                            -- circle: Lieblein chart approximated with circles 
+                            -- map:    interpolation of the digitized Lieblein chart contours (data/perfCoeff/liebleinEta)
+        output:
+            eta         -- efficiency with respect Leiblein chart
+    '''
+
+    # checking model 
+    if model != 'circle' and model != 'map':
+        raise ValueError('Wrong efficiency model: model = circle/map')
+
+    # computing efficiency from input data 
+    compute = np.all(np.asarray(rD) != 0) and np.all(np.asarray(phi) != 0)
+    if compute:
+        if model == 'circle':
+            eta, origin, radius = circleEfficiency(phi, rD)
+            # returning float for scalar inputs
+            if eta.ndim == 0:
+                eta, origin, radius = eta.item(), origin.item(), radius.item()
+        else:
+            eta = getEfficiencyMap()(phi, rD)
 
     # plotting efficiency
     # plotting vectors
@@ -94,13 +223,21 @@ def efficiency(phi=0, rD=0, plot=False, save=False, position='latex/figures/effi
 
         # plotting efficiency taken from charts 
         plt.plot(0.48, 0.5, 'ok', label=r'$\eta = 0.926$')
-        for ii,r in enumerate(radiusVec):
-            plt.plot(originVec[ii,0] + np.cos(thetaVec) * r, originVec[ii,1] + np.sin(thetaVec) * r, color=colorVec[ii], label=labelVec[ii])
+        if model == 'circle':
+            for ii,r in enumerate(radiusVec):
+                plt.plot(originVec[ii,0] + np.cos(thetaVec) * r, originVec[ii,1] + np.sin(thetaVec) * r, color=colorVec[ii], label=labelVec[ii])
+        else:
+            etaMap = getEfficiencyMap()
+            for ii,eta_ in enumerate(sorted(etaMap.contours, reverse=True)):
+                plt.plot(etaMap.contours[eta_][:,0], etaMap.contours[eta_][:,1], '.', color=colorVec[np.mod(ii+1, len(colorVec))], label=r'$\eta = {0:.2f}$'.format(eta_))
 
         # plotting efficiency point computed
-        if rD != 0 and phi != 0:
-            plt.plot(origin[0] + np.cos(thetaVec) * radius, origin[1] + np.sin(thetaVec) * radius, 'g--', label=r'$\eta = {0:.4f}$'.format(eta))
+        if compute and np.size(eta) == 1:
+            if model == 'circle':
+                plt.plot(origin + np.cos(thetaVec) * radius, 0.5 + np.sin(thetaVec) * radius, 'g--', label=r'$\eta = {0:.4f}$'.format(eta))
             plt.plot(phi, rD, linestyle='', marker='s', markeredgewidth=2, markeredgecolor='k', color='g', markersize=8, label=r'$[\phi = {0:.2f}, \chi = {1:.2f}]$'.format(phi, rD))
+        elif compute:
+            plt.plot(phi, rD, linestyle='', marker='s', markeredgewidth=2, markeredgecolor='k', color='g', markersize=8)
         
         plt.xlabel(r'$\phi$')
         plt.ylabel(r'$\chi$')
@@ -119,9 +256,55 @@ def efficiency(phi=0, rD=0, plot=False, save=False, position='latex/figures/effi
             plt.tight_layout()
             plt.show()
 
-    if rD != 0 and phi != 0:
+    if compute:
         return eta
 
+def psiLimCoeff(rD=0.5):
+    '''
+    This function computes the coefficients of the work coefficient limit curve (ASME eqn. 10.28 - 10.30):
+        psiLim(phi) = A + B * phi**C
+        inputs:
+            rD          -- stage reaction degree -> float or array
+        output:
+            A, B, C     -- psiLim coefficients
+    '''
+
+    # curve symmetric with respect to reaction degree = 0.5
+    Rcap = 0.5 + np.abs(rD - 0.5)
+
+    # coefficients computation
+    A = 6 * Rcap / 17
+    B = 0.85 * (0.5/Rcap)**1.18
+    C = 2 + 0.1/Rcap
+
+    return A, B, C
+
+def phiSolver(psi, rD=0.5, perc=1):
+    '''
+    This function computes the flow coefficient such that perc * psiLim(phi) = psi.
+    psiLim(phi) is monotone for phi > 0 -> the root is unique and it is computed exactly by inverting psiLim.
+        inputs:
+            psi         -- target work coefficient -> float or array
+            rD          -- stage reaction degree -> float or array
+            perc        -- percentage of psi with respect to the psi limit
+        output:
+            phi         -- flow coefficient -> NaN if psi / perc < psiLim(0), the point cannot be reached
+    '''
+
+    # psiLim coefficients
+    A, B, C = psiLimCoeff(rD)
+
+    # psiLim inversion
+    delta = np.asarray(psi / perc - A, dtype=float)
+    phi = np.full(delta.shape, np.nan)
+    np.power(delta / B, 1 / C, out=phi, where=delta >= 0)
+
+    # returning float for scalar inputs
+    if phi.ndim == 0:
+        phi = phi.item()
+
+    return phi
+
 def stagePerf(phi=0, psi=0, perc=1, rD=0.5, phiVec=np.linspace(0,1.5,1000), plot=True, save=False, position='latex/figures/stagePerf.pdf'):
     '''
     This function plots the phi and psi parameter with respect to ASME axial compressor design constraints
@@ -132,57 +315,43 @@ def stagePerf(phi=0, psi=0, perc=1, rD=0.5, phiVec=np.linspace(0,1.5,1000), plot
             beta1 < 70 deg  -- for avoiding reduction in cascade performances 
             curve symmetric with respect to reaction degree = 0.5
         inputs:
-            phi         -- flow coefficient for the stage 
-            psi         -- work coefficient for the stage
+            phi         -- flow coefficient for the stage -> float or array
+            psi         -- work coefficient for the stage -> float or array
             perc        -- percentage of psi with respect to the psi limit 
                         -- this variable activates if:
                             perc != 0 
                             psi == 0 
-            rD          -- stage reaction degree 
+            rD          -- stage reaction degree -> float or array 
             phiVec      -- phi vector for the psiLim representation 
             plot        -- boolean value for plotting the chart 
             save        -- boolean value for plotting the chart in vectorial format 
             position    -- path where the pgf file should be saved 
         output:
             psi         -- if perc != 0 and phi != 0 -> computing psi given phi as input 
-
+            phi         -- if perc != 0 and psi != 0 -> computing phi given psi as input: perc * psiLim(phi) = psi
+                        -- phi = NaN if psi cannot be reached 
     '''
     
     # function generation eqn. from ASME 10.28 - 10.30
-    Rcap = 0.5 + np.abs(rD - 0.5)
-    psiLim = lambda phi: 6 * Rcap / 17 + 0.85 * (0.5/Rcap)**1.18 * phi**(2 + 0.1/Rcap)
+    A, B, C = psiLimCoeff(rD)
+    psiLim = lambda phi: A + B * phi**C
     psiBeta = lambda phi: 5 * phi - 2 * rD
 
-    def phiFinder(phiVec, psiTarget, perc=perc, error=5e-3):
-        '''
-        This function computes the phi value for a defined psi value.
-            inputs: 
-                phiVec      -- array that stores phi study points
-                psiTarget   -- psiLim(phi) = psiTarget
-                perc        -- sagety margin with respect to the minimum velocity ratio 
-                               such that there is not huge recirculation of flow in the compressor 
-        '''
-
-        if perc != 0:
-            for _,phi in enumerate(phiVec):
-                if np.abs((perc * psiLim(phi) - psiTarget) / (perc * psiLim(phi))) < error:
-                    return phi 
-
-    # values computation
-    psiLIM = psiLim(phiVec)             # work coefficient limit vs flow coefficient 
-    psiBETA = psiBeta(phiVec)           # work coefficient vs flow coefficient for beta = 70deg 
-    phi1 = phiFinder(phiVec, 1, perc=1) # phi value such that psiLim == 1
-
     # computing psi with respect to a percentage and phi 
-    if perc != 0 and phi != 0 and psi == 0:      
+    if perc != 0 and np.any(phi != 0) and np.all(psi == 0):      
         # computing psi 
         psi = perc * psiLim(phi)
 
     # computing phi such that psi == psiTarget
-    if phi == 0 and psi != 0:
-        phi = phiFinder(phiVec, psi)
+    if np.all(phi == 0) and np.any(psi != 0) and perc != 0:
+        phi = phiSolver(psi, rD, perc)
 
     if plot or save:
+        # values computation
+        psiLIM = psiLim(phiVec)             # work coefficient limit vs flow coefficient 
+        psiBETA = psiBeta(phiVec)           # work coefficient vs flow coefficient for beta = 70deg 
+        phi1 = phiSolver(1, rD, 1)          # phi value such that psiLim == 1
+
         if save:
             import matplotlib
             matplotlib.use("pgf")
@@ -200,8 +369,11 @@ def stagePerf(phi=0, psi=0, perc=1, rD=0.5, phiVec=np.linspace(0,1.5,1000), plot
         plt.plot(phiVec, psiLIM, 'k', label=r'$\psi_{Lim}$')
         plt.plot(phiVec, psiBETA, 'r', label=r'$\beta > 70^{\circ}$')
         plt.plot([phi1, phi1] , [0, np.max(psiLIM)], 'b', label=r'$\phi_{Lim}$')
-        if psi != 0 and phi !=0:
-            plt.plot(phi, psi, linestyle='', marker='o', markersize=7, markeredgewidth=1, markeredgecolor='k', color='g', label=r'$[\phi = {0:.3f}, \psi = {1:.3f}]$'.format(phi, psi))
+        if np.size(phi) == 1 and np.size(psi) == 1:
+            if psi != 0 and phi !=0:
+                plt.plot(phi, psi, linestyle='', marker='o', markersize=7, markeredgewidth=1, markeredgecolor='k', color='g', label=r'$[\phi = {0:.3f}, \psi = {1:.3f}]$'.format(phi, psi))
+        else:
+            plt.plot(phi, psi, linestyle='', marker='o', markersize=7, markeredgewidth=1, markeredgecolor='k', color='g')
         plt.xlim(0,phi1)
         plt.ylim(0,1)
         plt.xlabel(r'$\phi$')
@@ -222,10 +394,507 @@ def stagePerf(phi=0, psi=0, perc=1, rD=0.5, phiVec=np.linspace(0,1.5,1000), plot
             plt.tight_layout()
             plt.show()        
 
-    if phi != 0 and psi !=0:
+    if np.any(phi != 0) and np.any(psi != 0):
         return phi, psi 
 
-def stageProperties(rD, psi, rMean, mFlux, Tt0, Pt0, betaP, T1real=False, printout=False, R=287.06, gamma=1.4, continuityCorrect=False, save=False):
+# stage properties structured array description -> one field for each stageProperties output + validity mask
+stageDtype = np.dtype([('adimVec',        float, (3,)),       # [phi, psi, eta]
+                       ('bladeVec',       float, (3,)),       # [b0, b1, b2]
+                       ('rotationVec',    float, (3,)),       # [Umean, omega, n]
+                       ('V0vec',          float, (3,)),       # [Va0, Vt0, alpha0]
+                       ('V1vec',          float, (3,)),       # [Va1, Vt1, alpha1]
+                       ('V2vec',          float, (3,)),       # [Va2, Vt2, alpha2]
+                       ('W0vec',          float, (3,)),       # [Wa0, Wt0, beta0]
+                       ('W1vec',          float, (3,)),       # [Wa1, Wt1, beta1]
+                       ('W2vec',          float, (3,)),       # [Wa2, Wt2, beta2]
+                       ('thermo0',        float, (8,)),       # [T0, P0, rho0, Tt0, Pt0, rhot0, M0, Mr0]
+                       ('thermo1',        float, (8,)),       # [T1, P1, rho1, Tt1, Pt1, rhot1, M1, Mr1]
+                       ('thermo2',        float, (8,)),       # [T2, P2, rho2, Tt2, Pt2, rhot2, M2, Mr2]
+                       ('work',           float, (2,)),       # [L, Lis]
+                       ('continuityIter', int),               # continuity correction # of iterations
+                       ('valid',          bool),
+                       ('reason',         np.uint8)])         # failure reason code -> see stageReasons
+
+# failure reason codes of the stage computation
+stageReasons = {0: 'ok',
+                1: 'psi unreachable',
+                2: 'not physical quantities',
+                3: 'continuity correction not converged',
+                4: 'not physical hub/tip sections'}
+
+def stagePropertiesArray(rD, psi, rMean, mFlux, Tt0, Pt0, betaP, T1real=False, R=287.06, gamma=1.4, continuityCorrect=False, etaModel='circle', tolContinuity=1e-6, nMaxContinuity=100, nScanContinuity=32, gas=None):
+    '''
+    This function computes the properties of many stages following the meanline initial design procedure (see stageProperties).
+    The inputs are broadcast together -> the output has the broadcast shape of the inputs.
+        inputs:
+            rD                  -- reaction degree at the mean line -> float or array
+            psi                 -- work coefficient at the mean line -> float or array
+            rMean               -- mean line radius -> float or array
+            mFlux               -- mass flux -> float or array
+            Tt0                 -- total temperature -> float or array
+            Pt0                 -- total pressure -> float or array
+            betaP               -- pressure ratio -> float or array
+            T1real              -- boolean value for computation of the real or ideal rotor outlet temperature startig from real work L = Lis / eta
+            R                   -- gas constant
+            gamma               -- specific heat ratio
+            continuityCorrect   -- boolean value for the correction of the rotor outlet axial speed with respect to the continuity equation 
+            etaModel            -- circle/map => Lieblein chart efficiency model (see efficiency)
+            tolContinuity       -- continuity correction tolerance -> |Va1 - VaOutCheck| / VaOutCheck
+            nMaxContinuity      -- maximum # of iterations of the continuity correction 
+            nScanContinuity     -- # of points used for the bracketing of the continuity correction solution
+            gas                 -- gas model (see thermoTransf.flowState.perfectGas, thermoTransf.gasTable.tabulatedGas) -> None: perfectGas(R, gamma)
+        output:
+            result              -- structured array (stageDtype) -> one field for each stageProperties output
+                                -- result['valid'] is False for the stages that cannot be computed:
+                                    -- psi cannot be reached with the psiLim constraint
+                                    -- not physical quantities (negative temperatures, imaginary speeds)
+                                    -- continuity correction not converged (choked rotor outlet)
+                                -- result['reason'] stores the failure reason code (see stageReasons)
+                                -- result['continuityIter'] stores the # of iterations of the continuity correction
+    '''
+
+    # importing libraries  
+    from thermoTransf.flowState import flowState, perfectGas
+
+    # broadcasting inputs
+    rD, psi, rMean, mFlux, Tt0, Pt0, betaP = np.broadcast_arrays(*[np.asarray(x, dtype=float) for x in [rD, psi, rMean, mFlux, Tt0, Pt0, betaP]])
+
+    # result allocation 
+    result = np.zeros(rD.shape, dtype=stageDtype)
+
+    # air properties allocation 
+    if gas is None:
+        gas = perfectGas(R=R, gamma=gamma)
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        # adimensional parameters computation 
+        # -- from performance charts 
+        phi = np.asarray(phiSolver(psi, rD, perc=0.97))
+        # efficiency computation only for the reachable points
+        eta = np.full(rD.shape, np.nan)
+        reachable = np.isfinite(phi)
+        if np.any(reachable):
+            eta[reachable] = efficiency(phi=phi[reachable], rD=rD[reachable], plot=False, model=etaModel)
+
+        ######################## WORK ########################
+        # ideal compression work 
+        Lis = gas.enthalpyChange(Tt0, gas.isentropicTemperature(Tt0, betaP))
+        # real compression work 
+        L = Lis / eta
+        # total temperature computation
+        Tt1 = gas.temperatureChange(Tt0, L)
+
+        ######################## ROTATION ######################## 
+        # mean section revolution speed from work coefficient
+        Umean = np.sqrt(L / psi) 
+        # angular speed 
+        omega = Umean / rMean
+        # rpm 
+        n = omega * 60 / (2 * np.pi)
+
+        ######### MAIN VELOCITIES COMPUTATION FROM WORK RESULTS #########
+        # Va0, Vt0 computation 
+        # axial inlet velocity from flow coefficient
+        Va0 = phi * Umean
+        # tangential inlet velocity from reaction degree and work coefficient
+        lam = 2 * psi 
+        Vt0 = (1 - rD - lam/4) * Umean 
+        # tangential rotor exit velocity computation
+        Vt1 = (1 - rD + lam/4) * Umean 
+
+        ######### ROTOR INLET QUANTITIES ######### 
+        # KINETICS 
+        # relative speed computation 
+        Wa0 = Va0
+        Wt0 = Vt0 - Umean
+        # veolcity magnitude computation
+        V0 = np.sqrt(Va0**2 + Vt0**2)
+        W0 = np.sqrt(Wa0**2 + Wt0**2)
+        # aerodynamic angles computation 
+        alpha0 = np.rad2deg(np.arctan(Vt0/Va0))
+        beta0 = np.rad2deg(np.arctan(Wt0/Wa0))
+        # THERMODYNAMICS
+        # rotor inlet flow state -> static quantities, speed of sound and mach numbers
+        T0, a0, M0, Mr0, P0, rhot0, rho0 = flowState(gas, Tt=Tt0, Pt=Pt0, V=V0, W=W0).fields(['T', 'a', 'M', 'Mr', 'P', 'rhot', 'rho'])
+
+        ######### ROTOR INLET BLADE DIMENSION #########
+        # rotor inlet blade height 
+        b0 = mFlux / (rho0 * 2 * np.pi * rMean * Va0)
+
+        ######### ROTOR OUTLET/STATOR INLET QUANTITIES #########  
+        def rotorOutlet(Va1):
+            '''
+            This function computes the rotor outlet quantities given the rotor outlet axial speed.
+            '''
+
+            # KINETICS
+            Wa1 = Va1 
+            Wt1 = Vt1 - Umean
+            # velocity magnitude computation
+            V1 = np.sqrt(Va1**2 + Vt1**2)
+            W1 = np.sqrt(Wa1**2 + Wt1**2)
+            # flow angle computation
+            alpha1 = np.rad2deg(np.arctan(Vt1/Va1))
+            beta1 = np.rad2deg(np.arctan(Wt1/Wa1))
+
+            # THERMODYNAMICS
+            # static temperature computation
+            T1 = gas.staticTemperature(Tt1, V1)
+
+            # EFFICIENCY CORRECTION -> see stageProperties
+            if T1real:
+                # T1 isoentropic computation 
+                T1iso = gas.temperatureChange(T0, eta * gas.enthalpyChange(T0, T1))
+                # real pressure computation using the isentropic transformation law and the ideal T1iso temperature
+                P1 = gas.isentropicPressure(Pt0, Tt0, T1iso)
+            else: 
+                # ideal pressure computation using the isentropic transformation law and the ideal T1 temperature
+                P1 = gas.isentropicPressure(Pt0, Tt0, T1)
+            
+            # rotor outlet flow state -> density, speed of sound, mach numbers and total quantities
+            rho1, a1, M1, Mr1, Pt1, rhot1 = flowState(gas, T=T1, Tt=Tt1, P=P1, V=V1, W=W1).fields(['rho', 'a', 'M', 'Mr', 'Pt', 'rhot'])
+
+            return Wa1, Wt1, V1, W1, alpha1, beta1, T1, P1, rho1, a1, M1, Mr1, Pt1, rhot1
+
+        def continuityResidual(Va1):
+            '''
+            This function computes the rotor outlet continuity residual (Va1 - VaOutCheck) / VaOutCheck.
+                VaOutCheck -> axial speed that satisfies the continuity equation with the blade without flaring (b1 = b0)
+            '''
+
+            # rotor outlet density 
+            rho1 = rotorOutlet(Va1)[8]
+
+            return rho1 * Va1 * b0 * 2 * np.pi * rMean / mFlux - 1
+
+        # first guess of the outlet blade axial speed 
+        Va1 = np.array(Va0)
+        # # of iterations of the continuity correction
+        continuityIter = np.zeros(rD.shape, dtype=int)
+        converged = np.ones(rD.shape, dtype=bool)
+
+        if continuityCorrect:
+            # the rotor outlet mass flux rho1 * Va1 grows from 0 and reaches a maximum (choking) 
+            #   -> the first sign change of the residual going from Va1 = 0 to the maximum axial speed brackets the subsonic solution
+            # maximum axial speed -> T1 = gas.Tmin (0 for the perfect gas)
+            VaMax = np.sqrt(gas.velocity(Tt1, gas.Tmin)**2 - Vt1**2)
+
+            # bracket search -> A and B are the bracket ends, B stores the last computed point
+            VaA, resA = np.full(rD.shape, np.nan), np.full(rD.shape, np.nan)
+            VaB, resB   = np.full(rD.shape, np.nan), np.full(rD.shape, np.nan)
+            bracketed     = np.zeros(rD.shape, dtype=bool)
+            # Va1 = 0 -> null mass flux -> residual = -1 
+            VaScan        = np.zeros(rD.shape)
+            resScan       = - np.ones(rD.shape)
+            for frac in np.linspace(0, 1, nScanContinuity + 1)[1:]:
+                VaNext  = VaMax * frac
+                resNext = continuityResidual(VaNext)
+                # first sign change 
+                new = np.logical_not(bracketed) & (resScan < 0) & (resNext >= 0)
+                VaA[new], resA[new] = VaScan[new], resScan[new]
+                VaB[new], resB[new]   = VaNext[new], resNext[new]
+                bracketed = bracketed | new
+                VaScan, resScan = VaNext, resNext
+
+            # safeguarded secant (Illinois) iterations -> the root is kept between VaA and VaB
+            active = np.array(bracketed)
+            Va1 = np.where(bracketed, VaB, Va0)
+            counter = 0
+            while np.any(active) and counter < nMaxContinuity:
+                # updating counter
+                counter = counter + 1
+                continuityIter[active] = counter
+
+                # secant point 
+                VaNew  = np.where(active, VaB - resB * (VaB - VaA) / (resB - resA), Va1)
+                resNew = continuityResidual(VaNew)
+
+                # bracket update -> the end that is kept twice has its residual halved
+                switch = active & (resNew * resB < 0)
+                keep   = active & np.logical_not(switch)
+                VaA  = np.where(switch, VaB, VaA)
+                resA = np.where(switch, resB, np.where(keep, resA / 2, resA))
+                VaB   = np.where(active, VaNew, VaB)
+                resB  = np.where(active, resNew, resB)
+                Va1    = np.where(active, VaNew, Va1)
+
+                # updating active stages
+                active = active & (np.abs(resNew) > tolContinuity)
+
+            # converged stages 
+            converged = bracketed & np.logical_not(active)
+
+        # rotor outlet quantities 
+        Wa1, Wt1, V1, W1, alpha1, beta1, T1, P1, rho1, a1, M1, Mr1, Pt1, rhot1 = rotorOutlet(Va1)
+
+        ######### STATOR OUTLET QUANTITIES #########
+        # main outlet quantities
+        # KINETICS 
+        Va2 = Va1 
+        Wa2 = Va2
+        Tt2 = Tt1
+        # from thermodynamics
+        deltaH = (1 - rD) * L
+        T2 = gas.temperatureChange(T1, deltaH)
+
+        # V2 & Vt2 computation  
+        V2 = gas.velocity(Tt2, T2)
+        # Vt2 computation and numerical correction 
+        Vt2 = np.where(np.abs(V2**2 - Va2**2) < 1e-10, 0.0, np.sqrt(V2**2 - Va2**2))
+
+        # W2 & Wt2 computation
+        Wt2 = Vt2 - 0 
+        W2 = np.sqrt(Wa2**2 + Wt2**2)
+        # aerodynamics angles 
+        alpha2 = np.rad2deg(np.arctan2(Vt2,Va2))
+        beta2 = np.rad2deg(np.arctan(Wt2/Wa2))
+        # THERMODYNAMICS
+        # pressure computation
+        Pt2 = Pt1
+        P2 = gas.isentropicPressure(P1, T1, T2)
+        # stator outlet flow state -> sound speed, mach numbers and densities
+        a2, M2, Mr2, rho2, rhot2 = flowState(gas, T=T2, Tt=Tt2, P=P2, Pt=Pt2, V=V2, W=W2).fields(['a', 'M', 'Mr', 'rho', 'rhot'])
+
+        ######### BLADE RADIUS #########
+        # rotor outlet/stator inlet  blade height
+        b1 = mFlux / (rho1 * 2 * np.pi * rMean * Va1)
+        # stator outlet blade height
+        b2 = mFlux / (rho2 * 2 * np.pi * rMean * Va2)
+
+    # result allocation 
+    result['adimVec']     = np.stack([phi, psi, eta], axis=-1)
+    result['bladeVec']    = np.stack([b0, b1, b2], axis=-1)
+    result['rotationVec'] = np.stack([Umean, omega, n], axis=-1)
+    result['V0vec']       = np.stack([Va0, Vt0, alpha0], axis=-1)
+    result['V1vec']       = np.stack([Va1, Vt1, alpha1], axis=-1)
+    result['V2vec']       = np.stack([Va2, Vt2, alpha2], axis=-1)
+    result['W0vec']       = np.stack([Wa0, Wt0, beta0], axis=-1)
+    result['W1vec']       = np.stack([Wa1, Wt1, beta1], axis=-1)
+    result['W2vec']       = np.stack([Wa2, Wt2, beta2], axis=-1)
+    result['thermo0']     = np.stack([T0, P0, rho0, Tt0, Pt0, rhot0, M0, Mr0], axis=-1)
+    result['thermo1']     = np.stack([T1, P1, rho1, Tt1, Pt1, rhot1, M1, Mr1], axis=-1)
+    result['thermo2']     = np.stack([T2, P2, rho2, Tt2, Pt2, rhot2, M2, Mr2], axis=-1)
+    result['work']        = np.stack([L, Lis], axis=-1)
+    result['continuityIter'] = continuityIter
+
+    # validity mask 
+    finite = np.ones(rD.shape, dtype=bool)
+    for name in stageDtype.names:
+        if stageDtype[name].base.kind == 'f':
+            finite = finite & np.all(np.isfinite(result[name]), axis=-1)
+    result['valid'] = reachable & converged & finite
+
+    # failure reason 
+    result['reason'] = np.where(np.logical_not(reachable), 1, np.where(np.logical_not(converged), 3, np.where(np.logical_not(finite), 2, 0)))
+
+    return result
+
+class stageCache:
+    '''
+    Memoization of the mean line stage solutions computed by stagePropertiesArray.
+        -- the stages are stored with a key made by the rounded inputs
+        -- in memory tier: bounded LRU (least recently used stages are removed first)
+        -- on disk tier: optional shelve file that persists between different runs 
+            -- the disk tier cannot be shared by concurrent processes
+    '''
+
+    def __init__(self, maxSize=4096, diskPath=None, digits=10):
+        '''
+        Cache object declaration:
+            inputs:
+                maxSize     -- maximum # of stages stored in memory
+                diskPath    -- shelve file path of the on disk tier -> None for no disk tier
+                digits      -- # of significant digits of the inputs used for the key generation
+        '''
+
+        # importing libraries
+        from collections import OrderedDict
+
+        self.maxSize  = maxSize
+        self.diskPath = diskPath
+        self.digits   = digits
+        self.memory   = OrderedDict()
+
+        # statistics
+        self.hits     = 0
+        self.diskHits = 0
+        self.misses   = 0
+
+    def rounding(self, x):
+        '''
+        This function rounds an array to the cache significant digits.
+        '''
+
+        with np.errstate(invalid='ignore', divide='ignore'):
+            # order of magnitude of the values 
+            exponent = np.where(np.isfinite(x) & (x != 0), np.floor(np.log10(np.abs(x))), 0)
+            scale = 10.0**exponent
+
+            return np.round(x / scale, self.digits - 1) * scale
+
+    def keys(self, inputs, options):
+        '''
+        This function generates the stage keys.
+            inputs:
+                inputs      -- list of the stage input arrays with the same shape
+                options     -- tuple of the hashable stage options (T1real, continuityCorrect, R, gamma, ...)
+            output:
+                keys        -- list of the stage keys
+        '''
+
+        # rounded inputs -> [nStages, nInputs]
+        values = np.stack([self.rounding(x.ravel()) for x in inputs], axis=-1)
+
+        return [tuple(row) + options for row in values.tolist()]
+
+    def get(self, key, db=None):
+        '''
+        This function returns a stored stage (None if the stage is not stored).
+            inputs:
+                key         -- stage key
+                db          -- opened disk tier
+        '''
+
+        if key in self.memory:
+            # updating the LRU order
+            self.memory.move_to_end(key)
+            self.hits = self.hits + 1
+            return self.memory[key]
+
+        if db is not None and repr(key) in db:
+            # disk tier -> the stage is moved in memory
+            record = db[repr(key)]
+            self.put(key, record)
+            self.diskHits = self.diskHits + 1
+            return record
+
+        self.misses = self.misses + 1
+        return None
+
+    def put(self, key, record, db=None):
+        '''
+        This function stores a stage.
+            inputs:
+                key         -- stage key
+                record      -- stage -> stageDtype element
+                db          -- opened disk tier
+        '''
+
+        # memory tier
+        self.memory[key] = record
+        self.memory.move_to_end(key)
+        if len(self.memory) > self.maxSize:
+            self.memory.popitem(last=False)
+
+        # disk tier
+        if db is not None:
+            db[repr(key)] = record
+
+    def evaluate(self, rD, psi, rMean, mFlux, Tt0, Pt0, betaP, T1real=False, R=287.06, gamma=1.4, continuityCorrect=False, etaModel='circle', tolContinuity=1e-6, nMaxContinuity=100, nScanContinuity=32, gas=None):
+        '''
+        This function computes the stage properties (see stagePropertiesArray) using the stored stages.
+        The stages that are not stored are computed at once by stagePropertiesArray and then stored.
+        The gas model key (gas.key) is part of the stage key -> stages computed with different gas models are stored separately.
+        The continuity correction settings (tolContinuity, nMaxContinuity, nScanContinuity) are part of the stage key as well.
+            output:
+                result      -- structured array (stageDtype) with the broadcast shape of the inputs
+        '''
+
+        # importing libraries
+        import shelve
+        import contextlib
+
+        # broadcasting inputs
+        inputs = np.broadcast_arrays(*[np.asarray(x, dtype=float) for x in [rD, psi, rMean, mFlux, Tt0, Pt0, betaP]])
+        shape  = inputs[0].shape
+
+        # stage keys
+        options = (bool(T1real), bool(continuityCorrect), float(R), float(gamma), etaModel, float(tolContinuity), int(nMaxContinuity), int(nScanContinuity))
+        if gas is not None:
+            options = options + (gas.key,)
+        keys = self.keys(inputs, options)
+
+        # result allocation
+        result = np.zeros(len(keys), dtype=stageDtype)
+
+        with (shelve.open(self.diskPath) if self.diskPath is not None else contextlib.nullcontext()) as db:
+            # stored stages
+            missing = []
+            for ii, key in enumerate(keys):
+                record = self.get(key, db)
+                if record is None:
+                    missing.append(ii)
+                else:
+                    result[ii] = record
+
+            if len(missing) > 0:
+                # not stored stages computation
+                missing = np.array(missing)
+                computed = stagePropertiesArray(*[x.ravel()[missing] for x in inputs], T1real=T1real, R=R, gamma=gamma, continuityCorrect=continuityCorrect, etaModel=etaModel, tolContinuity=tolContinuity, nMaxContinuity=nMaxContinuity, nScanContinuity=nScanContinuity, gas=gas)
+                result[missing] = computed
+
+                # storing stages -> equal keys in the same call are stored once
+                for ii, record in zip(missing, computed):
+                    self.put(keys[ii], record.copy(), db)
+
+        return result.reshape(shape)
+
+    def stats(self):
+        '''
+        This function returns the cache statistics.
+            output:
+                stats       -- dictionary: 'hits', 'diskHits', 'misses', 'hitRate', 'size'
+        '''
+
+        # # of requests
+        nRequests = self.hits + self.diskHits + self.misses
+        
+        if nRequests > 0:
+            hitRate = (self.hits + self.diskHits) / nRequests
+        else:
+            hitRate = 0
+
+        return {'hits': self.hits, 'diskHits': self.diskHits, 'misses': self.misses, 'hitRate': hitRate, 'size': len(self.memory)}
+
+    def printStats(self):
+        '''
+        This function prints the cache statistics.
+        '''
+
+        stats = self.stats()
+        starDim = 40
+        titleDim = int((starDim - len(' STAGE CACHE '))/2)
+        print('*' * titleDim + ' STAGE CACHE ' + '*' * titleDim)
+        print('-- memory hits  = {0:>9d}'.format(stats['hits']))
+        print('-- disk hits    = {0:>9d}'.format(stats['diskHits']))
+        print('-- misses       = {0:>9d}'.format(stats['misses']))
+        print('-- hit rate     = {0:>9.3f}'.format(stats['hitRate']))
+        print('-- stored       = {0:>9d}/{1:d}'.format(stats['size'], self.maxSize))
+        print('*' * (2 * titleDim + len(' STAGE CACHE ')) + '\n')
+
+    def clear(self, disk=False):
+        '''
+        This function removes the stored stages and resets the statistics.
+            inputs:
+                disk        -- boolean value for the removal of the on disk tier stages
+        '''
+
+        # importing libraries
+        import shelve
+
+        self.memory.clear()
+        self.hits     = 0
+        self.diskHits = 0
+        self.misses   = 0
+
+        if disk and self.diskPath is not None:
+            with shelve.open(self.diskPath) as db:
+                db.clear()
+
+# mean line stage cache used by stageProperties and stageSweep
+stageMemo = stageCache()
+
+def stageProperties(rD, psi, rMean, mFlux, Tt0, Pt0, betaP, T1real=False, printout=False, R=287.06, gamma=1.4, continuityCorrect=False, save=False, etaModel='circle', tolContinuity=1e-6, nMaxContinuity=100, nScanContinuity=32, cache=False, gas=None):
     '''
     This function allows to compute the properties of a stage following the meanline initial design procedure.
         procedural steps:
@@ -239,110 +908,8 @@ def stageProperties(rD, psi, rMean, mFlux, Tt0, Pt0, betaP, T1real=False, printo
                 - efficiency conditions check 
             - compute kinetic and thermodynamic properties at stator outlet
 
-        inputs:
-            rD          -- reaction degree at the mean line 
-            psi         -- work coefficient at the mean line 
-            rMean       -- mean line radius 
-            mFlux       -- mass flux 
-            Tt0         -- total temperature 
-            Pt0         -- tottal pressure 
-            betaP       -- pressure ratio 
-            T1real      -- boolean value for computation of the real or ideal rotor outlet temperature startig from real work L = Lis / eta
-            printout    -- boolean value for the print of the results 
-            R           -- gas constant
-            gamma       -- specific heat ratio
+        the computation is made by stagePropertiesArray; this function extracts the values of a single stage
         
-        outputs:
-            check return at the bottom
-    '''
-
-    # importing libraries  
-    from turboCoeff import coeff
-
-    # air properties allocation 
-    cP = gamma / (gamma - 1) * R # specific heat ratio @ P cost  [J/kg K]
-
-    # adimensional parameters computation 
-    # -- from performance charts 
-    phi, psi = stagePerf(psi=psi, rD=rD, plot=False, perc=0.97, save=save)
-    eta = efficiency(phi=phi, rD=rD, plot=False, save=save)
-
-    ######################## WORK ########################
-    # ideal compression work 
-    Lis = coeff.L_is(Tin=Tt0, beta=betaP, gamma=gamma, kind='compressor')
-    # real compression work 
-    L = Lis / eta
-    # total temperature computation
-    Tt1 = L / cP + Tt0
-
-    ######################## ROTATION ######################## 
-    # mean section revolution speed from work coefficient
-    Umean = np.sqrt(L / psi) 
-    # angular speed 
-    omega = Umean / rMean
-    # rpm 
-    n = omega * 60 / (2 * np.pi)
-
-    ######### MAIN VELOCITIES COMPUTATION FROM WORK RESULTS #########
-    # Va0, Vt0 computation 
-    # axial inlet velocity from flow coefficient
-    Va0 = phi * Umean
-    # tangential inlet velocity from reaction degree and work coefficient
-    lam = 2 * psi 
-    Vt0 = (1 - rD - lam/4) * Umean 
-    # tangential rotor exit velocity computation
-    Vt1 = (1 - rD + lam/4) * Umean 
-
-    ######### ROTOR INLET QUANTITIES ######### 
-    # KINETICS 
-    # relative speed computation 
-    Wa0 = Va0
-    Wt0 = Vt0 - Umean
-    # veolcity magnitude computation
-    V0 = np.sqrt(Va0**2 + Vt0**2)
-    W0 = np.sqrt(Wa0**2 + Wt0**2)
-    # aerodynamic angles computation 
-    alpha0 = np.rad2deg(np.arctan(Vt0/Va0))
-    beta0 = np.rad2deg(np.arctan(Wt0/Wa0))
-    # THERMODYNAMICS
-    # static temperature computation
-    T0 = Tt0 - V0**2 / (2*cP)
-    # speed of sound computation
-    a0 = np.sqrt(gamma * R * T0)
-    # mach computation 
-    M0 = V0 / a0
-    Mr0 = W0 / a0
-    # static pressure computation
-    P0 = Pt0 / (1 + (gamma - 1)/2 * M0**2)**(gamma/(gamma-1))
-    # density computation 
-    rhot0 = Pt0 / (R * Tt0)
-    rho0 = rhot0 / (1 + (gamma - 1)/2 * M0**2)**(1/(gamma-1))
-
-    ######### ROTOR INLET BLADE DIMENSION #########
-    # rotor inlet blade height 
-    b0 = mFlux / (rho0 * 2 * np.pi * rMean * Va0)
-
-    ######### ROTOR OUTLET/STATOR INLET QUANTITIES #########  
-    tol = 1e-2
-    bladeError = 1.0
-
-    # first guess of the outlet blade axial speed 
-    Va1 = Va0 
-    while bladeError > tol:
-        # outlet quantities 
-        Wa1 = Va1 
-        Wt1 = Vt1 - Umean
-        # velocity magnitude computation
-        V1 = np.sqrt(Va1**2 + Vt1**2)
-        W1 = np.sqrt(Wa1**2 + Wt1**2)
-        # flow angle computation
-        alpha1 = np.rad2deg(np.arctan(Vt1/Va1))
-        beta1 = np.rad2deg(np.arctan(Wt1/Wa1))
-
-        # THERMODYNAMICS
-        # static temperature computation
-        T1 = Tt1 - V1**2 / (2*cP)
-
         ################ EFFICIENCY CORRECTION ################
         # it is assumed that the entropy generation is only on the rotor blade 
         #   this allows to correct thermodynamics only on rotor blade and treating stator blade as isentropic
@@ -360,94 +927,82 @@ def stageProperties(rD, psi, rMean, mFlux, Tt0, Pt0, betaP, T1real=False, printo
         # - compute the density related to the pressure just obtained and the non isentropic temperature 
         #  
         # the changes made by this correction will affect the blade height at the exit 
-        #
 
-        if T1real:
-            # T1 isoentropic computation 
-            T1iso = T0 + eta * (T1 - T0)
-
-            # real pressure computation using the isentropic transformation law and the ideal T1iso temperature
-            P1 = Pt0 * (T1iso/Tt0)**(gamma/(gamma-1))
-        else: 
-            # ideal pressure computation using the isentropic transformation law and the ideal T1 temperature
-            P1 = Pt0 * (T1/Tt0)**(gamma/(gamma-1))
+        inputs:
+            rD          -- reaction degree at the mean line 
+            psi         -- work coefficient at the mean line 
+            rMean       -- mean line radius 
+            mFlux       -- mass flux 
+            Tt0         -- total temperature 
+            Pt0         -- tottal pressure 
+            betaP       -- pressure ratio 
+            T1real      -- boolean value for computation of the real or ideal rotor outlet temperature startig from real work L = Lis / eta
+            printout    -- boolean value for the print of the results 
+            R           -- gas constant
+            gamma       -- specific heat ratio
+            etaModel    -- circle/map => Lieblein chart efficiency model (see efficiency)
+            tolContinuity -- continuity correction tolerance -> |Va1 - VaOutCheck| / VaOutCheck
+            nMaxContinuity  -- maximum # of iterations of the continuity correction
+            nScanContinuity -- # of points used for the bracketing of the continuity correction solution
+            cache       -- boolean value for the use of the stage cache (stageMemo) -> bypassed with printout or save
+            gas         -- gas model (see thermoTransf.flowState.perfectGas, thermoTransf.gasTable.tabulatedGas) -> None: perfectGas(R, gamma)
         
-        # density computation 
-        rho1 = P1 / (R * T1)
-
-        # computing other quantities 
-        # speed of sound computation 
-        a1 = np.sqrt(gamma * R * T1)
-        # mach number computation 
-        M1 = V1 / a1
-        Mr1 = W1 / a1
-        # total pressure computation
-        Pt1 = P1 * (Tt1/T1)**(gamma/(gamma-1))
+        outputs:
+            check return at the bottom
+    '''
 
-        # total density computation
-        rhot1 = Pt1 / (R * Tt1)
+    # importing libraries
+    from thermoTransf.flowState import perfectGas
 
-        if continuityCorrect:
-            # check velocity with respect to the blade without flaring 
-            VaOutCheck = mFlux / (b0 * 2 * np.pi * rMean * rho1)
-            
-            # computing relative error
-            bladeError = np.abs((VaOutCheck - Va1)/VaOutCheck)
+    # air properties allocation -> printout
+    air = gas if gas is not None else perfectGas(R=R, gamma=gamma)
 
-            # change on the outlet speed 
-            if VaOutCheck < Va1:
-                Va1 = Va1 * (1 - bladeError)
-            else:
-                Va1 = Va1 * (1 + bladeError)
-        else:
-            bladeError = 0.0
-
-    ######### STATOR OUTLET QUANTITIES #########
-    # main outlet quantities
-    # KINETICS 
-    Va2 = Va1 
-    Wa2 = Va2
-    Tt2 = Tt1
-    # from thermodynamics
-    deltaH = (1 - rD) * L
-    T2 = deltaH / cP + T1
-
-    # V2 & Vt2 computation  
-    V2 = np.sqrt(2 * cP * (Tt2 - T2))
-    # Vt2 computation and numerical correction 
-    if np.abs(V2**2 - Va2**2) < 1e-10: 
-        Vt2 = 0
+    # stage computation -> the cache is not used when the printout/saving side effects are requested
+    if cache and not printout and not save:
+        result = stageMemo.evaluate(rD, psi, rMean, mFlux, Tt0, Pt0, betaP, T1real=T1real, R=R, gamma=gamma, continuityCorrect=continuityCorrect, etaModel=etaModel, tolContinuity=tolContinuity, nMaxContinuity=nMaxContinuity, nScanContinuity=nScanContinuity, gas=gas)
     else:
-        Vt2 = np.sqrt(V2**2 - Va2**2)
-
-    # W2 & Wt2 computation
-    Wt2 = Vt2 - 0 
-    W2 = np.sqrt(Wa2**2 + Wt2**2)
-    # aerodynamics angles 
-    alpha2 = np.rad2deg(np.arctan2(Vt2,Va2))
-    beta2 = np.rad2deg(np.arctan(Wt2/Wa2))
-    # THERMODYNAMICS
-    # sound speed 
-    a2 = np.sqrt(gamma * R * T2)
-    # mach number computation
-    M2 = V2 / a2
-    Mr2 = W2 / a2
-    # pressure computation
-    Pt2 = Pt1
-    P2 = P1 * (T2/T1)**(gamma/(gamma-1))
-    # density computation 
-    rho2 = P2 / (R * T2)
-    rhot2 = Pt2 / (R * Tt2)
-
-    ######### BLADE RADIUS #########
-    # rotor inlet blade height 
-    b0 = mFlux / (rho0 * 2 * np.pi * rMean * Va0)
-    # rotor outlet/stator inlet  blade height
-    b1 = mFlux / (rho1 * 2 * np.pi * rMean * Va1)
-    # stator outlet blade height
-    b2 = mFlux / (rho2 * 2 * np.pi * rMean * Va2)
+        result = stagePropertiesArray(rD, psi, rMean, mFlux, Tt0, Pt0, betaP, T1real=T1real, R=R, gamma=gamma, continuityCorrect=continuityCorrect, etaModel=etaModel, tolContinuity=tolContinuity, nMaxContinuity=nMaxContinuity, nScanContinuity=nScanContinuity, gas=gas)
+
+    # performance charts saving
+    if save:
+        stagePerf(psi=psi, rD=rD, plot=False, perc=0.97, save=save)
+        efficiency(phi=result['adimVec'][0], rD=rD, plot=False, save=save, model=etaModel)
+
+    # return vector values 
+    adimVec     = result['adimVec'].tolist()
+    bladeVec    = result['bladeVec'].tolist()
+    rotationVec = result['rotationVec'].tolist()
+    V0vec       = result['V0vec'].tolist()
+    V1vec       = result['V1vec'].tolist()
+    V2vec       = result['V2vec'].tolist()
+    W0vec       = result['W0vec'].tolist()
+    W1vec       = result['W1vec'].tolist()
+    W2vec       = result['W2vec'].tolist()
+    thermo0     = result['thermo0'].tolist()
+    thermo1     = result['thermo1'].tolist()
+    thermo2     = result['thermo2'].tolist()
+    work        = result['work'].tolist()
 
     if printout:
+        # values allocation 
+        phi, psi, eta          = adimVec
+        b0, b1, b2             = bladeVec
+        Umean, omega, n        = rotationVec
+        Va0, Vt0, alpha0       = V0vec
+        Va1, Vt1, alpha1       = V1vec
+        Va2, Vt2, alpha2       = V2vec
+        Wa0, Wt0, beta0        = W0vec
+        Wa1, Wt1, beta1        = W1vec
+        Wa2, Wt2, beta2        = W2vec
+        T0, P0, rho0, Tt0, Pt0, rhot0, M0, Mr0 = thermo0
+        T1, P1, rho1, Tt1, Pt1, rhot1, M1, Mr1 = thermo1
+        T2, P2, rho2, Tt2, Pt2, rhot2, M2, Mr2 = thermo2
+        L, Lis                 = work
+        V0, V1, V2             = np.sqrt(Va0**2 + Vt0**2), np.sqrt(Va1**2 + Vt1**2), np.sqrt(Va2**2 + Vt2**2)
+        W0, W1, W2             = np.sqrt(Wa0**2 + Wt0**2), np.sqrt(Wa1**2 + Wt1**2), np.sqrt(Wa2**2 + Wt2**2)
+        a0, a1, a2             = air.soundSpeed(T0), air.soundSpeed(T1), air.soundSpeed(T2)
+        lam                    = 2 * psi
+
         # print data 
         printLength = 84
         print('*' * printLength)
@@ -458,7 +1013,7 @@ def stageProperties(rD, psi, rMean, mFlux, Tt0, Pt0, betaP, T1real=False, printo
         print('*' * printLength)
         nAdim = int((printLength - len(' ADIMENSIONAL PARAMETERS '))/2)
         print('*' * nAdim + ' ADIMENSIONAL PARAMETERS  ' + '*' * nAdim)
-        print('-- rD     = {0:>8.2f}        -- psi    = {1:>8.2f}        -- phi       = {2:>5.2f}'.format(cP * (T1 - T0) / L, psi, phi))
+        print('-- rD     = {0:>8.2f}        -- psi    = {1:>8.2f}        -- phi       = {2:>5.2f}'.format(air.enthalpyChange(T0, T1) / L, psi, phi))
         print('-- eta    = {0:>10.4f}      -- lamdba = {1:>8.2f}        -- Vt0/Umean = {2:>5.2f}'.format(eta, lam, Vt0/Umean))
         nWork = int((printLength - len(' WORK '))/2)
         print('*' * nWork + ' WORK ' + '*' * nWork)
@@ -466,6 +1021,10 @@ def stageProperties(rD, psi, rMean, mFlux, Tt0, Pt0, betaP, T1real=False, printo
         nRotation = int((printLength - len(' ROTATION '))/2)
         print('*' * nRotation + ' ROTATION ' + '*' * nRotation)
         print('-- Umean  = {0:>8.2f} m/s    -- omega  = {1:>8.2f} rad/s  -- n      = {2:>8.2f} rpm'.format(Umean, omega, n))
+        if continuityCorrect:
+            nContinuity = int((printLength - len(' CONTINUITY CORRECTION '))/2)
+            print('*' * nContinuity + ' CONTINUITY CORRECTION ' + '*' * nContinuity)
+            print('-- converged = {0}        -- # iterations = {1:>3d}     -- tolerance = {2:>8.1e}'.format(result['reason'] != 3, int(result['continuityIter']), tolContinuity))
         print('*' * printLength)
         nDefinitions = int((printLength - len(' DEFINITIONS '))/2)
         print('\n' + '*' * nDefinitions + ' DEFINITIONS  ' + '*' * nDefinitions)
@@ -509,23 +1068,161 @@ def stageProperties(rD, psi, rMean, mFlux, Tt0, Pt0, betaP, T1real=False, printo
         print('-- rHub0  = {0:>8.2f} cm     -- rHub1  = {1:>8.2f} cm     -- rHub2  = {2:>8.2f} cm'.format((rMean - b0/2)*1e+2, (rMean - b1/2)*1e+2, (rMean - b2/2)*1e+2))
         print('*' * printLength)
 
-    # return vector values 
-    adimVec     = [phi, psi, eta]
-    bladeVec    = [b0, b1, b2]
-    rotationVec = [Umean, omega, n] 
-    V0vec       = [Va0, Vt0, alpha0]
-    V1vec       = [Va1, Vt1, alpha1]
-    V2vec       = [Va2, Vt2, alpha2]
-    W0vec       = [Wa0, Wt0, beta0]
-    W1vec       = [Wa1, Wt1, beta1]
-    W2vec       = [Wa2, Wt2, beta2] 
-    thermo0     = [T0, P0, rho0, Tt0, Pt0, rhot0, M0, Mr0] 
-    thermo1     = [T1, P1, rho1, Tt1, Pt1, rhot1, M1, Mr1]
-    thermo2     = [T2, P2, rho2, Tt2, Pt2, rhot2, M2, Mr2] 
-    work        = [L, Lis]
-
     return adimVec, bladeVec, rotationVec, V0vec, V1vec, V2vec, W0vec, W1vec, W2vec, thermo0, thermo1, thermo2, work
 
+# stage properties flattening -> stageDtype field: sweep variable names
+stageFields = {'adimVec'    : ['phi', 'psi', 'eta'],
+               'bladeVec'   : ['b0', 'b1', 'b2'],
+               'rotationVec': ['Umean', 'omega', 'n'],
+               'V0vec'      : ['Va0', 'Vt0', 'alpha0'],
+               'V1vec'      : ['Va1', 'Vt1', 'alpha1'],
+               'V2vec'      : ['Va2', 'Vt2', 'alpha2'],
+               'W0vec'      : ['Wa0', 'Wt0', 'beta0'],
+               'W1vec'      : ['Wa1', 'Wt1', 'beta1'],
+               'W2vec'      : ['Wa2', 'Wt2', 'beta2'],
+               'thermo0'    : ['T0', 'P0', 'rho0', 'Tt0', 'Pt0', 'rhot0', 'M0', 'Mr0'],
+               'thermo1'    : ['T1', 'P1', 'rho1', 'Tt1', 'Pt1', 'rhot1', 'M1', 'Mr1'],
+               'thermo2'    : ['T2', 'P2', 'rho2', 'Tt2', 'Pt2', 'rhot2', 'M2', 'Mr2'],
+               'work'       : ['L', 'Lis']}
+
+# blade section quantities computed by the sweep at the rotor hub and tip 
+sectionFields = ['rD', 'phi', 'psi', 'alpha0', 'alpha1', 'beta0', 'beta1', 'W0', 'W1', 'M0', 'M1', 'Mr0', 'Mr1']
+
+def stageSweep(grid, constants=None, sections=False, T1real=False, R=287.06, gamma=1.4, continuityCorrect=False, etaModel='circle', tolContinuity=1e-6, nMaxContinuity=100, nScanContinuity=32, cache=False, gas=None):
+    '''
+    This function evaluates the stage meanline design (see stagePropertiesArray) over a parameter grid.
+    The grid is evaluated at once into preallocated arrays: the stages that cannot be computed are stored as NaN 
+    with the failure reason code (see stageReasons).
+        inputs:
+            grid                -- dictionary of the grid axes -> {name: 1D array}, the grid has one dimension for each axis in the given order 
+            constants           -- dictionary of the constant parameters -> {name: float or array with the grid shape}, None: no constants
+                                -- allowed names for grid and constants:
+                                    -- rD, rMean, mFlux, Tt0, Pt0, betaP  -> required 
+                                    -- psi or Vt0Umean                    -> psi = 2 * (1 - rD - Vt0/Umean), default Vt0Umean = 0
+            sections            -- boolean value for the computation of the rotor hub and tip sections with the free vortex model (see bladeStudy)
+            T1real              -- boolean value for computation of the real or ideal rotor outlet temperature startig from real work L = Lis / eta
+            R                   -- gas constant
+            gamma               -- specific heat ratio
+            continuityCorrect   -- boolean value for the correction of the rotor outlet axial speed with respect to the continuity equation 
+            etaModel            -- circle/map => Lieblein chart efficiency model (see efficiency)
+            tolContinuity       -- continuity correction tolerance -> |Va1 - VaOutCheck| / VaOutCheck
+            nMaxContinuity      -- maximum # of iterations of the continuity correction
+            nScanContinuity     -- # of points used for the bracketing of the continuity correction solution
+            cache               -- boolean value for the use of the stage cache (stageMemo) -> only the not stored grid points are computed
+            gas                 -- gas model of the mean line (see stagePropertiesArray) -> the hub and tip sections use the perfect gas (R, gamma)
+        output:
+            sweep               -- dictionary of arrays with the grid shape:
+                                    -- 'dims'   : grid axes names 
+                                    -- 'coords' : grid axes values {name: 1D array}
+                                    -- inputs   : rD, psi, Vt0Umean, rMean, mFlux, Tt0, Pt0, betaP 
+                                    -- outputs  : one array for each stageProperties quantity (see stageFields) + rTip, rHub
+                                    -- 'valid'  : boolean mask of the computed stages 
+                                    -- 'reason' : failure reason code (see stageReasons)
+                                    -- 'continuityIter' : # of iterations of the continuity correction
+                                    -- 'hub', 'tip' : dictionaries of the section quantities (see sectionFields) -> only with sections
+    '''
+
+    # constant parameters
+    if constants is None:
+        constants = {}
+
+    # parameters check
+    inputNames = ['rD', 'psi', 'Vt0Umean', 'rMean', 'mFlux', 'Tt0', 'Pt0', 'betaP']
+    for name in list(grid.keys()) + list(constants.keys()):
+        if name not in inputNames:
+            raise ValueError('Unknown sweep parameter: {0}. Allowed parameters: {1}.'.format(name, ', '.join(inputNames)))
+    for name in grid.keys():
+        if name in constants.keys():
+            raise ValueError('Sweep parameter {0} defined both in grid and constants.'.format(name))
+    for name in ['rD', 'rMean', 'mFlux', 'Tt0', 'Pt0', 'betaP']:
+        if name not in grid.keys() and name not in constants.keys():
+            raise ValueError('Missing sweep parameter: {0}.'.format(name))
+    if ('psi' in grid.keys() or 'psi' in constants.keys()) and ('Vt0Umean' in grid.keys() or 'Vt0Umean' in constants.keys()):
+        raise ValueError('psi and Vt0Umean cannot be both defined.')
+
+    # grid generation 
+    dims   = tuple(grid.keys())
+    coords = {name: np.atleast_1d(np.asarray(grid[name], dtype=float)) for name in dims}
+    mesh   = np.meshgrid(*[coords[name] for name in dims], indexing='ij')
+
+    # inputs allocation 
+    sweep = {'dims': dims, 'coords': coords}
+    for ii, name in enumerate(dims):
+        sweep[name] = mesh[ii]
+    shape = mesh[0].shape
+    for name, value in constants.items():
+        sweep[name] = np.array(np.broadcast_to(np.asarray(value, dtype=float), shape))
+
+    # work coefficient from Vt0/Umean
+    # Vt0 = (1 - rD - lam/4) * Umean -> lam = 4 * (1 - rD - Vt0/Umean) 
+    # psi = lam / 2 
+    if 'psi' not in sweep.keys():
+        if 'Vt0Umean' not in sweep.keys():
+            sweep['Vt0Umean'] = np.zeros(shape)
+        sweep['psi'] = (1 - sweep['rD'] - sweep['Vt0Umean']) * 4 / 2
+    else:
+        sweep['Vt0Umean'] = np.full(shape, np.nan)
+
+    # stage computation 
+    if cache:
+        result = stageMemo.evaluate(sweep['rD'], sweep['psi'], sweep['rMean'], sweep['mFlux'], sweep['Tt0'], sweep['Pt0'], sweep['betaP'], T1real=T1real, R=R, gamma=gamma, continuityCorrect=continuityCorrect, etaModel=etaModel, tolContinuity=tolContinuity, nMaxContinuity=nMaxContinuity, nScanContinuity=nScanContinuity, gas=gas)
+    else:
+        result = stagePropertiesArray(sweep['rD'], sweep['psi'], sweep['rMean'], sweep['mFlux'], sweep['Tt0'], sweep['Pt0'], sweep['betaP'], T1real=T1real, R=R, gamma=gamma, continuityCorrect=continuityCorrect, etaModel=etaModel, tolContinuity=tolContinuity, nMaxContinuity=nMaxContinuity, nScanContinuity=nScanContinuity, gas=gas)
+    valid  = result['valid']
+    reason = result['reason']
+
+    # outputs allocation -> not valid stages are set to NaN 
+    for field, names in stageFields.items():
+        for ii, name in enumerate(names):
+            # psi is already stored as input -> only the not valid stages are masked
+            if name == 'psi':
+                sweep[name] = np.where(valid, sweep[name], np.nan)
+                continue
+            sweep[name] = np.where(valid, result[field][..., ii], np.nan)
+    
+    # blade dimensions
+    sweep['rTip'] = sweep['rMean'] + sweep['b0'] / 2
+    sweep['rHub'] = sweep['rMean'] - sweep['b0'] / 2
+
+    # rotor hub and tip sections 
+    if sections:
+        # importing libraries 
+        from turboClass.bladeStudy import bladeStudy
+
+        for section, sign in zip(['hub', 'tip'], [-1, 1]):
+            # section radial positions
+            rIn  = sweep['rMean'] + sign * sweep['b0'] / 2
+            rOut = sweep['rMean'] + sign * sweep['b1'] / 2
+
+            # section computation -> free vortex model
+            with np.errstate(invalid='ignore', divide='ignore'):
+                adimVec, _, _, rel0Vec, _, rel1Vec, angleVec, thermo0, thermo1 = bladeStudy(rIn, rOut, sweep['omega'], sweep['rMean'], sweep['Va0'], sweep['Vt0'], sweep['Vt1'], sweep['L'], sweep['Tt0'], sweep['T0'], sweep['Pt0'], sweep['P0'], eta=sweep['eta'], printout=False, gamma=gamma, R=R)
+
+            # section quantities allocation
+            sweep[section] = {'rD': adimVec[0], 'phi': adimVec[1], 'psi': adimVec[2],
+                              'alpha0': angleVec[0], 'alpha1': angleVec[1], 'beta0': angleVec[2], 'beta1': angleVec[3],
+                              'W0': rel0Vec[2], 'W1': rel1Vec[2],
+                              'M0': thermo0[6], 'M1': thermo1[6], 'Mr0': thermo0[7], 'Mr1': thermo1[7]}
+            
+            # not physical sections
+            finite = np.ones(shape, dtype=bool)
+            for name in sectionFields:
+                finite = finite & np.isfinite(sweep[section][name])
+            reason = np.where(valid & np.logical_not(finite), 4, reason)
+            valid  = valid & finite
+        
+        # not valid sections are set to NaN
+        for section in ['hub', 'tip']:
+            for name in sectionFields:
+                sweep[section][name] = np.where(valid, sweep[section][name], np.nan)
+    
+    # validity allocation
+    sweep['valid']  = valid
+    sweep['reason'] = reason
+    sweep['continuityIter'] = result['continuityIter']
+
+    return sweep
+
 def stageStudy(mFlux, betaP, rMean, Pt0, Tt0, rDmin=0.5, rDmax=0.75, Vt0UmeanMin=0, Vt0UmeanMax=0.25, R=287.06, gamma=1.4):
     '''
     This function allows to understand the behaviour of the stage with respect to different changes:
@@ -563,68 +1260,22 @@ def stageStudy(mFlux, betaP, rMean, Pt0, Tt0, rDmin=0.5, rDmax=0.75, Vt0UmeanMin
     rDarray = np.linspace(rDmin, rDmax, 12)
     Vt0UmeanArray = np.linspace(Vt0UmeanMin, Vt0UmeanMax, 60)
 
+    # stage properties computation over the (rD, Vt0/Umean) grid
+    sweep = stageSweep({'rD': rDarray, 'Vt0Umean': Vt0UmeanArray}, {'rMean': rMean, 'mFlux': mFlux, 'Tt0': Tt0, 'Pt0': Pt0, 'betaP': betaP}, R=R, gamma=gamma, cache=True)
+
     # setting up figure and subplots 
     fig0, [[ax0, ax1, ax2, ax3], [ax4, ax5, ax6, ax7]] = plt.subplots(figsize=(20,8), nrows=2, ncols=4)
 
-    for _,rD in enumerate(rDarray):
-
-        # vector allocation 
-        Vt0UmeanVec = np.array([])
-        phiVec      = np.array([])
-        psiVec      = np.array([])
-        etaVec      = np.array([])
-        alpha0Vec   = np.array([])
-        UmeanVec    = np.array([])
-        Mr0Vec      = np.array([])
-        b0Vec       = np.array([])
-        b1Vec       = np.array([])
-        b2Vec       = np.array([])
-
-        for _,Vt0Umean in enumerate(Vt0UmeanArray):
-            # Vt0 = (1 - rD - lam/4) * Umean -> lam = 4 * (1 - rD - Vt0/Umean) 
-            # psi = lam / 2 
-            lam = (1 - rD - Vt0Umean) * 4 
-            psiTarget = lam / 2
-
-            try:                
-                # variable needed for the study computation
-                adimVec, bladeVec, rotationVec, V0vec, _, _, _, _, _, thermo0, _, _, _ = stageProperties(rD, psiTarget, rMean, mFlux, Tt0, Pt0, betaP, T1real=False, R=R, gamma=gamma)
-
-                # variable allocation -> check stageProperties return  
-                phi    = adimVec[0]
-                psi    = adimVec[1]
-                eta    = adimVec[2]
-                alpha0 = V0vec[2]
-                Umean  = rotationVec[0]
-                Mr0    = thermo0[7]
-                b0     = bladeVec[0]
-                b1     = bladeVec[1]
-                b2     = bladeVec[2]
-
-                # appenda data to vectors 
-                Vt0UmeanVec = np.append(Vt0UmeanVec, Vt0Umean)
-                phiVec      = np.append(phiVec, phi)
-                psiVec      = np.append(psiVec, psi)
-                etaVec      = np.append(etaVec, eta)
-                alpha0Vec   = np.append(alpha0Vec, alpha0)
-                UmeanVec    = np.append(UmeanVec, Umean)
-                Mr0Vec      = np.append(Mr0Vec, Mr0)
-                b0Vec       = np.append(b0Vec, b0)
-                b1Vec       = np.append(b1Vec, b1)
-                b2Vec       = np.append(b2Vec, b2)
-
-            except:
-                pass
-        
-        # plotting data
-        ax0.plot(Vt0UmeanVec, phiVec,          label=r'$\chi = {0:.2f}$'.format(rD))
-        ax1.plot(Vt0UmeanVec, psiVec,          label=r'$\chi = {0:.2f}$'.format(rD))
-        ax2.plot(Vt0UmeanVec, etaVec,          label=r'$\chi = {0:.2f}$'.format(rD))
-        ax3.plot(Vt0UmeanVec, alpha0Vec,       label=r'$\chi = {0:.2f}$'.format(rD))
-        ax4.plot(Vt0UmeanVec, UmeanVec,        label=r'$\chi = {0:.2f}$'.format(rD))
-        ax5.plot(Vt0UmeanVec, Mr0Vec,          label=r'$\chi = {0:.2f}$'.format(rD))
-        ax6.plot(Vt0UmeanVec, b0Vec,           label=r'$\chi = {0:.2f}$'.format(rD))
-        ax7.plot(Vt0UmeanVec, b0Vec/2 + rMean, label=r'$\chi = {0:.2f}$'.format(rD))
+    for ii,rD in enumerate(rDarray):
+        # plotting data -> not computed stages are NaN
+        ax0.plot(Vt0UmeanArray, sweep['phi'][ii],                 label=r'$\chi = {0:.2f}$'.format(rD))
+        ax1.plot(Vt0UmeanArray, sweep['psi'][ii],                 label=r'$\chi = {0:.2f}$'.format(rD))
+        ax2.plot(Vt0UmeanArray, sweep['eta'][ii],                 label=r'$\chi = {0:.2f}$'.format(rD))
+        ax3.plot(Vt0UmeanArray, sweep['alpha0'][ii],              label=r'$\chi = {0:.2f}$'.format(rD))
+        ax4.plot(Vt0UmeanArray, sweep['Umean'][ii],               label=r'$\chi = {0:.2f}$'.format(rD))
+        ax5.plot(Vt0UmeanArray, sweep['Mr0'][ii],                 label=r'$\chi = {0:.2f}$'.format(rD))
+        ax6.plot(Vt0UmeanArray, sweep['b0'][ii],                  label=r'$\chi = {0:.2f}$'.format(rD))
+        ax7.plot(Vt0UmeanArray, sweep['b0'][ii]/2 + rMean,        label=r'$\chi = {0:.2f}$'.format(rD))
     
     # ax0 setup
     ax0.set_title(r'$r_{{mean}} = {0:.3} m$'.format(rMean))
@@ -718,9 +1369,6 @@ def reactionStudy(mFlux, betaP, rMean, Pt0, Tt0, rDmin=0.5, rDmax=0.73, Vt0Umean
             position1   -- path where to save the second figure
     '''
 
-    # importing libraries 
-    from turboClass.bladeStudy import bladeStudy 
-
     # vector allocation for the properties study 
     rDarray = np.linspace(rDmin, rDmax, 10)
     Vt0UmeanArray = np.linspace(Vt0UmeanMin, Vt0UmeanMax, 20)
@@ -735,133 +1383,41 @@ def reactionStudy(mFlux, betaP, rMean, Pt0, Tt0, rDmin=0.5, rDmax=0.73, Vt0Umean
             'pgf.rcfonts': False,
         })
 
+    # stage properties computation over the (rD, Vt0/Umean) grid with rotor hub and tip sections 
+    sweep = stageSweep({'rD': rDarray, 'Vt0Umean': Vt0UmeanArray}, {'rMean': rMean, 'mFlux': mFlux, 'Tt0': Tt0, 'Pt0': Pt0, 'betaP': betaP}, sections=True, cache=True)
+    hub = sweep['hub']
+    tip = sweep['tip']
+
     # figure allocation
     fig0, [[ax1_11, ax1_12, ax1_13, ax1_14, ax1_15], [ax1_21, ax1_22, ax1_23, ax1_24, ax1_25]] = plt.subplots(nrows=2, ncols=5, figsize=(20,10))
     fig1, [[ax2_11, ax2_12, ax2_13, ax2_14, ax2_15, ax2_16], [ax2_21, ax2_22, ax2_23, ax2_24, ax2_25, ax2_26]] = plt.subplots(nrows=2, ncols=6, figsize=(20,10))
 
-    for _,rD in enumerate(rDarray):
-
-        # vector allocation 
-        rDvecHub       = np.array([])
-        rDvecTip       = np.array([])
-        Vt0UmeanVecHub = np.array([])
-        Vt0UmeanVecTip = np.array([])
-        alpha0vecHub   = np.array([])
-        alpha1vecHub   = np.array([])
-        beta0vecHub    = np.array([])
-        beta1vecHub    = np.array([])
-        alpha0vecTip   = np.array([])
-        alpha1vecTip   = np.array([])
-        beta0vecTip    = np.array([])
-        beta1vecTip    = np.array([])
-        M0vecTip       = np.array([])
-        M0vecHub       = np.array([])
-        M1vecTip       = np.array([])
-        M1vecHub       = np.array([])
-        Mr0vecTip      = np.array([])
-        Mr0vecHub      = np.array([])
-        Mr1vecTip      = np.array([])
-        Mr1vecHub      = np.array([])
-
-        for _,Vt0Umean in enumerate(Vt0UmeanArray):
-            # Vt0 = (1 - rD - lam/4) * Umean -> lam = 4 * (1 - rD - Vt0/Umean) 
-            # psi = lam / 2 
-            lam = (1 - rD - Vt0Umean) * 4 
-            psiTarget = lam / 2
-
-            # plotting charts 
-            try:
-                ###### MEAN LINE STUDY ###### 
-                adimVec, bladeVec, rotationVec, V0vec, V1vec, _, _, _, _, thermo0, _, _, work = stageProperties(rD, psiTarget, rMean, mFlux, Tt0, Pt0, betaP, T1real=False)
-                
-                # data allocation
-                eta   = adimVec[-1]
-                b0    = bladeVec[0]
-                b1    = bladeVec[1]
-                omega = rotationVec[1]
-                T0    = thermo0[0]
-                P0    = thermo0[1]
-                Va0   = V0vec[0]
-                Vt0   = V0vec[1]
-                Vt1   = V1vec[1]
-                L     = work[0]
-
-                ###### BLADE HUB STUDY ######
-                # data allocation for 'bladeStudy'
-                rIn       = rMean - b0/2
-                rOut      = rMean - b1/2
-                VaMean    = Va0 
-                VtMeanIn  = Vt0 
-                VtMeanOut = Vt1 
-                Leu       = L 
-                
-                # computing blade properties 
-                adimVec, rotationVec, _, _, _, _, angleVec, thermo0, thermo1 = bladeStudy(rIn, rOut, omega, rMean, VaMean, VtMeanIn, VtMeanOut, Leu, Tt0, T0, Pt0, P0, eta=eta, printout=False)
-
-                # vector update 
-                Vt0UmeanVecHub  = np.append(Vt0UmeanVecHub, Vt0Umean)
-                rDvecHub        = np.append(rDvecHub, adimVec[0]) 
-                alpha0vecHub    = np.append(alpha0vecHub, angleVec[0])
-                alpha1vecHub    = np.append(alpha1vecHub, angleVec[1])
-                beta0vecHub     = np.append(beta0vecHub, angleVec[2])
-                beta1vecHub     = np.append(beta1vecHub, angleVec[3])
-                M0vecHub        = np.append(M0vecHub, thermo0[-2])
-                M1vecHub        = np.append(M1vecHub, thermo1[-2])
-                Mr0vecHub       = np.append(Mr0vecHub, thermo0[-1])
-                Mr1vecHub       = np.append(Mr1vecHub, thermo1[-1])
-
-                ###### BLADE TIP STUDY ######
-                # data allocation for 'bladeStudy'
-                rIn       = rMean + b0/2
-                rOut      = rMean + b1/2
-                VaMean    = Va0 
-                VtMeanIn  = Vt0 
-                VtMeanOut = Vt1 
-                Leu       = L 
-                
-                # computing blade properties 
-                adimVec, rotationVec, _, _, _, _, angleVec, thermo0, thermo1 = bladeStudy(rIn, rOut, omega, rMean, VaMean, VtMeanIn, VtMeanOut, Leu, Tt0, T0, Pt0, P0, eta=eta, printout=False)
-
-                # vector update
-                Vt0UmeanVecTip = np.append(Vt0UmeanVecTip, Vt0Umean)
-                rDvecTip       = np.append(rDvecTip, adimVec[0])
-                alpha0vecTip   = np.append(alpha0vecTip, angleVec[0])
-                alpha1vecTip   = np.append(alpha1vecTip, angleVec[1])
-                beta0vecTip    = np.append(beta0vecTip, angleVec[2])
-                beta1vecTip    = np.append(beta1vecTip, angleVec[3])
-                M0vecTip       = np.append(M0vecTip, thermo0[-2])
-                M1vecTip       = np.append(M1vecTip, thermo1[-2])
-                Mr0vecTip      = np.append(Mr0vecTip, thermo0[-1])
-                Mr1vecTip      = np.append(Mr1vecTip, thermo1[-1])
-
-            except:
-                pass 
-        
-        # plotting results
+    for ii in range(len(rDarray)):
+        # plotting results -> not computed stages are NaN
         # hub plot 
-        ax1_11.plot(Vt0UmeanVecHub, rDvecHub,                     )#label=r'$\chi_{{mean}} = {0:.2f}$'.format(rD))
-        ax1_12.plot(Vt0UmeanVecHub, M0vecHub,                     )#label=r'$\chi_{{mean}} = {0:.2f}$'.format(rD))
-        ax1_13.plot(Vt0UmeanVecHub, M1vecHub,                     )#label=r'$\chi_{{mean}} = {0:.2f}$'.format(rD))
-        ax1_14.plot(Vt0UmeanVecHub, Mr0vecHub,                    )#label=r'$\chi_{{mean}} = {0:.2f}$'.format(rD))
-        ax1_15.plot(Vt0UmeanVecHub, Mr1vecHub,                    )#label=r'$\chi_{{mean}} = {0:.2f}$'.format(rD))
-        ax2_11.plot(Vt0UmeanVecHub, alpha0vecHub,                 )#label=r'$\chi_{{mean}} = {0:.2f}$'.format(rD))
-        ax2_12.plot(Vt0UmeanVecHub, alpha1vecHub,                 )#label=r'$\chi_{{mean}} = {0:.2f}$'.format(rD))
-        ax2_13.plot(Vt0UmeanVecHub, beta0vecHub,                  )#label=r'$\chi_{{mean}} = {0:.2f}$'.format(rD))
-        ax2_14.plot(Vt0UmeanVecHub, beta1vecHub,                  )#label=r'$\chi_{{mean}} = {0:.2f}$'.format(rD))
-        ax2_15.plot(Vt0UmeanVecHub, alpha1vecHub - alpha0vecHub,  )#label=r'$\chi_{{mean}} = {0:.2f}$'.format(rD))
-        ax2_16.plot(Vt0UmeanVecHub, beta1vecHub - beta0vecHub,    )#label=r'$\chi_{{mean}} = {0:.2f}$'.format(rD))
+        ax1_11.plot(Vt0UmeanArray, hub['rD'][ii]                        )
+        ax1_12.plot(Vt0UmeanArray, hub['M0'][ii]                        )
+        ax1_13.plot(Vt0UmeanArray, hub['M1'][ii]                        )
+        ax1_14.plot(Vt0UmeanArray, hub['Mr0'][ii]                       )
+        ax1_15.plot(Vt0UmeanArray, hub['Mr1'][ii]                       )
+        ax2_11.plot(Vt0UmeanArray, hub['alpha0'][ii]                    )
+        ax2_12.plot(Vt0UmeanArray, hub['alpha1'][ii]                    )
+        ax2_13.plot(Vt0UmeanArray, hub['beta0'][ii]                     )
+        ax2_14.plot(Vt0UmeanArray, hub['beta1'][ii]                     )
+        ax2_15.plot(Vt0UmeanArray, hub['alpha1'][ii] - hub['alpha0'][ii])
+        ax2_16.plot(Vt0UmeanArray, hub['beta1'][ii] - hub['beta0'][ii]  )
         # tip plot
-        ax1_21.plot(Vt0UmeanVecTip, rDvecTip,                     )#label=r'$\chi_{{mean}} = {0:.2f}$'.format(rD))
-        ax1_22.plot(Vt0UmeanVecTip, M0vecTip,                     )#label=r'$\chi_{{mean}} = {0:.2f}$'.format(rD))
-        ax1_23.plot(Vt0UmeanVecTip, M1vecTip,                     )#label=r'$\chi_{{mean}} = {0:.2f}$'.format(rD))
-        ax1_24.plot(Vt0UmeanVecTip, Mr0vecTip,                    )#label=r'$\chi_{{mean}} = {0:.2f}$'.format(rD))
-        ax1_25.plot(Vt0UmeanVecTip, Mr1vecTip,                    )#label=r'$\chi_{{mean}} = {0:.2f}$'.format(rD))
-        ax2_21.plot(Vt0UmeanVecTip, alpha0vecTip,                 )#label=r'$\chi_{{mean}} = {0:.2f}$'.format(rD))
-        ax2_22.plot(Vt0UmeanVecTip, alpha1vecTip,                 )#label=r'$\chi_{{mean}} = {0:.2f}$'.format(rD))
-        ax2_23.plot(Vt0UmeanVecTip, beta0vecTip,                  )#label=r'$\chi_{{mean}} = {0:.2f}$'.format(rD))
-        ax2_24.plot(Vt0UmeanVecTip, beta1vecTip,                  )#label=r'$\chi_{{mean}} = {0:.2f}$'.format(rD))
-        ax2_25.plot(Vt0UmeanVecTip, alpha1vecTip - alpha0vecTip,  )#label=r'$\chi_{{mean}} = {0:.2f}$'.format(rD))
-        ax2_26.plot(Vt0UmeanVecTip, beta1vecTip - beta0vecTip,    )#label=r'$\chi_{{mean}} = {0:.2f}$'.format(rD))
+        ax1_21.plot(Vt0UmeanArray, tip['rD'][ii]                        )
+        ax1_22.plot(Vt0UmeanArray, tip['M0'][ii]                        )
+        ax1_23.plot(Vt0UmeanArray, tip['M1'][ii]                        )
+        ax1_24.plot(Vt0UmeanArray, tip['Mr0'][ii]                       )
+        ax1_25.plot(Vt0UmeanArray, tip['Mr1'][ii]                       )
+        ax2_21.plot(Vt0UmeanArray, tip['alpha0'][ii]                    )
+        ax2_22.plot(Vt0UmeanArray, tip['alpha1'][ii]                    )
+        ax2_23.plot(Vt0UmeanArray, tip['beta0'][ii]                     )
+        ax2_24.plot(Vt0UmeanArray, tip['beta1'][ii]                     )
+        ax2_25.plot(Vt0UmeanArray, tip['alpha1'][ii] - tip['alpha0'][ii])
+        ax2_26.plot(Vt0UmeanArray, tip['beta1'][ii] - tip['beta0'][ii]  )
 
     ax1_11.set_xlabel(r'$\frac{V_{t0 }}{U_{{mean }}}$')
     ax1_11.set_ylabel(r'$\chi \ @ \ r_{{hub }}$')
@@ -997,45 +1553,23 @@ def propertiesStudy(mFlux, betaP, Pt0, Tt0, input=[0,0], rDmin=0.5, rDmax=0.73,
     if save:
         plt.rcParams['text.usetex'] = True
 
-    # mesh generation 
-    rD, rMean = np.meshgrid(rDarray, rMeanArray)
-
-    # efficiency computation 
-    eta        = np.zeros(rD.shape)
-    omega      = np.zeros(rD.shape)
-    b0         = np.zeros(rD.shape)
-    rTip       = np.zeros(rD.shape)
-    deltaBeta  = np.zeros(rD.shape)
-    deltaAlpha = np.zeros(rD.shape)
-    M          = np.zeros(rD.shape)
-
-    for ii in range(rD.shape[0]):
-        for jj in range(rD.shape[1]):
-            # lambda computation 
-            lam       = (1 - rD[ii,jj] - Vt0Umean) * 4
-            psiTarget = lam / 2
+    # stage properties computation over the (rMean, rD) grid 
+    sweep = stageSweep({'rMean': rMeanArray, 'rD': rDarray}, {'Vt0Umean': Vt0Umean, 'mFlux': mFlux, 'Tt0': Tt0, 'Pt0': Pt0, 'betaP': betaP}, cache=True)
 
-            # computing results
-            adimVec, bladeVec, rotationVec, V0vec, V1vec, V2vec, W0vec, W1vec, _, thermo0, _, _, work = stageProperties(rD[ii,jj], psiTarget, rMean[ii,jj], mFlux, Tt0, Pt0, betaP, T1real=False)
-            
-            # efficiency computation
-            eta[ii,jj] = adimVec[-1]
-            # blade dimensions computation
-            b0[ii,jj] = bladeVec[0]
-            # computing rTip 
-            rTip[ii,jj] = rMean[ii,jj] + b0[ii,jj]/2
-            # omega computation
-            omega[ii,jj] = rotationVec[1]
-            # rotor angle computation 
-            beta0 = W0vec[2]
-            beta1 = W1vec[2]
-            deltaBeta[ii,jj] = beta0 - beta1
-            # rotor angle computation 
-            alpha1 = V1vec[2]
-            alpha2 = V2vec[2]
-            deltaAlpha[ii,jj] = alpha1 - alpha2
-            # mach computation
-            M[ii,jj] = np.sqrt(W0vec[0]**2 + W0vec[1]**2) / np.sqrt(gamma * R * thermo0[0])
+    # mesh allocation 
+    rD    = sweep['rD']
+    rMean = sweep['rMean']
+
+    # properties allocation -> not computed stages are NaN
+    eta        = sweep['eta']
+    omega      = sweep['omega']
+    rTip       = sweep['rTip']
+    # rotor angle computation 
+    deltaBeta  = sweep['beta0'] - sweep['beta1']
+    # stator angle computation 
+    deltaAlpha = sweep['alpha1'] - sweep['alpha2']
+    # mach computation
+    M          = np.sqrt(sweep['Wa0']**2 + sweep['Wt0']**2) / np.sqrt(gamma * R * sweep['T0'])
 
     if input != [0,0]:
         # lambda computation 
@@ -1043,7 +1577,7 @@ def propertiesStudy(mFlux, betaP, Pt0, Tt0, input=[0,0], rDmin=0.5, rDmax=0.73,
             psiTarget = lam / 2
 
             # computing results
-            adimVec, bladeVec, rotationVec, V0vec, V1vec, V2vec, W0vec, W1vec, _, thermo0, _, _, work = stageProperties(input[0], psiTarget, input[1], mFlux, Tt0, Pt0, betaP, T1real=False)
+            adimVec, bladeVec, rotationVec, V0vec, V1vec, V2vec, W0vec, W1vec, _, thermo0, _, _, work = stageProperties(input[0], psiTarget, input[1], mFlux, Tt0, Pt0, betaP, T1real=False, cache=True)
             
             # efficiency computation
             etaOut = adimVec[-1]
@@ -1179,196 +1713,169 @@ def propertiesStudy(mFlux, betaP, Pt0, Tt0, input=[0,0], rDmin=0.5, rDmax=0.73,
     except:
         pass
 
-def deltaAngleStudy(hubRadius, bladeHeight, rMean=[0,0], VtMean=[0,0], VaMean=[0,0], omega=0, kind=['FV', 'FV'], a=[0,0], b=[0,0], n=[0,0], nSection=50, func1=0, func2=0, funcVec=[0,0], save=False, position='angles.png'):
+def vortexAngles(hubRadius, bladeHeight, rMean=[0,0], VtMean=[0,0], VaMean=[0,0], omega=0, kind=['FV', 'FV'], b=[0,0], n=0, nSection=50, func1=0, func2=0):
     '''
-    This function computes the angle variation between the blade inlet and the blade outlet.
+    This function computes the blade inlet and outlet velocities and angles along the span for the vortex models.
+    All the parameter sets are computed at once: rMean, VtMean, VaMean and b are arrays with the last axis of dimension 2 (inlet, outlet)
+    and they are broadcast together with omega and n -> the parameter sets shape.
         inputs:
-            ...
+            hubRadius   -- hub radius 
+            bladeHeight -- blade height 
+            rMean       -- mean radius [inlet, outlet] 
+            VtMean      -- tangential velocity at the mean radius [inlet, outlet]
+            VaMean      -- axial velocity [inlet, outlet]
+            omega       -- angular velocity 
+            kind        -- vortex model [inlet, outlet]:
+                            -- FV  : free vortex                -> Vt = VtMean * rMean / r
+                            -- VVD : variable vortex design     -> Vt = a * r**n -/+ b / r  (inlet/outlet)
+                            -- MVD : mixed vortex design        -> Vt = a / r + b * r
+                            -- eqn : user defined distribution  -> Vt = func1(r) (inlet), Vt = func2(r) (outlet)
+            b           -- MVD parameter [inlet, outlet]
+            n           -- VVD exponent 
+            nSection    -- # of span sections 
+            func1       -- inlet tangential velocity function 
+            func2       -- outlet tangential velocity function 
+        output:
+            angles      -- dictionary of arrays:
+                            -- 'midpoint' : section radial position [nSection]
+                            -- 'Vt1', 'Vt2', 'Wt1', 'Wt2', 'alpha1', 'alpha2', 'beta1', 'beta2' : [parameter sets shape, nSection]
     '''
 
-    if save:
-        import matplotlib
-        matplotlib.use("pgf")
-        matplotlib.rcParams.update({
-            "pgf.texsystem": "pdflatex",
-            'font.family': 'serif',
-            'text.usetex': True,
-            'pgf.rcfonts': False,
-        })
+    # section radial positions
+    midpoint = hubRadius + bladeHeight / nSection * np.arange(nSection)
 
-    # midpoint allocation
-    midpoint = np.zeros(nSection)
-    for ii in range(nSection):
-        midpoint[ii] = hubRadius + bladeHeight / nSection * ii 
-
-    # vector allocation 
-    Vt1    = np.zeros(nSection)
-    Vt2    = np.zeros(nSection)
-    Wt1    = np.zeros(nSection)
-    Wt2    = np.zeros(nSection)
-    beta1  = np.zeros(nSection)
-    beta2  = np.zeros(nSection)
-    alpha1 = np.zeros(nSection)
-    alpha2 = np.zeros(nSection)
-
-    for jj,section in enumerate(['inlet', 'outlet']):
-        if kind[jj] == 'FV':
-            if section == 'inlet':
-                for ii in range(nSection):
-                    # tangential speed computation with respect to the FREE VORTEX model 
-                    r = midpoint[ii]
-                    Vt1[ii] = VtMean[0] * rMean[0] / r
-                    # rotation speed 
-                    U = midpoint[ii] * omega 
-                    # relative tangential speed computation 
-                    Wt1[ii] = Vt1[ii] - U
-                    # angle computation 
-                    alpha1[ii] = np.rad2deg(np.arctan(Vt1[ii]/VaMean[0]))
-                    beta1[ii] = np.rad2deg(np.arctan(Wt1[ii]/VaMean[0]))
-
-            elif section == 'outlet':
-                for ii in range(nSection):
-                    # tangential speed computation with respect to the FREE VORTEX model 
-                    r = midpoint[ii]
-                    Vt2[ii] = VtMean[1] * rMean[1] / r
-                    # rotation speed 
-                    U = midpoint[ii] * omega 
-                    # relative tangential speed computation 
-                    Wt2[ii] = Vt2[ii] - U
-                    # angle computation 
-                    alpha2[ii] = np.rad2deg(np.arctan(Vt2[ii]/VaMean[1]))
-                    beta2[ii] = np.rad2deg(np.arctan(Wt2[ii]/VaMean[1]))
-
-        elif kind[jj] == 'VVD':
-            # variables computation with respect to n 
-            a = (VtMean[1] * rMean[1] + VtMean[0] * rMean[0]) / (rMean[0]**(n+1) + rMean[1]**(n+1))
-            b = a * rMean[0]**(n+1) - VtMean[0] * rMean[0]
-
-            if section == 'inlet':
-                for ii in range(nSection):
-                    # computing variable vortex design inlet velocity
-                    r = midpoint[ii] 
-                    Vt1[ii] = a * r**n - b / r    
-                    # rotation speed 
-                    U = omega * r 
-                    # relative tangential speed computation 
-                    Wt1[ii] = Vt1[ii] - U
-                    # angle computation 
-                    alpha1[ii] = np.rad2deg(np.arctan(Vt1[ii]/VaMean[0]))
-                    beta1[ii] = np.rad2deg(np.arctan(Wt1[ii]/VaMean[0]))
+    # parameter sets broadcasting -> the section axis is the last one
+    rMean, VtMean, VaMean, b = [np.asarray(x, dtype=float) for x in [rMean, VtMean, VaMean, b]]
+    rMean0, rMean1, VtMean0, VtMean1, VaMean0, VaMean1, b0, b1, omega, n = [x[..., np.newaxis] for x in np.broadcast_arrays(rMean[..., 0], rMean[..., 1], VtMean[..., 0], VtMean[..., 1], VaMean[..., 0], VaMean[..., 1], b[..., 0], b[..., 1], np.asarray(omega, dtype=float), np.asarray(n, dtype=float))]
+    r = midpoint
     
-            elif section == 'outlet':
-                for ii in range(nSection):
-                    # computing variable vortex design inlet velocity
-                    r = midpoint[ii] 
-                    Vt2[ii] = a * r**n + b / r    
-                    # rotation speed 
-                    U = omega * r 
-                    # relative tangential speed computation 
-                    Wt2[ii] = Vt2[ii] - U
-                    # angle computation 
-                    alpha2[ii] = np.rad2deg(np.arctan(Vt2[ii]/VaMean[1]))
-                    beta2[ii] = np.rad2deg(np.arctan(Wt2[ii]/VaMean[1]))
-
-        elif kind[jj] == 'MVD':
-            if section == 'inlet':
-                # variables computation 
-                a = (VtMean[0] - b[0] * rMean[0]) * rMean[0]
-                
-                for ii in range(nSection):
-                    # computing mixed vortex design inlet velocity
-                    r = midpoint[ii]
-                    Vt1[ii] = a / r + b[0] * r
-                    # rotation speed 
-                    U = omega * r
-                    # relative tangential speed computation 
-                    Wt1[ii] = Vt1[ii] - U
-                    # angle computation 
-                    alpha1[ii] = np.rad2deg(np.arctan(Vt1[ii]/VaMean[0]))
-                    beta1[ii] = np.rad2deg(np.arctan(Wt1[ii]/VaMean[0]))
-
-            elif section == 'outlet':
+    # vortex models parameters for [inlet, outlet]
+    rMeanVec  = [rMean0, rMean1]
+    VtMeanVec = [VtMean0, VtMean1]
+    VaMeanVec = [VaMean0, VaMean1]
+    bVec      = [b0, b1]
+    funcVec   = [func1, func2]
+    sign      = [-1, 1]
+
+    # results allocation 
+    angles = {'midpoint': midpoint}
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        for jj in range(2):
+            if kind[jj] == 'FV':
+                # tangential speed computation with respect to the FREE VORTEX model 
+                Vt = VtMeanVec[jj] * rMeanVec[jj] / r
+            elif kind[jj] == 'VVD':
+                # variables computation with respect to n -> the same vortex is used for inlet and outlet
+                aVVD = (VtMean1 * rMean1 + VtMean0 * rMean0) / (rMean0**(n+1) + rMean1**(n+1))
+                bVVD = aVVD * rMean0**(n+1) - VtMean0 * rMean0
+                # computing variable vortex design velocity 
+                Vt = aVVD * r**n + sign[jj] * bVVD / r
+            elif kind[jj] == 'MVD':
                 # variables computation 
-                a = (VtMean[1] - b[1] * rMean[1]) * rMean[1]
-
-                for ii in range(nSection):
-                    # computing mixed vortex design outlet velocity 
-                    r = midpoint[ii]
-                    Vt2[ii] = a / r + b[1] * r 
-                    # rotation speed 
-                    U = omega * r 
-                    # relative tangential speed computation 
-                    Wt2[ii] = Vt2[ii] - U
-                    # angle computation 
-                    alpha2[ii] = np.rad2deg(np.arctan(Vt2[ii]/VaMean[1]))
-                    beta2[ii] = np.rad2deg(np.arctan(Wt2[ii]/VaMean[1]))
-        elif kind[jj] == 'eqn':
-            if section == 'inlet':
-                for ii in range(nSection):
-                    # getting position
-                    r = midpoint[ii]
-                    # computing tangential velocity
-                    if jj == 0:
-                        Vt1[ii] = func1(r)
-                    else:
-                        Vt1[ii] = func2(r)
-                    # computing rotation speed
-                    U = omega * r
-                    # relative tangential speed computation 
-                    Wt1[ii] = Vt1[ii] - U
-                    # angle computation 
-                    alpha1[ii] = np.rad2deg(np.arctan(Vt1[ii]/VaMean[0]))
-                    beta1[ii] = np.rad2deg(np.arctan(Wt1[ii]/VaMean[0]))
-            elif section == 'outlet':
-                for ii in range(nSection):
-                    # getting position
-                    r = midpoint[ii]
-                    # computing tangential velocity
-                    if jj == 0:
-                        Vt2[ii] = func1(r)
-                    else:
-                        Vt2[ii] = func2(r)
-                    # computing rotation speed
-                    U = omega * r
-                    # relative tangential speed computation 
-                    Wt2[ii] = Vt2[ii] - U
-                    # angle computation 
-                    alpha2[ii] = np.rad2deg(np.arctan(Vt2[ii]/VaMean[0]))
-                    beta2[ii] = np.rad2deg(np.arctan(Wt2[ii]/VaMean[0]))
-        else:
-            raise ValueError("Invalid vortex model")
-
-    # plotting angles and velocities
-    fig, ax = plt.subplots(ncols=2, nrows=1, figsize=(16,9))
-
-    # angle plotting 
-    ax[0].plot(alpha1, midpoint, linestyle='--', marker='p', markersize=6, color='royalblue', markeredgewidth=1.5, markeredgecolor='black', label=r'$\alpha_1$')
-    ax[0].plot(alpha2, midpoint, linestyle='--', marker='p', markersize=6, color='firebrick', markeredgewidth=1.5, markeredgecolor='black', label=r'$\alpha_2$')
-    ax[0].plot(alpha2 - alpha1, midpoint, linestyle='--', marker='p', markersize=6, color='forestgreen', markeredgewidth=1.5, markeredgecolor='black', label=r'$\Delta \alpha$')
-    if omega != 0:
-        ax[0].plot(beta1, midpoint, linestyle='-', marker='D', markersize=6, color='orange', markeredgewidth=1.5, markeredgecolor='black', label=r'$\beta_1$')
-        ax[0].plot(beta2, midpoint, linestyle='-', marker='D', markersize=6, color='lightseagreen', markeredgewidth=1.5, markeredgecolor='black', label=r'$\beta_2$')
-        ax[0].plot(beta2 - beta1, midpoint, linestyle='-', marker='D', markersize=6, color='gold', markeredgewidth=1.5, markeredgecolor='black', label=r'$\Delta \beta$')
-    ax[0].grid(linestyle='--')
-    ax[0].set_xlabel(r'$angles \ [^{{\circ}}]$')
-    ax[0].set_title('Angle')
-    ax[0].spines["left"].set_position(("axes", 1))
-    ax[0].yaxis.set_ticks_position('right')
-    ax[0].spines["left"].set_position(("axes", 0))
-    ax[0].legend(loc='upper right', bbox_to_anchor=[0,1])
-    ax[0].set_xticks(np.arange(-80,90,10))
-
-    # velocity plotting
-    ax[1].plot(Vt1, midpoint, linestyle='--', marker='o', markersize=6, color='royalblue', markeredgewidth=1.5, markeredgecolor='black', label=r'$V_{{t1 }}$')
-    ax[1].plot(Vt2, midpoint, linestyle='--', marker='o', markersize=6, color='firebrick', markeredgewidth=1.5, markeredgecolor='black', label=r'$V_{{t2 }}$')
-    ax[1].plot(Vt2 - Vt1, midpoint, linestyle='-', marker='o', markersize=6, color='forestgreen', markeredgewidth=1.5, markeredgecolor='black', label=r'$\Delta V_{{t }}$')
-    ax[1].grid(linestyle='--')
-    ax[1].set_xlabel(r'$velocity \ [\frac{{m }}{{s }}]$')
-    ax[1].set_ylabel(r'$r \ [m]$')
-    ax[1].set_title('Velocity')
-    ax[1].legend(loc='upper left', bbox_to_anchor=[1,1])
+                aMVD = (VtMeanVec[jj] - bVec[jj] * rMeanVec[jj]) * rMeanVec[jj]
+                # computing mixed vortex design velocity
+                Vt = aMVD / r + bVec[jj] * r
+            elif kind[jj] == 'eqn':
+                # computing tangential velocity with the user defined function -> called once on the radius array
+                try:
+                    Vt = np.asarray(funcVec[jj](r), dtype=float)
+                except (TypeError, ValueError):
+                    Vt = None
+                # scalar only functions (math library, conditions on r, constant values) -> evaluation for each radius
+                if Vt is None or Vt.shape != r.shape:
+                    Vt = np.array([funcVec[jj](rr) for rr in r], dtype=float)
+                Vt = Vt + np.zeros(rMeanVec[jj].shape)
+            else:
+                raise ValueError("Invalid vortex model")
+
+            # broadcasting to the parameter sets shape 
+            Vt = Vt + np.zeros(omega.shape)
+            # relative tangential speed computation -> rotation speed U = omega * r 
+            Wt = Vt - omega * r
+            # angle computation 
+            alpha = np.rad2deg(np.arctan(Vt/VaMeanVec[jj]))
+            beta = np.rad2deg(np.arctan(Wt/VaMeanVec[jj]))
+
+            # results allocation 
+            angles['Vt{0:d}'.format(jj+1)]    = Vt
+            angles['Wt{0:d}'.format(jj+1)]    = Wt
+            angles['alpha{0:d}'.format(jj+1)] = alpha
+            angles['beta{0:d}'.format(jj+1)]  = beta
+
+    return angles
+
+def deltaAngleStudy(hubRadius, bladeHeight, rMean=[0,0], VtMean=[0,0], VaMean=[0,0], omega=0, kind=['FV', 'FV'], a=[0,0], b=[0,0], n=[0,0], nSection=50, func1=0, func2=0, funcVec=[0,0], save=False, position='angles.png'):
+    '''
+    This function computes the angle variation between the blade inlet and the blade outlet.
+    The computation is made by vortexAngles; this function plots the results.
+        inputs:
+            hubRadius, bladeHeight, rMean, VtMean, VaMean, omega, kind, b, n, nSection, func1, func2 -- see vortexAngles
+            save        -- boolean value for the saving of the plot
+            position    -- saving path
+        output:
+            angles      -- dictionary of arrays computed by vortexAngles
+    '''
+
+    # importing libraries 
+    import contextlib
+
+    # VVD exponent -> the same exponent is used for inlet and outlet 
+    if np.ndim(n) > 0:
+        n = n[0]
 
+    # velocities and angles computation 
+    angles = vortexAngles(hubRadius, bladeHeight, rMean=rMean, VtMean=VtMean, VaMean=VaMean, omega=omega, kind=kind, b=b, n=n, nSection=nSection, func1=func1, func2=func2)
+    midpoint = angles['midpoint']
+    Vt1, Vt2, alpha1, alpha2, beta1, beta2 = [angles[name] for name in ['Vt1', 'Vt2', 'alpha1', 'alpha2', 'beta1', 'beta2']]
+
+    # latex settings are applied only to this figure
     if save:
-        fig.savefig(position, bbox_inches='tight')
+        style = plt.rc_context({"pgf.texsystem": "pdflatex",
+                                'font.family': 'serif',
+                                'text.usetex': True,
+                                'pgf.rcfonts': False})
     else:
-        plt.show()
+        style = contextlib.nullcontext()
+
+    with style:
+        # plotting angles and velocities
+        fig, ax = plt.subplots(ncols=2, nrows=1, figsize=(16,9))
+
+        # angle plotting 
+        ax[0].plot(alpha1, midpoint, linestyle='--', marker='p', markersize=6, color='royalblue', markeredgewidth=1.5, markeredgecolor='black', label=r'$\alpha_1$')
+        ax[0].plot(alpha2, midpoint, linestyle='--', marker='p', markersize=6, color='firebrick', markeredgewidth=1.5, markeredgecolor='black', label=r'$\alpha_2$')
+        ax[0].plot(alpha2 - alpha1, midpoint, linestyle='--', marker='p', markersize=6, color='forestgreen', markeredgewidth=1.5, markeredgecolor='black', label=r'$\Delta \alpha$')
+        if omega != 0:
+            ax[0].plot(beta1, midpoint, linestyle='-', marker='D', markersize=6, color='orange', markeredgewidth=1.5, markeredgecolor='black', label=r'$\beta_1$')
+            ax[0].plot(beta2, midpoint, linestyle='-', marker='D', markersize=6, color='lightseagreen', markeredgewidth=1.5, markeredgecolor='black', label=r'$\beta_2$')
+            ax[0].plot(beta2 - beta1, midpoint, linestyle='-', marker='D', markersize=6, color='gold', markeredgewidth=1.5, markeredgecolor='black', label=r'$\Delta \beta$')
+        ax[0].grid(linestyle='--')
+        ax[0].set_xlabel(r'$angles \ [^{{\circ}}]$')
+        ax[0].set_title('Angle')
+        ax[0].spines["left"].set_position(("axes", 1))
+        ax[0].yaxis.set_ticks_position('right')
+        ax[0].spines["left"].set_position(("axes", 0))
+        ax[0].legend(loc='upper right', bbox_to_anchor=[0,1])
+        ax[0].set_xticks(np.arange(-80,90,10))
+
+        # velocity plotting
+        ax[1].plot(Vt1, midpoint, linestyle='--', marker='o', markersize=6, color='royalblue', markeredgewidth=1.5, markeredgecolor='black', label=r'$V_{{t1 }}$')
+        ax[1].plot(Vt2, midpoint, linestyle='--', marker='o', markersize=6, color='firebrick', markeredgewidth=1.5, markeredgecolor='black', label=r'$V_{{t2 }}$')
+        ax[1].plot(Vt2 - Vt1, midpoint, linestyle='-', marker='o', markersize=6, color='forestgreen', markeredgewidth=1.5, markeredgecolor='black', label=r'$\Delta V_{{t }}$')
+        ax[1].grid(linestyle='--')
+        ax[1].set_xlabel(r'$velocity \ [\frac{{m }}{{s }}]$')
+        ax[1].set_ylabel(r'$r \ [m]$')
+        ax[1].set_title('Velocity')
+        ax[1].legend(loc='upper left', bbox_to_anchor=[1,1])
+
+        if save:
+            # pgf backend only for .pgf/.pdf files 
+            if position.endswith('.pgf') or position.endswith('.pdf'):
+                fig.savefig(position, bbox_inches='tight', backend='pgf')
+            else:
+                fig.savefig(position, bbox_inches='tight')
+        else:
+            plt.show()
+
+    return angles
@@ -0,0 +1,170 @@
+# TURBOMACHINERY -- LIBRARY FOR THE VELOCITY TRIANGLES AND AIRFOIL ROTATION KERNEL
+# AUTHOR: antonio pucciarelli
+#
+# PROGRAM DESCRIPTION
+#   TURBOMACHINERY KINEMATICS: array kernel used by turboVec and turboDesign
+#       -- velocity triangles: absolute and relative velocities for arrays of stations/stages/sections
+#       -- airfoil rotation: the coordinates of many airfoils are rotated at once (no per-point loop)
+#       -- airfoil loading: each airfoil file is read once and stored in foilCache
+#       -- the arrays can have any shape: the stations/stages/sections axes are broadcast
+#
+
+# importing libraries
+import os
+import numpy as np
+
+# loaded airfoils -> {absolute file path: [x, y] coordinates}
+foilCache = {}
+
+def loadFoil(foilName):
+    '''
+    This function loads an airfoil file (made with xFoil or programs like this), the files are read only once.
+        inputs:
+            foilName    -- airfoil file name
+                        -- if it is already an [x, y] numpy array it is only copied
+        output:
+            foil        -- airfoil coordinates -> [nPoints, 2] numpy array (copy of the stored data)
+    '''
+
+    # airfoil data already loaded by the user
+    if isinstance(foilName, np.ndarray):
+        return np.array(foilName, dtype=float)
+
+    # loading airfoil only once
+    key = os.path.abspath(foilName)
+    if key not in foilCache.keys():
+        foilCache[key] = np.loadtxt(foilName, skiprows=1)
+
+    return foilCache[key].copy()
+
+def rotationMatrix(gamma):
+    '''
+    This function computes the rotation matrices of the airfoils.
+        inputs:
+            gamma       -- rotation angle [rad] -> float or array of any shape
+        output:
+            rotMatrix   -- rotation matrices -> [..., 2, 2] numpy array
+    '''
+
+    gamma = np.asarray(gamma, dtype=float)
+
+    # rotation matrix components
+    cosGamma = np.cos(gamma)
+    sinGamma = np.sin(gamma)
+
+    return np.stack([np.stack([cosGamma, -sinGamma], axis=-1), np.stack([sinGamma, cosGamma], axis=-1)], axis=-2)
+
+def rotateFoil(foil, gamma):
+    '''
+    This function rotates the airfoil coordinates: [x, y] -> rotMatrix @ [x, y] for each point.
+        inputs:
+            foil        -- airfoil coordinates -> [..., nPoints, 2] numpy array
+            gamma       -- rotation angle [rad] -> float or array broadcastable with foil.shape[:-2]
+        output:
+            foil        -- rotated airfoil coordinates -> [..., nPoints, 2] numpy array
+    '''
+
+    # all the points are rotated with a single matrix product -> foil @ rotMatrix.T
+    return np.matmul(np.asarray(foil, dtype=float), np.swapaxes(rotationMatrix(gamma), -1, -2))
+
+def placeFoil(foil, gamma=0, chord=1, origin=0):
+    '''
+    This function scales, rotates and translates the airfoil coordinates.
+        inputs:
+            foil        -- airfoil coordinates -> [..., nPoints, 2] numpy array
+            gamma       -- rotation angle [rad] -> float or array broadcastable with foil.shape[:-2]
+            chord       -- airfoil chord -> float or array broadcastable with foil.shape[:-2]
+            origin      -- airfoil leading edge axial position -> float or array broadcastable with foil.shape[:-2]
+        output:
+            foil        -- airfoil coordinates -> [..., nPoints, 2] numpy array
+    '''
+
+    # airfoil scaling
+    foil = np.asarray(foil, dtype=float) * np.asarray(chord, dtype=float)[..., np.newaxis, np.newaxis]
+
+    # airfoil rotation
+    foil = rotateFoil(foil, gamma)
+
+    # airfoil translation
+    foil[..., 0] = foil[..., 0] + np.asarray(origin, dtype=float)[..., np.newaxis]
+
+    return foil
+
+def foilSet(foilNames, gamma, chord=1, origin=0):
+    '''
+    This function generates the airfoil coordinates of many sections/stages.
+        -- each airfoil file is loaded once and all the sections with the same airfoil are placed at once
+
+        inputs:
+            foilNames   -- airfoil file names (or [x, y] arrays) -> [nSections] list
+            gamma       -- rotation angle [rad] -> float or [nSections] array
+            chord       -- airfoil chord -> float or [nSections] array
+            origin      -- airfoil leading edge axial position -> float or [nSections] array
+        output:
+            foils       -- airfoil coordinates -> [nSections] list of [nPoints, 2] numpy arrays
+    '''
+
+    nSections = len(foilNames)
+
+    # properties broadcasting on the sections
+    gamma, chord, origin = [np.broadcast_to(np.asarray(x, dtype=float), (nSections,)) for x in [gamma, chord, origin]]
+
+    # grouping the sections with the same airfoil
+    groups = {}
+    for ii, foilName in enumerate(foilNames):
+        key = id(foilName) if isinstance(foilName, np.ndarray) else foilName
+        groups.setdefault(key, (foilName, []))[1].append(ii)
+
+    # airfoils generation
+    foils = [None] * nSections
+    for foilName, index in groups.values():
+        # placing all the sections of the group at once -> [nGroup, nPoints, 2]
+        placed = placeFoil(loadFoil(foilName)[np.newaxis], gamma[index], chord[index], origin[index])
+        for jj, ii in enumerate(index):
+            foils[ii] = placed[jj]
+
+    return foils
+
+def velocityTriangle(V, alpha, U=0):
+    '''
+    This function computes the velocity triangles.
+        -- the relative tangential velocity follows the turboVec convention: Wt = Vt - U
+
+        inputs:
+            V           -- absolute velocity magnitude -> float or array of any shape
+            alpha       -- absolute flow angle wrt the axial direction [rad] -> broadcastable with V
+            U           -- blade velocity -> broadcastable with V
+                        -- U = 0 for the stators
+        output:
+            Va          -- axial velocity
+            Vt          -- absolute tangential velocity
+            Wt          -- relative tangential velocity
+            W           -- relative velocity magnitude
+            beta        -- relative flow angle wrt the axial direction [rad]
+    '''
+
+    # broadcasting inputs
+    V, alpha, U = np.broadcast_arrays(np.asarray(V, dtype=float), np.asarray(alpha, dtype=float), np.asarray(U, dtype=float))
+
+    # absolute velocity components
+    Va = V * np.cos(alpha)
+    Vt = V * np.sin(alpha)
+
+    # relative velocity
+    Wt = Vt - U
+    W = np.sqrt(Va**2 + Wt**2)
+    beta = np.arctan2(Wt, Va)
+
+    return Va[()], Vt[()], Wt[()], W[()], beta[()]
+
+def bladeVelocity(omega, D):
+    '''
+    This function computes the blade velocity for an axial non centrifugal/centripetal turbomachine.
+        inputs:
+            omega       -- rotor velocity [rad/s] -> omega = 0 for the stators
+            D           -- radial distance (diameter)
+        output:
+            U           -- blade velocity
+    '''
+
+    return (np.asarray(omega, dtype=float) * np.asarray(D, dtype=float) / 2)[()]
@@ -17,6 +17,7 @@
 import matplotlib.pyplot as plt 
 import numpy as np
 import warnings
+from turboKin.kinKernel import loadFoil, rotateFoil
 
 class stator:
     '''
@@ -44,8 +45,8 @@ class stator:
             raise ValueError('Input error: velVec dimension is wrong.')
 
     def setFoil(self, foilName, plot=False):
-        # foilName.txt file should be made with xFoil
-        self.foil = np.loadtxt(foilName,skiprows=1)
+        # foilName.txt file should be made with xFoil -> each file is loaded only once (see kinKernel.loadFoil)
+        self.foil = loadFoil(foilName)
 
         if plot:
             plt.figure()
@@ -73,12 +74,8 @@ class stator:
         if dim == 'deg':
             # angle conversion
             gamma = np.deg2rad(gamma)
-        # matrix computation
-        rotMatrix = np.matrix([[np.cos(gamma), -np.sin(gamma)],[np.sin(gamma), np.cos(gamma)]])
-
-        # coordinate rotation
-        for ii in range(self.foil.shape[0]):
-            self.foil[ii,:] = np.matmul(rotMatrix, self.foil[ii,:])
+        # coordinate rotation -> all the points are rotated at once (see kinKernel.rotateFoil)
+        self.foil = rotateFoil(self.foil, gamma)
 
 class rotor:
     '''
@@ -107,8 +104,8 @@ class rotor:
             raise ValueError('Input error: velVec dimension is wrong.')
     
     def setFoil(self, foilName, plot=False):
-        # foilName.txt file should be made with xFoil
-        self.foil = np.loadtxt(foilName,skiprows=1)
+        # foilName.txt file should be made with xFoil -> each file is loaded only once (see kinKernel.loadFoil)
+        self.foil = loadFoil(foilName)
         
         if plot:
             plt.figure()
@@ -136,12 +133,8 @@ class rotor:
         if dim == 'deg':
             # angle conversion
             gamma = np.deg2rad(gamma)
-        # matrix computation
-        rotMatrix = np.matrix([[np.cos(gamma), -np.sin(gamma)],[np.sin(gamma), np.cos(gamma)]])
-
-        # coordinate rotation
-        for ii in range(self.foil.shape[0]):
-            self.foil[ii,:] = np.matmul(rotMatrix, self.foil[ii,:])
+        # coordinate rotation -> all the points are rotated at once (see kinKernel.rotateFoil)
+        self.foil = rotateFoil(self.foil, gamma)
 
     def plot(self):
         plt.figure()
@@ -7,12 +7,14 @@
 #       -- turbomachinery stages plot 
 #       -- velocity triangles plot 
 #       -- radial flow deflection 
-#       -- 
+#       -- velocity triangles and airfoil coordinates are computed with the kinKernel arrays functions
+#          -> the plot functions take the precomputed arrays and many stages/sections are plotted at once
 #       
 
 # importing libraries
 import matplotlib.pyplot as plt 
 import numpy as np
+from turboKin.kinKernel import loadFoil, rotateFoil, placeFoil, foilSet, velocityTriangle, bladeVelocity
 
 def airfoilRotation(foil, gamma):
     '''
@@ -21,21 +23,20 @@ def airfoilRotation(foil, gamma):
         function inputs:
             foil        -- airfoil coordinates data
                         -- expressed in [x, y] numpy array format
+                        -- many airfoils can be rotated at once: [..., nPoints, 2]
             gamma       -- airfoil rotation angle
                         -- in radiant
+                        -- float or array broadcastable with foil.shape[:-2]
     '''
 
-    # profile rotation due to stagger angle
-    rotMatrix = np.matrix([[np.cos(gamma), -np.sin(gamma)],[np.sin(gamma), np.cos(gamma)]])
-
-    # coordinate rotation
-    for ii in range(foil.shape[0]):
-        foil[ii,:] = np.matmul(rotMatrix, foil[ii,:])
+    # profile rotation due to stagger angle -> all the points are rotated at once (see kinKernel.rotateFoil)
+    foil[...] = rotateFoil(foil, gamma)
 
     return foil
 
 def turboPlot(nStage=1,rotorName=['naca5016'],rotorAngle=[0],rotorChord=[1],rotorOrig=[0],rotorPitch=[0.5],
-                       statorName=['naca1212'],statorAngle=[1],statorChord=[1],statorOrig=[1.5],statorPitch=[0.5],plot=True):
+                       statorName=['naca1212'],statorAngle=[1],statorChord=[1],statorOrig=[1.5],statorPitch=[0.5],plot=True,
+                       rotorFoils=None,statorFoils=None):
     '''
     Turbomachinery stage(s) plot
 
@@ -57,6 +58,13 @@ def turboPlot(nStage=1,rotorName=['naca5016'],rotorAngle=[0],rotorChord=[1],roto
             statorOrigin    -- origin: airfoil leading edge position 
             statorPitch     -- s: airfoil pitch
                             -- if you want to print just 1 airfoil instead of 3 set it as 0
+            rotorFoils      -- precomputed rotor airfoils (see kinKernel.foilSet) -> [nStage] list of [nPoints, 2] arrays
+                            -- None: computed from rotorName, rotorAngle, rotorChord and rotorOrig
+            statorFoils     -- precomputed stator airfoils (see kinKernel.foilSet) -> [nStage] list of [nPoints, 2] arrays
+                            -- None: computed from statorName, statorAngle, statorChord and statorOrig
+        function output:
+            rotorFoils      -- rotor airfoils coordinates -> None if they are not given and plot = False
+            statorFoils     -- stator airfoils coordinates -> None if they are not given and plot = False
     '''
 
     # angle conversion in radiant 
@@ -65,30 +73,20 @@ def turboPlot(nStage=1,rotorName=['naca5016'],rotorAngle=[0],rotorChord=[1],roto
 
     # plotting turbomachinery
     if plot:
+        # airfoils generation -> each airfoil file is loaded once and all the stages are placed at once
+        if rotorFoils is None:
+            rotorFoils = foilSet(rotorName[:nStage], rotorAngle[:nStage], rotorChord[:nStage], rotorOrig[:nStage])
+        if statorFoils is None:
+            statorFoils = foilSet(statorName[:nStage], statorAngle[:nStage], statorChord[:nStage], statorOrig[:nStage])
+
         # figure generation
         plt.figure()
 
         # plotting each stage:
         for ii in range(nStage):
-            # rotor
-            # loading rotor data
-            rotorFoil = np.loadtxt(rotorName[ii],skiprows=1)
-            # rotor airfoil scaling
-            rotorFoil = rotorFoil * rotorChord[ii]
-            # rotor airfoil rotation
-            rotorFoil = airfoilRotation(rotorFoil, rotorAngle[ii])
-            # rotor airfoil translation 
-            rotorFoil[:,0] += rotorOrig[ii]
-            
-            # stator
-            # loading stator data
-            statorFoil = np.loadtxt(statorName[ii],skiprows=1)
-            # stator airfoil scaling
-            statorFoil = statorFoil * statorChord[ii]
-            # stator airfoil rotation
-            statorFoil = airfoilRotation(statorFoil, statorAngle[ii])
-            # stator airfoil translation 
-            statorFoil[:,0] += statorOrig[ii]
+            # precomputed airfoils
+            rotorFoil = rotorFoils[ii]
+            statorFoil = statorFoils[ii]
 
             # plotting rotor
             plt.plot(rotorFoil[:,0],rotorFoil[:,1],'r',label='Rotor #{0:d}\n{1:s}\n{2:2.2f}$^\circ$'.format(ii+1, rotorName[ii], np.rad2deg(rotorAngle[ii])))
@@ -122,10 +120,44 @@ def turboPlot(nStage=1,rotorName=['naca5016'],rotorAngle=[0],rotorChord=[1],roto
         print('\tLE position:  {0:>10.2f}'.format(statorOrig[ii]))
     print('+++++++++++++++++++++++++++++++++++++++')
 
-    plt.legend(loc='upper left', bbox_to_anchor=(1, 1), title='Airfoils')
-    plt.axis('equal')
-    plt.tight_layout()
-    plt.show()            
+    if plot:
+        plt.legend(loc='upper left', bbox_to_anchor=(1, 1), title='Airfoils')
+        plt.axis('equal')
+        plt.tight_layout()
+        plt.show()            
+
+    return rotorFoils, statorFoils
+
+def trianglePlot(O, Va, Vt, U, velScale=0.5, colors=['r','m','g'], labels=[None,None,None]):
+    '''
+    Velocity triangles plot for many stations/sections at once
+        -- each velocity (absolute, blade, relative) is plotted with a single quiver call for all the triangles 
+
+        function inputs:
+            O           -- application points of the triangles -> [..., 2] array
+            Va          -- axial velocity -> array broadcastable with O.shape[:-1] (see kinKernel.velocityTriangle)
+            Vt          -- absolute tangential velocity -> array broadcastable with O.shape[:-1]
+            U           -- blade velocity -> array broadcastable with O.shape[:-1]
+                        -- U = 0 for the stators
+            velScale    -- velocity vectors scaling 
+            colors      -- absolute, blade and relative velocity colors
+            labels      -- absolute, blade and relative velocity labels
+        function output:
+            handles     -- absolute, blade and relative velocity quivers
+    '''
+
+    # broadcasting inputs
+    O = np.asarray(O, dtype=float)
+    Ox, Oy, Va, Vt, U = [np.ravel(x) for x in np.broadcast_arrays(O[...,0], O[...,1], Va, Vt, U)]
+
+    # absolute velocity plot 
+    absQuiver = plt.quiver(Ox, Oy, Va * velScale, Vt * velScale, angles='xy', scale_units='xy', scale=1, color=colors[0], label=labels[0])
+    # rotor velocity
+    rotQuiver = plt.quiver(Ox + Va * velScale, Oy + (Vt - U) * velScale, np.zeros(U.shape), U * velScale, angles='xy', scale_units='xy', scale=1, color=colors[1], label=labels[1])
+    # relative velocity to the rotor
+    relQuiver = plt.quiver(Ox, Oy, Va * velScale, (Vt - U) * velScale, angles='xy', scale_units='xy', scale=1, color=colors[2], label=labels[2])
+
+    return [absQuiver, rotQuiver, relQuiver]
 
 def velocityVec(airfoilData=['naca1212'],omega=0,D=0,V1=0,V2=0,alpha1=0,alpha2=0,gamma=0,s=0,c=1,velScale=0.5,plot=True):
     '''
@@ -133,6 +165,7 @@ def velocityVec(airfoilData=['naca1212'],omega=0,D=0,V1=0,V2=0,alpha1=0,alpha2=0
 
         function inputs:
             airfoil     -- airfoil data in .dat format
+                        -- or airfoil coordinates already loaded as [x, y] numpy array
             omega       -- rotor velocity 
                         -- if it is a stator omega = 0
             D           -- radial distance  
@@ -154,42 +187,28 @@ def velocityVec(airfoilData=['naca1212'],omega=0,D=0,V1=0,V2=0,alpha1=0,alpha2=0
     alpha2 = np.deg2rad(alpha2)
     gamma = np.deg2rad(gamma)
 
-    # importing geometry
-    foil = np.loadtxt(airfoilData, skiprows=1)
-
-    # scaling the airfoil with respect to the input chord
-    foil = foil * c
-
-    # airfoil rotation with respect to gamma 
-    foil = airfoilRotation(foil, gamma)
+    # importing geometry -> the airfoil file is loaded only once (see kinKernel.loadFoil)
+    # scaling the airfoil with respect to the input chord and rotation with respect to gamma 
+    foil = placeFoil(loadFoil(airfoilData), gamma, c)
 
     # solidity computation
     if s != 0:
         solidity = c / s
     else: 
         solidity = np.NaN
-      
-    # normalized and scaled V1 component computation with respect to V1
-    V1a = V1 * np.cos(alpha1)  
-    V1t = V1 * np.sin(alpha1) 
-
-    # normalized and scaled V2 component computation with respect to V1
-    V2a = V2 * np.cos(alpha2)  
-    V2t = V2 * np.sin(alpha2) 
 
     # rotor velocity for an axial non centrifugal/centripetal turbomachine 
     if omega != 0:
         kind = 'rotor'
-        U = omega * D/2 
     else:
         kind = 'stator'
-        U = 0
-
-    # inlet relative velocity computation 
-    W1 = np.sqrt(V1a**2 + (U - V1t)**2)
+    U = bladeVelocity(omega, D)
 
-    # outlet relative velocity computation 
-    W2 = np.sqrt(V2a**2 + (U - V2t)**2)
+    # inlet and outlet velocity triangles -> computed at once
+    Va, Vt, Wt, W, beta = velocityTriangle(np.array([V1, V2]), np.array([alpha1, alpha2]), U)
+    V1a, V2a = Va
+    V1t, V2t = Vt
+    W1, W2 = W
 
     # important quantities printout
     print('+++++++++++++++++++++++++++++++++++++++')
@@ -228,29 +247,23 @@ def velocityVec(airfoilData=['naca1212'],omega=0,D=0,V1=0,V2=0,alpha1=0,alpha2=0
             plt.plot(foil[:,0], foil[:,1] - s, 'k')
 
         # inlet plot sclaled with respect to velScale
-        # absolute velocity plot 
-        abs1 = plt.quiver(O1[0], O1[1], V1a * velScale, V1t * velScale, angles='xy', scale_units='xy', scale=1, color='r', label=r'$V_1$' + ' = {0:>6.2f} '.format(V1) + r'$\frac{m}{s}$')
-        # rotor velocity
-        rot1 = plt.quiver(O1[0] + V1a * velScale, O1[1] + (V1t - U) * velScale, 0, U * velScale, angles='xy', scale_units='xy', scale=1, color='m', label=r'$U_1$' + ' = {0:>6.2f} '.format(U) + r'$\frac{m}{s}$')
-        # relative velocity to the rotor
-        rel1 = plt.quiver(O1[0], O1[1], V1a * velScale, (V1t - U) * velScale, angles='xy', scale_units='xy', scale=1, color='g', label=r'$W_1$' + ' = {0:>6.2f} '.format(W1) + r'$\frac{m}{s}$')
+        handles1 = trianglePlot(O1, V1a, V1t, U, velScale, colors=['r','m','g'], labels=[r'$V_1$' + ' = {0:>6.2f} '.format(V1) + r'$\frac{m}{s}$', 
+                                                                                         r'$U_1$' + ' = {0:>6.2f} '.format(U) + r'$\frac{m}{s}$', 
+                                                                                         r'$W_1$' + ' = {0:>6.2f} '.format(W1) + r'$\frac{m}{s}$'])
 
         # legend for the inlet velocity 
-        leg1 = plt.legend(handles=[abs1, rot1, rel1], loc='upper left', bbox_to_anchor=(1, 1), title='Inlet')
+        leg1 = plt.legend(handles=handles1, loc='upper left', bbox_to_anchor=(1, 1), title='Inlet')
 
         # outlet plot scaled with respect ot velScale
-        # absolute velocity plot 
-        abs2 = plt.quiver(O2[0], O2[1], V2a * velScale, V2t * velScale, angles='xy', scale_units='xy', scale=1, color='b', label=r'$V_2$' + ' = {0:>6.2f} '.format(V2) + r'$\frac{m}{s}$')
-        # rotor velocity 
-        rot2 = plt.quiver(O2[0] + V2a * velScale, O2[1] + (V2t - U) * velScale, 0, U * velScale, angles='xy', scale_units='xy', scale=1, color='m', label=r'$U_2$' + ' = {0:>6.2f} '.format(U) + r'$\frac{m}{s}$')
-        # relative velocity to the rotor
-        rel2 = plt.quiver(O2[0], O2[1], V2a * velScale, (V2t - U) * velScale, angles='xy', scale_units='xy', scale=1, color='c', label=r'$W_2$' + ' = {0:>6.2f} '.format(W2) + r'$\frac{m}{s}$')
+        handles2 = trianglePlot(O2, V2a, V2t, U, velScale, colors=['b','m','c'], labels=[r'$V_2$' + ' = {0:>6.2f} '.format(V2) + r'$\frac{m}{s}$', 
+                                                                                         r'$U_2$' + ' = {0:>6.2f} '.format(U) + r'$\frac{m}{s}$', 
+                                                                                         r'$W_2$' + ' = {0:>6.2f} '.format(W2) + r'$\frac{m}{s}$'])
 
         # chord plot 
         plt.plot([foil[0,0], foil[int(foil.shape[0]/2),0]], [foil[0,1], foil[int(foil.shape[0]/2),1]], '--r')
 
         # legend for the outlet velocity 
-        leg2 = plt.legend(handles=[abs2, rot2, rel2], loc='lower left', bbox_to_anchor=(1, 0), title='Outlet')
+        leg2 = plt.legend(handles=handles2, loc='lower left', bbox_to_anchor=(1, 0), title='Outlet')
 
         # other turbomachinery properites legend
         if s != 0: